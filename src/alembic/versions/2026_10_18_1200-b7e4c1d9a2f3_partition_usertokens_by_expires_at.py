@@ -0,0 +1,148 @@
+"""partition usertokens by expires_at
+
+Revision ID: b7e4c1d9a2f3
+Revises: 5a43d5e4e42e
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e4c1d9a2f3"
+down_revision: Union[str, None] = "5a43d5e4e42e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = """
+    user_uuid UUID NOT NULL REFERENCES users (uuid) ON DELETE CASCADE,
+    token_hash VARCHAR(255) NOT NULL,
+    token_type tokentype NOT NULL,
+    expires_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+    is_active BOOLEAN NOT NULL,
+    ip_address VARCHAR(45),
+    user_agent VARCHAR(500),
+    uuid UUID NOT NULL,
+    created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL,
+    updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL
+"""
+
+COLUMN_NAMES = (
+    "user_uuid, token_hash, token_type, expires_at, is_active, "
+    "ip_address, user_agent, uuid, created_at, updated_at"
+)
+
+INDEXES = (
+    ("ix_usertokens_expires_at", "expires_at"),
+    ("ix_usertokens_token_hash", "token_hash"),
+    ("ix_usertokens_token_type", "token_type"),
+    ("ix_usertokens_user_uuid", "user_uuid"),
+)
+
+# Месяцев вперед от текущего; дальше партиции создает приложение
+# при старте и фоновая очистка (token_cleanup.partition_months_ahead)
+MONTHS_AHEAD = 2
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("ALTER TABLE usertokens RENAME TO usertokens_old")
+    for index_name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+    # Первичный ключ секционированной таблицы обязан включать ключ секции
+    op.execute(
+        f"""
+        CREATE TABLE usertokens (
+            {COLUMNS},
+            PRIMARY KEY (uuid, expires_at)
+        ) PARTITION BY RANGE (expires_at)
+        """
+    )
+
+    # Месячные партиции: с месяца самого раннего живого токена
+    # до MONTHS_AHEAD месяцев вперед. Партиции по умолчанию нет: с ней
+    # PostgreSQL не разрешает DETACH PARTITION CONCURRENTLY, которым
+    # очистка удаляет истекшие месяцы
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month_start DATE := date_trunc(
+                'month',
+                LEAST(
+                    now(),
+                    COALESCE(
+                        (SELECT min(expires_at) FROM usertokens_old
+                         WHERE expires_at >= now()),
+                        now()
+                    )
+                )
+            );
+            last_month DATE := GREATEST(
+                date_trunc('month', now() + interval '{MONTHS_AHEAD} months'),
+                date_trunc(
+                    'month',
+                    COALESCE((SELECT max(expires_at) FROM usertokens_old), now())
+                )
+            );
+        BEGIN
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF usertokens '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'usertokens_p' || to_char(month_start, 'YYYYMM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END $$;
+        """
+    )
+
+    for index_name, column in INDEXES:
+        op.execute(f"CREATE INDEX {index_name} ON usertokens ({column})")
+
+    # Просроченные токены не переносим - они все равно подлежат удалению
+    op.execute(
+        f"""
+        INSERT INTO usertokens ({COLUMN_NAMES})
+        SELECT {COLUMN_NAMES} FROM usertokens_old
+        WHERE expires_at >= now()
+        """
+    )
+    op.execute("DROP TABLE usertokens_old")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE usertokens RENAME TO usertokens_partitioned")
+    for index_name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+    op.execute(
+        f"""
+        CREATE TABLE usertokens (
+            {COLUMNS},
+            PRIMARY KEY (uuid),
+            UNIQUE (uuid)
+        )
+        """
+    )
+    for index_name, column in INDEXES:
+        unique = "UNIQUE " if column == "token_hash" else ""
+        op.execute(f"CREATE {unique}INDEX {index_name} ON usertokens ({column})")
+
+    op.execute(
+        f"""
+        INSERT INTO usertokens ({COLUMN_NAMES})
+        SELECT {COLUMN_NAMES} FROM usertokens_partitioned
+        """
+    )
+    # Удаление родительской таблицы удаляет и все партиции
+    op.execute("DROP TABLE usertokens_partitioned")
@@ -0,0 +1,73 @@
+"""add team invite codes
+
+Revision ID: c3a9f0e5d1b7
+Revises: b7e4c1d9a2f3
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a9f0e5d1b7"
+down_revision: Union[str, None] = "b7e4c1d9a2f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "teaminvitecodes",
+        sa.Column("code", sa.String(length=32), nullable=False),
+        sa.Column("team_uuid", sa.Uuid(), nullable=False),
+        sa.Column("created_by", sa.Uuid(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("uuid", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["team_uuid"], ["teams.uuid"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["created_by"], ["users.uuid"], ondelete="SET NULL"
+        ),
+        sa.PrimaryKeyConstraint("uuid"),
+        sa.UniqueConstraint("uuid"),
+    )
+    op.create_index(
+        op.f("ix_teaminvitecodes_code"),
+        "teaminvitecodes",
+        ["code"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_teaminvitecodes_expires_at"),
+        "teaminvitecodes",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_teaminvitecodes_expires_at"), table_name="teaminvitecodes"
+    )
+    op.drop_index(op.f("ix_teaminvitecodes_code"), table_name="teaminvitecodes")
+    op.drop_table("teaminvitecodes")
@@ -0,0 +1,122 @@
+"""add composite and partial indexes for repository queries
+
+Revision ID: d8f2b6a4c0e9
+Revises: c3a9f0e5d1b7
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d8f2b6a4c0e9"
+down_revision: Union[str, None] = "c3a9f0e5d1b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (имя, таблица, колонки, условие частичного индекса)
+INDEXES = (
+    ("ix_tasks_team_uuid_deadline", "tasks", ["team_uuid", "deadline", "uuid"], None),
+    (
+        "ix_tasks_assignee_uuid_deadline",
+        "tasks",
+        ["assignee_uuid", "deadline", "uuid"],
+        None,
+    ),
+    ("ix_tasks_creator_uuid_deadline", "tasks", ["creator_uuid", "deadline"], None),
+    ("ix_tasks_deadline_uuid", "tasks", ["deadline", "uuid"], None),
+    (
+        "ix_tasks_open_team_uuid_deadline",
+        "tasks",
+        ["team_uuid", "deadline"],
+        "status <> 'DONE'",
+    ),
+    (
+        "ix_meetings_team_uuid_date_time",
+        "meetings",
+        ["team_uuid", "date_time", "uuid"],
+        None,
+    ),
+    (
+        "ix_meetings_creator_uuid_date_time",
+        "meetings",
+        ["creator_uuid", "date_time"],
+        None,
+    ),
+    ("ix_meetings_date_time_uuid", "meetings", ["date_time", "uuid"], None),
+    (
+        "ix_evaluations_evaluated_user_uuid_created_at",
+        "evaluations",
+        ["evaluated_user_uuid", "created_at"],
+        None,
+    ),
+    (
+        "ix_evaluations_evaluator_uuid_created_at",
+        "evaluations",
+        ["evaluator_uuid", "created_at"],
+        None,
+    ),
+    ("ix_evaluations_created_at", "evaluations", ["created_at"], None),
+    (
+        "ix_meeting_participants_user_uuid_meeting_uuid",
+        "meeting_participants",
+        ["user_uuid", "meeting_uuid"],
+        None,
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # У meeting_participants не было ключа: убираем пустые ссылки и дубли
+    op.execute(
+        "DELETE FROM meeting_participants "
+        "WHERE meeting_uuid IS NULL OR user_uuid IS NULL"
+    )
+    op.execute(
+        "DELETE FROM meeting_participants a USING meeting_participants b "
+        "WHERE a.ctid > b.ctid "
+        "AND a.meeting_uuid = b.meeting_uuid AND a.user_uuid = b.user_uuid"
+    )
+    op.create_primary_key(
+        "meeting_participants_pkey",
+        "meeting_participants",
+        ["meeting_uuid", "user_uuid"],
+    )
+
+    # CONCURRENTLY не блокирует запись в таблицы на время построения,
+    # но не может выполняться внутри транзакции
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+    op.drop_constraint(
+        "meeting_participants_pkey",
+        "meeting_participants",
+        type_="primary",
+    )
@@ -0,0 +1,107 @@
+"""add per-user and per-team evaluation rollups
+
+Revision ID: e1a7c3f5b9d2
+Revises: d8f2b6a4c0e9
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1a7c3f5b9d2"
+down_revision: Union[str, None] = "d8f2b6a4c0e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (таблица, ключевая колонка, таблица ключа)
+ROLLUP_TABLES = (
+    ("userevaluationrollups", "user_uuid", "users"),
+    ("teamevaluationrollups", "team_uuid", "teams"),
+)
+
+# Агрегаты для заполнения сводок по существующим оценкам
+ROLLUP_AGGREGATES = """
+    count(e.uuid),
+    coalesce(sum(CASE e.score
+        WHEN 'UNACCEPTABLE' THEN 1
+        WHEN 'BAD' THEN 2
+        WHEN 'SATISFACTORY' THEN 3
+        WHEN 'GOOD' THEN 4
+        WHEN 'GREAT' THEN 5
+    END), 0),
+    count(e.uuid) FILTER (WHERE e.score = 'UNACCEPTABLE'),
+    count(e.uuid) FILTER (WHERE e.score = 'BAD'),
+    count(e.uuid) FILTER (WHERE e.score = 'SATISFACTORY'),
+    count(e.uuid) FILTER (WHERE e.score = 'GOOD'),
+    count(e.uuid) FILTER (WHERE e.score = 'GREAT'),
+    max(e.created_at)
+"""
+
+ROLLUP_COLUMNS = (
+    "evaluations_count, score_sum, unacceptable_count, bad_count, "
+    "satisfactory_count, good_count, great_count, last_evaluated_at"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, key, key_table in ROLLUP_TABLES:
+        op.create_table(
+            table,
+            sa.Column(key, sa.Uuid(), nullable=False),
+            sa.Column("evaluations_count", sa.Integer(), nullable=False),
+            sa.Column("score_sum", sa.Integer(), nullable=False),
+            sa.Column("unacceptable_count", sa.Integer(), nullable=False),
+            sa.Column("bad_count", sa.Integer(), nullable=False),
+            sa.Column("satisfactory_count", sa.Integer(), nullable=False),
+            sa.Column("good_count", sa.Integer(), nullable=False),
+            sa.Column("great_count", sa.Integer(), nullable=False),
+            sa.Column("last_evaluated_at", sa.DateTime(), nullable=True),
+            sa.Column("uuid", sa.Uuid(), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=False,
+            ),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=False,
+            ),
+            sa.ForeignKeyConstraint(
+                [key], [f"{key_table}.uuid"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("uuid"),
+            sa.UniqueConstraint("uuid"),
+            sa.UniqueConstraint(key),
+        )
+
+    # Заполнить сводки по уже выставленным оценкам
+    op.execute(
+        f"INSERT INTO userevaluationrollups (uuid, user_uuid, {ROLLUP_COLUMNS}) "
+        f"SELECT gen_random_uuid(), e.evaluated_user_uuid, {ROLLUP_AGGREGATES} "
+        "FROM evaluations e "
+        "WHERE e.evaluated_user_uuid IS NOT NULL "
+        "GROUP BY e.evaluated_user_uuid"
+    )
+    op.execute(
+        f"INSERT INTO teamevaluationrollups (uuid, team_uuid, {ROLLUP_COLUMNS}) "
+        f"SELECT gen_random_uuid(), t.team_uuid, {ROLLUP_AGGREGATES} "
+        "FROM evaluations e JOIN tasks t ON e.task_uuid = t.uuid "
+        "WHERE t.team_uuid IS NOT NULL "
+        "GROUP BY t.team_uuid"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _, _ in reversed(ROLLUP_TABLES):
+        op.drop_table(table)
@@ -4,9 +4,11 @@ __all__ = (
     "GetCalendarDayInteractor",
     "GetUpcomingEventsInteractor",
     "GetCalendarStatsInteractor",
+    "ExportCalendarInteractor",
 )
 
 from .calendar_interactors import (
+    ExportCalendarInteractor,
     GetCalendarDayInteractor,
     GetCalendarMonthInteractor,
     GetCalendarStatsInteractor,
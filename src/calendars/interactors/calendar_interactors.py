@@ -6,9 +6,20 @@ from calendars.schemas import (
     CalendarUpcoming,
     CalendarWeek,
 )
-from calendars.services import CalendarService
+from calendars.interfaces import (
+    CalendarCache,
+    CalendarRepositoryFactory,
+)
+from calendars.services import (
+    CalendarService,
+    ICalendarExportService,
+)
 from datetime import datetime
-from typing import Optional
+from typing import (
+    AsyncIterator,
+    Optional,
+    Tuple,
+)
 from uuid import UUID
 
 from meetings.interfaces import MeetingRepository
@@ -24,11 +35,13 @@ class GetCalendarMonthInteractor:
         task_repo: TaskRepository,
         meeting_repo: MeetingRepository,
         user_repo: UserRepository,
+        calendar_cache: Optional[CalendarCache] = None,
     ) -> None:
         self._calendar_service = CalendarService(
             task_repo=task_repo,
             meeting_repo=meeting_repo,
             user_repo=user_repo,
+            calendar_cache=calendar_cache,
         )
 
     async def __call__(
@@ -55,11 +68,13 @@ class GetCalendarWeekInteractor:
         task_repo: TaskRepository,
         meeting_repo: MeetingRepository,
         user_repo: UserRepository,
+        calendar_cache: Optional[CalendarCache] = None,
     ) -> None:
         self._calendar_service = CalendarService(
             task_repo=task_repo,
             meeting_repo=meeting_repo,
             user_repo=user_repo,
+            calendar_cache=calendar_cache,
         )
 
     async def __call__(
@@ -161,3 +176,68 @@ class GetCalendarStatsInteractor:
             end_date=end_date,
             calendar_filter=calendar_filter,
         )
+
+
+class ExportCalendarInteractor:
+    """Интерактор для выгрузки календаря в формате iCalendar (.ics)"""
+
+    def __init__(
+        self,
+        task_repo: TaskRepository,
+        meeting_repo: MeetingRepository,
+        user_repo: UserRepository,
+        repository_factory: CalendarRepositoryFactory,
+    ) -> None:
+        self._calendar_service = CalendarService(
+            task_repo=task_repo,
+            meeting_repo=meeting_repo,
+            user_repo=user_repo,
+        )
+        self._export_service = ICalendarExportService(
+            task_repo=task_repo,
+            meeting_repo=meeting_repo,
+        )
+        self._repository_factory = repository_factory
+
+    async def prepare(
+        self,
+        actor_uuid: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        calendar_filter: Optional[CalendarFilter] = None,
+    ) -> Tuple[CalendarFilter, str]:
+        """Проверить права и вычислить ETag выгрузки"""
+        final_filter = await self._calendar_service.resolve_filter(
+            actor_uuid=actor_uuid,
+            calendar_filter=calendar_filter,
+        )
+        etag = await self._export_service.get_etag(
+            start_date=start_date,
+            end_date=end_date,
+            calendar_filter=final_filter,
+        )
+        return final_filter, etag
+
+    async def stream(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        calendar_filter: CalendarFilter,
+    ) -> AsyncIterator[str]:
+        """
+        Потоково сформировать .ics.
+
+        Ответ отдается после закрытия зависимостей запроса, поэтому
+        генератор открывает собственную сессию на время выгрузки.
+        """
+        async with self._repository_factory.open() as repos:
+            export_service = ICalendarExportService(
+                task_repo=repos.task_repo,
+                meeting_repo=repos.meeting_repo,
+            )
+            async for chunk in export_service.stream(
+                start_date=start_date,
+                end_date=end_date,
+                calendar_filter=calendar_filter,
+            ):
+                yield chunk
@@ -0,0 +1,11 @@
+__all__ = (
+    "CalendarCache",
+    "CalendarRepositories",
+    "CalendarRepositoryFactory",
+)
+
+from .interfaces import (
+    CalendarCache,
+    CalendarRepositories,
+    CalendarRepositoryFactory,
+)
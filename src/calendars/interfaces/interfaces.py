@@ -0,0 +1,59 @@
+from typing import (
+    Any,
+    AsyncContextManager,
+    Dict,
+    Hashable,
+    Optional,
+    Protocol,
+)
+from uuid import UUID
+
+from meetings.interfaces import MeetingRepository
+from tasks.interfaces import TaskRepository
+
+
+class CalendarCache(Protocol):
+    """Интерфейс для кэша собранных представлений календаря"""
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Получить значение по ключу. Возвращает None если нет или истекло"""
+        ...
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        team_uuid: Optional[UUID],
+    ) -> None:
+        """
+        Сохранить значение.
+
+        Args:
+            key: ключ представления (вид, период, фильтр)
+            value: собранное представление календаря
+            team_uuid: команда, к которой относится представление (None - все команды)
+        """
+        ...
+
+    def invalidate_team(self, team_uuid: Optional[UUID]) -> int:
+        """Сбросить представления команды и общие представления. Возвращает количество"""
+        ...
+
+    def get_stats(self) -> Dict[str, int]:
+        """Получить счетчики кэша (hits, misses, evictions, size)"""
+        ...
+
+
+class CalendarRepositories(Protocol):
+    """Репозитории календаря, работающие в одной сессии"""
+
+    task_repo: TaskRepository
+    meeting_repo: MeetingRepository
+
+
+class CalendarRepositoryFactory(Protocol):
+    """Интерфейс для получения репозиториев календаря с собственной сессией"""
+
+    def open(self) -> AsyncContextManager[CalendarRepositories]:
+        """Открыть сессию; она закрывается при выходе из контекста"""
+        ...
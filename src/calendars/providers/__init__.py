@@ -0,0 +1,11 @@
+__all__ = (
+    "InMemoryCalendarCacheProvider",
+    "calendar_cache",
+    "invalidate_calendar",
+)
+
+from .calendar_cache_provider import (
+    InMemoryCalendarCacheProvider,
+    calendar_cache,
+    invalidate_calendar,
+)
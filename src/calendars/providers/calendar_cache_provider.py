@@ -0,0 +1,151 @@
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Optional,
+    Set,
+    Tuple,
+)
+from uuid import UUID
+
+from calendars.interfaces import CalendarCache
+from core.config import settings
+
+
+class InMemoryCalendarCacheProvider(CalendarCache):
+    """
+    Имплементация CalendarCache в памяти процесса (TTL + LRU).
+
+    Кэш локален для воркера: сброс при записи виден только в нем,
+    в остальных воркерах устаревание ограничено TTL.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 60,
+        max_entries: int = 1024,
+    ) -> None:
+        """
+        Args:
+            ttl_seconds: Время жизни записи в секундах
+            max_entries: Максимум записей, после - вытеснение самых старых (LRU)
+        """
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+
+        # key -> (expires_at, team_uuid, value)
+        self._entries: OrderedDict[
+            Hashable, Tuple[float, Optional[UUID], Any]
+        ] = OrderedDict()
+        # team_uuid -> ключи представлений этой команды
+        self._team_keys: Dict[Optional[UUID], Set[Hashable]] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Получить значение по ключу"""
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, _, value = entry
+
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        team_uuid: Optional[UUID],
+    ) -> None:
+        """Сохранить значение"""
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (time.monotonic() + self._ttl, team_uuid, value)
+        self._team_keys.setdefault(team_uuid, set()).add(key)
+
+        while len(self._entries) > self._max_entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._evictions += 1
+
+    def invalidate_team(self, team_uuid: Optional[UUID]) -> int:
+        """Сбросить представления команды и общие (без фильтра по команде)"""
+        keys = set(self._team_keys.get(team_uuid, set()))
+        keys |= self._team_keys.get(None, set())
+
+        for key in keys:
+            self._remove(key)
+
+        self._invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Полностью очистить кэш"""
+        self._entries.clear()
+        self._team_keys.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Получить счетчики кэша"""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+            "size": len(self._entries),
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        """Удалить запись и ее ссылку из индекса команд"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        team_uuid = entry[1]
+        team_keys = self._team_keys.get(team_uuid)
+        if team_keys is not None:
+            team_keys.discard(key)
+            if not team_keys:
+                del self._team_keys[team_uuid]
+
+
+def invalidate_calendar(
+    calendar_cache: Optional[CalendarCache],
+    *team_uuids: Optional[UUID],
+) -> None:
+    """
+    Сбросить календари команд после записи задач или встреч.
+
+    None (задача без команды) тоже передается в invalidate_team: так
+    сбрасываются общие представления без фильтра по команде.
+
+    Сброс действует только в кэше текущего воркера: на остальных
+    календарь остается устаревшим не дольше TTL.
+    """
+    if calendar_cache is None:
+        return
+
+    for team_uuid in set(team_uuids):
+        calendar_cache.invalidate_team(team_uuid)
+
+
+# Глобальный экземпляр кэша календаря
+calendar_cache = InMemoryCalendarCacheProvider(
+    ttl_seconds=settings.calendar_cache.ttl_seconds,
+    max_entries=settings.calendar_cache.max_entries,
+)
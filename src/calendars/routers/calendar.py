@@ -1,4 +1,5 @@
 from calendars.interactors import (
+    ExportCalendarInteractor,
     GetCalendarDayInteractor,
     GetCalendarMonthInteractor,
     GetCalendarStatsInteractor,
@@ -15,25 +16,40 @@ from calendars.schemas import (
     EventPriority,
     EventType,
 )
-from datetime import datetime
-from typing import Optional
+from datetime import (
+    datetime,
+    timedelta,
+)
+from typing import (
+    Dict,
+    Optional,
+)
 from uuid import UUID
 
 from fastapi import (
     APIRouter,
+    Header,
     HTTPException,
     Query,
+    Response,
     status,
 )
+from fastapi.responses import StreamingResponse
 
 from core.dependencies import (
+    CalendarCacheDep,
+    CalendarRepositoryFactoryDep,
     CurrentUserDep,
     MeetingRepoDep,
+    ReadMeetingRepoDep,
+    ReadTaskRepoDep,
+    SessionReleasingRoute,
     TaskRepoDep,
     UserRepoDep,
 )
+from users.models import RoleEnum
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.get(
@@ -45,9 +61,12 @@ async def get_calendar_month(
     year: int,
     month: int,
     current_user: CurrentUserDep,
+    # Результат попадает в общий кэш, поэтому читаем только основную БД:
+    # отстающая реплика закэшировала бы устаревший календарь для всех
     task_repo: TaskRepoDep,
     meeting_repo: MeetingRepoDep,
     user_repo: UserRepoDep,
+    calendar_cache: CalendarCacheDep,
     team_uuid: Optional[UUID] = Query(
         None,
         description="UUID команды",
@@ -119,6 +138,7 @@ async def get_calendar_month(
         task_repo=task_repo,
         meeting_repo=meeting_repo,
         user_repo=user_repo,
+        calendar_cache=calendar_cache,
     )
 
     try:
@@ -147,9 +167,12 @@ async def get_calendar_month(
 )
 async def get_calendar_week(
     current_user: CurrentUserDep,
+    # Результат попадает в общий кэш, поэтому читаем только основную БД:
+    # отстающая реплика закэшировала бы устаревший календарь для всех
     task_repo: TaskRepoDep,
     meeting_repo: MeetingRepoDep,
     user_repo: UserRepoDep,
+    calendar_cache: CalendarCacheDep,
     date: datetime = Query(
         ...,
         description="Дата для определения недели",
@@ -184,6 +207,7 @@ async def get_calendar_week(
         task_repo=task_repo,
         meeting_repo=meeting_repo,
         user_repo=user_repo,
+        calendar_cache=calendar_cache,
     )
 
     # Парсим фильтры (как в месячном календаре)
@@ -251,8 +275,8 @@ async def get_calendar_week(
 )
 async def get_calendar_day(
     current_user: CurrentUserDep,
-    task_repo: TaskRepoDep,
-    meeting_repo: MeetingRepoDep,
+    task_repo: ReadTaskRepoDep,
+    meeting_repo: ReadMeetingRepoDep,
     user_repo: UserRepoDep,
     date: datetime = Query(..., description="Дата"),
     team_uuid: Optional[UUID] = Query(
@@ -352,8 +376,8 @@ async def get_calendar_day(
 )
 async def get_upcoming_events(
     current_user: CurrentUserDep,
-    task_repo: TaskRepoDep,
-    meeting_repo: MeetingRepoDep,
+    task_repo: ReadTaskRepoDep,
+    meeting_repo: ReadMeetingRepoDep,
     user_repo: UserRepoDep,
     team_uuid: Optional[UUID] = Query(
         None,
@@ -452,8 +476,8 @@ async def get_upcoming_events(
 )
 async def get_calendar_stats(
     current_user: CurrentUserDep,
-    task_repo: TaskRepoDep,
-    meeting_repo: MeetingRepoDep,
+    task_repo: ReadTaskRepoDep,
+    meeting_repo: ReadMeetingRepoDep,
     user_repo: UserRepoDep,
     start_date: datetime = Query(
         ...,
@@ -553,3 +577,138 @@ async def get_calendar_stats(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e),
         )
+
+
+@router.get(
+    "/export.ics",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def export_calendar_ics(
+    current_user: CurrentUserDep,
+    task_repo: ReadTaskRepoDep,
+    meeting_repo: ReadMeetingRepoDep,
+    user_repo: UserRepoDep,
+    repository_factory: CalendarRepositoryFactoryDep,
+    start_date: Optional[datetime] = Query(
+        None,
+        description="Начальная дата (по умолчанию 30 дней назад)",
+    ),
+    end_date: Optional[datetime] = Query(
+        None,
+        description="Конечная дата (по умолчанию через год)",
+    ),
+    team_uuid: Optional[UUID] = Query(
+        None,
+        description="UUID команды",
+    ),
+    user_uuid: Optional[UUID] = Query(
+        None,
+        description="UUID пользователя",
+    ),
+    event_types: Optional[str] = Query(
+        None,
+        description="Типы событий через запятую",
+    ),
+    include_completed: bool = Query(
+        True,
+        description="Включать завершенные задачи",
+    ),
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
+    """Выгрузить календарь в формате iCalendar (.ics) для внешних клиентов"""
+
+    # Окно по умолчанию выровнено по дням, чтобы ETag не менялся в течение дня
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    final_start = start_date or today - timedelta(days=30)
+    final_end = end_date or today + timedelta(days=365)
+
+    if final_end < final_start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Конечная дата раньше начальной",
+        )
+
+    parsed_event_types = None
+    if event_types:
+        try:
+            parsed_event_types = [EventType(t.strip()) for t in event_types.split(",")]
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Неверный тип события",
+            )
+
+    calendar_filter = CalendarFilter(
+        team_uuid=team_uuid,
+        user_uuid=user_uuid,
+        event_types=parsed_event_types,
+        include_completed=include_completed,
+    )
+
+    interactor = ExportCalendarInteractor(
+        task_repo=task_repo,
+        meeting_repo=meeting_repo,
+        user_repo=user_repo,
+        repository_factory=repository_factory,
+    )
+
+    try:
+        final_filter, etag = await interactor.prepare(
+            actor_uuid=current_user.uuid,
+            start_date=final_start,
+            end_date=final_end,
+            calendar_filter=calendar_filter,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except PermissionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        )
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, must-revalidate",
+    }
+
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=headers,
+        )
+
+    headers["Content-Disposition"] = 'attachment; filename="calendar.ics"'
+
+    return StreamingResponse(
+        interactor.stream(
+            start_date=final_start,
+            end_date=final_end,
+            calendar_filter=final_filter,
+        ),
+        media_type="text/calendar; charset=utf-8",
+        headers=headers,
+    )
+
+
+@router.get(
+    "/cache/stats",
+    status_code=status.HTTP_200_OK,
+)
+async def get_calendar_cache_stats(
+    current_user: CurrentUserDep,
+    calendar_cache: CalendarCacheDep,
+) -> Dict[str, int]:
+    """Получить счетчики кэша календаря (только для администраторов)"""
+
+    if current_user.role != RoleEnum.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Нет прав для просмотра статистики кэша",
+        )
+
+    return calendar_cache.get_stats()
@@ -1,5 +1,7 @@
 __all__ = (
     "CalendarService",
+    "ICalendarExportService",
 )
 
-from .calendar_service import CalendarService
\ No newline at end of file
+from .calendar_service import CalendarService
+from .ical_export_service import ICalendarExportService
@@ -10,19 +10,27 @@ from calendars.schemas.calendar import (
     EventPriority,
     EventType,
 )
+from collections import defaultdict
 from datetime import (
+    date,
     datetime,
     timedelta,
 )
 from typing import (
+    Dict,
+    Hashable,
     List,
     Optional,
 )
 from uuid import UUID
 
+from calendars.interfaces import CalendarCache
 from meetings.interfaces import MeetingRepository
 from tasks.interfaces import TaskRepository
-from tasks.models import StatusEnum
+from tasks.models import (
+    StatusEnum,
+    Task,
+)
 from users.interfaces import UserRepository
 from users.models import RoleEnum
 
@@ -30,15 +38,36 @@ from users.models import RoleEnum
 class CalendarService:
     """Сервис для работы с календарем"""
 
+    # Размер страницы при выборке задач за период
+    TASKS_PAGE_SIZE = 500
+
+    # Максимум просроченных событий в блоке "предстоящие"
+    OVERDUE_EVENTS_LIMIT = 1000
+
     def __init__(
         self,
         task_repo: TaskRepository,
         meeting_repo: MeetingRepository,
         user_repo: UserRepository,
+        calendar_cache: Optional[CalendarCache] = None,
     ) -> None:
         self._task_repo = task_repo
         self._meeting_repo = meeting_repo
         self._user_repo = user_repo
+        self._calendar_cache = calendar_cache
+
+    async def resolve_filter(
+        self,
+        actor_uuid: UUID,
+        calendar_filter: Optional[CalendarFilter] = None,
+    ) -> CalendarFilter:
+        """Получить итоговый фильтр с учетом прав актора"""
+
+        actor = await self._user_repo.get_by_uuid(actor_uuid)
+        if not actor:
+            raise ValueError("Пользователь не найден")
+
+        return await self._apply_permissions_to_filter(actor, calendar_filter)
 
     async def get_calendar_month(
         self,
@@ -64,6 +93,12 @@ class CalendarService:
         # 3. Применить фильтры с учетом прав
         final_filter = await self._apply_permissions_to_filter(actor, calendar_filter)
 
+        cache_key = self._make_cache_key("month", (year, month), final_filter)
+        if self._calendar_cache:
+            cached = self._calendar_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # 4. Получить события месяца
         events = await self._get_events_for_period(
             start_date=month_start,
@@ -78,7 +113,7 @@ class CalendarService:
         total_events = sum(len(day.events) for week in weeks for day in week.days)
         summary = self._calculate_month_summary(events)
 
-        return CalendarMonth(
+        calendar_month = CalendarMonth(
             year=year,
             month=month,
             month_name=python_calendar.month_name[month],
@@ -87,6 +122,15 @@ class CalendarService:
             summary=summary,
         )
 
+        if self._calendar_cache:
+            self._calendar_cache.set(
+                cache_key,
+                calendar_month,
+                team_uuid=final_filter.team_uuid,
+            )
+
+        return calendar_month
+
     async def get_calendar_week(
         self,
         actor_uuid: UUID,
@@ -108,6 +152,12 @@ class CalendarService:
         # 3. Применить фильтры
         final_filter = await self._apply_permissions_to_filter(actor, calendar_filter)
 
+        cache_key = self._make_cache_key("week", (week_start,), final_filter)
+        if self._calendar_cache:
+            cached = self._calendar_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # 4. Получить события недели
         events = await self._get_events_for_period(
             start_date=week_start,
@@ -115,31 +165,35 @@ class CalendarService:
             calendar_filter=final_filter,
         )
 
-        # 5. Построить дни недели
+        # 5. Построить дни недели по индексу событий
+        events_by_date = self._group_events_by_date(events)
+
         days = []
         for i in range(7):
             day_date = week_start + timedelta(days=i)
-            day_events = [e for e in events if e.date_time.date() == day_date.date()]
-
             days.append(
-                CalendarDay(
-                    date=day_date,
-                    events=day_events,
-                    total_events=len(day_events),
-                    has_overdue=any(e.is_overdue for e in day_events),
-                    has_urgent=any(
-                        e.priority == EventPriority.URGENT for e in day_events
-                    ),
+                self._build_calendar_day(
+                    day_date,
+                    events_by_date.get(day_date.date(), []),
                 )
             )
 
-        return CalendarWeek(
+        calendar_week = CalendarWeek(
             week_start=week_start,
             week_end=week_end,
             days=days,
             total_events=sum(len(day.events) for day in days),
         )
 
+        if self._calendar_cache:
+            self._calendar_cache.set(
+                cache_key,
+                calendar_week,
+                team_uuid=final_filter.team_uuid,
+            )
+
+        return calendar_week
+
     async def get_calendar_day(
         self,
         actor_uuid: UUID,
@@ -206,46 +260,33 @@ class CalendarService:
             calendar_filter,
         )
 
-        # 4. Получить события по периодам
-        today_events = await self._get_events_for_period(
-            today_start,
-            today_end,
-            final_filter,
-        )
-        tomorrow_events = await self._get_events_for_period(
-            tomorrow_start,
-            tomorrow_end,
-            final_filter,
-        )
-        week_events = await self._get_events_for_period(
+        # 4. Получить события объединенного окна одним запросом
+        window_events = await self._get_events_for_period(
             week_start,
-            week_end,
-            final_filter,
-        )
-        next_week_events = await self._get_events_for_period(
-            next_week_start,
             next_week_end,
             final_filter,
         )
 
-        # Просроченные события
-        overdue_events = [
-            e
-            for e in await self._get_events_for_period(
-                datetime(2020, 1, 1),
-                now,
-                final_filter,
-            )
-            if e.is_overdue
-        ]
-
-        return CalendarUpcoming(
-            today=sorted(today_events, key=lambda e: e.date_time),
-            tomorrow=sorted(tomorrow_events, key=lambda e: e.date_time),
-            this_week=sorted(week_events, key=lambda e: e.date_time),
-            next_week=sorted(next_week_events, key=lambda e: e.date_time),
+        # Просроченные события - отдельный запрос по индексу дедлайнов
+        overdue_events = await self._get_overdue_events(final_filter)
+
+        # 5. Разложить события по секциям за один проход
+        upcoming = CalendarUpcoming(
             overdue=sorted(overdue_events, key=lambda e: e.date_time),
         )
+        buckets = (
+            (today_start, today_end, upcoming.today),
+            (tomorrow_start, tomorrow_end, upcoming.tomorrow),
+            (week_start, week_end, upcoming.this_week),
+            (next_week_start, next_week_end, upcoming.next_week),
+        )
+
+        for event in sorted(window_events, key=lambda e: e.date_time):
+            for bucket_start, bucket_end, bucket in buckets:
+                if bucket_start <= event.date_time <= bucket_end:
+                    bucket.append(event)
+
+        return upcoming
 
     async def get_calendar_stats(
         self,
@@ -267,40 +308,74 @@ class CalendarService:
             calendar_filter,
         )
 
-        # 3. Получить события
-        events = await self._get_events_for_period(
-            start_date,
-            end_date,
-            final_filter,
-        )
+        # 3. Получить агрегаты по дням из БД
+        team_uuid = final_filter.team_uuid
+        user_uuid = final_filter.user_uuid
+        event_types = final_filter.event_types
 
-        # 4. Вычислить статистику
-        events_by_type = {event_type: 0 for event_type in EventType}
-        events_by_priority = {priority: 0 for priority in EventPriority}
+        task_days = {}
+        if (
+            not event_types
+            or EventType.TASK in event_types
+            or EventType.TASK_DEADLINE in event_types
+        ):
+            task_days = await self._task_repo.count_tasks_by_deadline_day(
+                date_from=start_date,
+                date_to=end_date,
+                team_uuid=team_uuid,
+                assignee_uuid=user_uuid,
+                include_completed=final_filter.include_completed,
+            )
+
+        meeting_days = {}
+        if not event_types or EventType.MEETING in event_types:
+            meeting_days = await self._meeting_repo.count_meetings_by_day(
+                date_from=start_date,
+                date_to=end_date,
+                team_uuid=team_uuid,
+                participant_uuid=user_uuid,
+            )
 
-        for event in events:
-            events_by_type[event.event_type] += 1
-            events_by_priority[event.priority] += 1
+        # 4. Вычислить статистику
+        tasks_total = sum(day["total"] for day in task_days.values())
+        tasks_overdue = sum(day["overdue"] for day in task_days.values())
+        tasks_due_in_day = sum(day["due_in_day"] for day in task_days.values())
+        tasks_due_in_week = sum(day["due_in_week"] for day in task_days.values())
+
+        meetings_total = sum(day["total"] for day in meeting_days.values())
+        meetings_within_hours = sum(
+            day["within_hours"] for day in meeting_days.values()
+        )
+        meetings_within_day = sum(day["within_day"] for day in meeting_days.values())
 
-        # Дни с событиями
-        busy_days = len(set(e.date_time.date() for e in events))
+        events_by_type = {event_type: 0 for event_type in EventType}
+        events_by_type[EventType.TASK_DEADLINE] = tasks_total
+        events_by_type[EventType.MEETING] = meetings_total
+
+        # Приоритеты вычисляются так же, как в _task_to_calendar_event
+        # и _meeting_to_calendar_event
+        events_by_priority = {
+            EventPriority.URGENT: tasks_overdue,
+            EventPriority.HIGH: tasks_due_in_day + meetings_within_hours,
+            EventPriority.MEDIUM: tasks_due_in_week + meetings_within_day,
+            EventPriority.LOW: (
+                tasks_total - tasks_overdue - tasks_due_in_day - tasks_due_in_week
+            )
+            + (meetings_total - meetings_within_hours - meetings_within_day),
+        }
 
         return CalendarStats(
             period_start=start_date,
             period_end=end_date,
-            total_events=len(events),
+            total_events=tasks_total + meetings_total,
             events_by_type=events_by_type,
             events_by_priority=events_by_priority,
-            overdue_count=sum(1 for e in events if e.is_overdue),
-            completed_tasks=sum(
-                1 for e in events if e.event_type == EventType.TASK and e.is_completed
-            ),
-            upcoming_meetings=sum(
-                1
-                for e in events
-                if e.event_type == EventType.MEETING and e.date_time > datetime.now()
-            ),
-            busy_days=busy_days,
+            overdue_count=tasks_overdue,
+            # Раньше всегда было 0: фильтр искал EventType.TASK, а события
+            # задач имеют тип TASK_DEADLINE. Теперь считаются задачи DONE
+            completed_tasks=sum(day["completed"] for day in task_days.values()),
+            upcoming_meetings=sum(day["upcoming"] for day in meeting_days.values()),
+            busy_days=len(set(task_days) | set(meeting_days)),
         )
 
     async def _get_events_for_period(
@@ -327,20 +402,16 @@ class CalendarService:
             or EventType.TASK in event_types
             or EventType.TASK_DEADLINE in event_types
         ):
-            tasks = await self._task_repo.list_tasks(
-                limit=1000,  # Большой лимит
+            tasks = await self._get_tasks_for_period(
+                start_date=start_date,
+                end_date=end_date,
                 team_uuid=team_uuid,
                 assignee_uuid=user_uuid,
+                include_completed=include_completed,
             )
 
             for task in tasks:
-                # Фильтр по завершенности
-                if not include_completed and task.status == StatusEnum.DONE:
-                    continue
-
-                # Проверяем попадание дедлайна в период
-                if start_date <= task.deadline <= end_date:
-                    events.append(self._task_to_calendar_event(task))
+                events.append(self._task_to_calendar_event(task))
 
         # Получить встречи
         if not event_types or EventType.MEETING in event_types:
@@ -357,6 +428,63 @@ class CalendarService:
 
         return events
 
+    async def _get_overdue_events(
+        self,
+        calendar_filter: Optional[CalendarFilter],
+    ) -> List[CalendarEvent]:
+        """Получить просроченные события (только задачи: встречи не просрочиваются)"""
+
+        event_types = calendar_filter.event_types if calendar_filter else None
+        if (
+            event_types
+            and EventType.TASK not in event_types
+            and EventType.TASK_DEADLINE not in event_types
+        ):
+            return []
+
+        tasks = await self._task_repo.get_overdue_tasks(
+            team_uuid=calendar_filter.team_uuid if calendar_filter else None,
+            assignee_uuid=calendar_filter.user_uuid if calendar_filter else None,
+            limit=self.OVERDUE_EVENTS_LIMIT,
+        )
+
+        return [self._task_to_calendar_event(task) for task in tasks]
+
+    async def _get_tasks_for_period(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        team_uuid: Optional[UUID],
+        assignee_uuid: Optional[UUID],
+        include_completed: bool,
+    ) -> List[Task]:
+        """Получить все задачи с дедлайном в периоде постранично (keyset)"""
+
+        tasks: List[Task] = []
+        after_deadline: Optional[datetime] = None
+        after_uuid: Optional[UUID] = None
+
+        while True:
+            page = await self._task_repo.list_tasks_in_period(
+                date_from=start_date,
+                date_to=end_date,
+                team_uuid=team_uuid,
+                assignee_uuid=assignee_uuid,
+                include_completed=include_completed,
+                after_deadline=after_deadline,
+                after_uuid=after_uuid,
+                limit=self.TASKS_PAGE_SIZE,
+            )
+            tasks.extend(page)
+
+            if len(page) < self.TASKS_PAGE_SIZE:
+                break
+
+            after_deadline = page[-1].deadline
+            after_uuid = page[-1].uuid
+
+        return tasks
+
     def _task_to_calendar_event(self, task) -> CalendarEvent:
         """Преобразовать задачу в календарное событие"""
 
@@ -414,6 +542,24 @@ class CalendarService:
             is_overdue=False,  # Встречи не могут быть просроченными
         )
 
+    def _make_cache_key(
+        self,
+        view: str,
+        period: tuple,
+        calendar_filter: CalendarFilter,
+    ) -> Hashable:
+        """Построить ключ кэша: вид, период и итоговый фильтр"""
+
+        event_types = calendar_filter.event_types
+        return (
+            view,
+            period,
+            calendar_filter.team_uuid,
+            calendar_filter.user_uuid,
+            tuple(sorted(event_types)) if event_types else None,
+            calendar_filter.include_completed,
+        )
+
     async def _apply_permissions_to_filter(
         self,
         actor,
@@ -453,6 +599,9 @@ class CalendarService:
 
         weeks = []
 
+        # Сгруппировать события по датам за один проход
+        events_by_date = self._group_events_by_date(events)
+
         # Получить календарную сетку месяца
         cal = python_calendar.monthcalendar(year, month)
 
@@ -472,20 +621,10 @@ class CalendarService:
                     # Находим понедельник этой недели
                     week_start = day_date - timedelta(days=day_date.weekday())
 
-                # События этого дня
-                day_events = [
-                    e for e in events if e.date_time.date() == day_date.date()
-                ]
-
                 days.append(
-                    CalendarDay(
-                        date=day_date,
-                        events=sorted(day_events, key=lambda e: e.date_time),
-                        total_events=len(day_events),
-                        has_overdue=any(e.is_overdue for e in day_events),
-                        has_urgent=any(
-                            e.priority == EventPriority.URGENT for e in day_events
-                        ),
+                    self._build_calendar_day(
+                        day_date,
+                        events_by_date.get(day_date.date(), []),
                     )
                 )
 
@@ -505,6 +644,34 @@ class CalendarService:
 
         return weeks
 
+    def _group_events_by_date(
+        self,
+        events: List[CalendarEvent],
+    ) -> Dict[date, List[CalendarEvent]]:
+        """Сгруппировать события по датам (внутри дня - по времени)"""
+
+        events_by_date: Dict[date, List[CalendarEvent]] = defaultdict(list)
+
+        for event in sorted(events, key=lambda e: e.date_time):
+            events_by_date[event.date_time.date()].append(event)
+
+        return events_by_date
+
+    def _build_calendar_day(
+        self,
+        day_date: datetime,
+        day_events: List[CalendarEvent],
+    ) -> CalendarDay:
+        """Построить день календаря из уже отсортированных событий"""
+
+        return CalendarDay(
+            date=day_date,
+            events=day_events,
+            total_events=len(day_events),
+            has_overdue=any(e.is_overdue for e in day_events),
+            has_urgent=any(e.priority == EventPriority.URGENT for e in day_events),
+        )
+
     def _calculate_month_summary(self, events: List[CalendarEvent]) -> dict:
         """Вычислить сводку месяца"""
 
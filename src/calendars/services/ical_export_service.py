@@ -0,0 +1,216 @@
+import hashlib
+from datetime import (
+    datetime,
+    timedelta,
+)
+from typing import (
+    AsyncIterator,
+    List,
+)
+
+from calendars.schemas.calendar import (
+    CalendarFilter,
+    EventType,
+)
+from meetings.interfaces import MeetingRepository
+from tasks.interfaces import TaskRepository
+from tasks.models import StatusEnum
+
+
+class ICalendarExportService:
+    """Сервис потоковой выгрузки календаря в формате iCalendar (RFC 5545)"""
+
+    PRODID = "-//Business Manager//Calendar//RU"
+
+    # Длительность встречи по умолчанию (как в проверке конфликтов)
+    MEETING_DURATION = timedelta(hours=1)
+
+    def __init__(
+        self,
+        task_repo: TaskRepository,
+        meeting_repo: MeetingRepository,
+    ) -> None:
+        self._task_repo = task_repo
+        self._meeting_repo = meeting_repo
+
+    async def get_etag(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        calendar_filter: CalendarFilter,
+    ) -> str:
+        """
+        Вычислить ETag выгрузки без чтения самих событий.
+
+        ETag зависит от периода, фильтра, количества событий, времени
+        последнего изменения задач и встреч периода и набора встреч.
+        """
+        parts: List[str] = [
+            start_date.isoformat(),
+            end_date.isoformat(),
+            str(calendar_filter.team_uuid),
+            str(calendar_filter.user_uuid),
+            str(sorted(calendar_filter.event_types or [])),
+            str(calendar_filter.include_completed),
+        ]
+
+        if self._include_tasks(calendar_filter):
+            count, last_updated_at = await self._task_repo.get_period_fingerprint(
+                date_from=start_date,
+                date_to=end_date,
+                team_uuid=calendar_filter.team_uuid,
+                assignee_uuid=calendar_filter.user_uuid,
+                include_completed=calendar_filter.include_completed,
+            )
+            parts.extend([str(count), str(last_updated_at)])
+
+        if self._include_meetings(calendar_filter):
+            (
+                count,
+                last_updated_at,
+                uuids_hash,
+            ) = await self._meeting_repo.get_period_fingerprint(
+                date_from=start_date,
+                date_to=end_date,
+                team_uuid=calendar_filter.team_uuid,
+                participant_uuid=calendar_filter.user_uuid,
+            )
+            # Хэш набора встреч ловит смену участников, не меняющую updated_at
+            parts.extend([str(count), str(last_updated_at), str(uuids_hash)])
+
+        digest = hashlib.sha256("|".join(parts).encode()).hexdigest()
+        return f'"{digest[:32]}"'
+
+    async def stream(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        calendar_filter: CalendarFilter,
+    ) -> AsyncIterator[str]:
+        """Сформировать календарь по частям: по одному VEVENT на событие"""
+
+        yield self._lines(
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{self.PRODID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+        )
+
+        if self._include_tasks(calendar_filter):
+            async for task in self._task_repo.stream_tasks_in_period(
+                date_from=start_date,
+                date_to=end_date,
+                team_uuid=calendar_filter.team_uuid,
+                assignee_uuid=calendar_filter.user_uuid,
+                include_completed=calendar_filter.include_completed,
+            ):
+                yield self._task_to_vevent(task)
+
+        if self._include_meetings(calendar_filter):
+            async for meeting in self._meeting_repo.stream_meetings_in_period(
+                date_from=start_date,
+                date_to=end_date,
+                team_uuid=calendar_filter.team_uuid,
+                participant_uuid=calendar_filter.user_uuid,
+            ):
+                yield self._meeting_to_vevent(meeting)
+
+        yield self._lines("END:VCALENDAR")
+
+    def _task_to_vevent(self, task) -> str:
+        """Преобразовать задачу в VEVENT (дедлайн как точка во времени)"""
+
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:task-{task.uuid}@business-manager",
+            f"DTSTAMP:{self._format_datetime(task.updated_at)}",
+            f"DTSTART:{self._format_datetime(task.deadline)}",
+            f"DTEND:{self._format_datetime(task.deadline)}",
+            f"SUMMARY:{self._escape(task.title)}",
+            f"CATEGORIES:{EventType.TASK_DEADLINE.value}",
+        ]
+
+        if task.description:
+            lines.append(f"DESCRIPTION:{self._escape(task.description)}")
+
+        if task.status == StatusEnum.DONE:
+            lines.append("X-BM-COMPLETED:TRUE")
+
+        lines.append("END:VEVENT")
+        return self._lines(*lines)
+
+    def _meeting_to_vevent(self, meeting) -> str:
+        """Преобразовать встречу в VEVENT"""
+
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:meeting-{meeting.uuid}@business-manager",
+            f"DTSTAMP:{self._format_datetime(meeting.updated_at)}",
+            f"DTSTART:{self._format_datetime(meeting.date_time)}",
+            f"DTEND:{self._format_datetime(meeting.date_time + self.MEETING_DURATION)}",
+            f"SUMMARY:{self._escape(meeting.title)}",
+            f"CATEGORIES:{EventType.MEETING.value}",
+        ]
+
+        if meeting.description:
+            lines.append(f"DESCRIPTION:{self._escape(meeting.description)}")
+
+        lines.append("END:VEVENT")
+        return self._lines(*lines)
+
+    def _include_tasks(self, calendar_filter: CalendarFilter) -> bool:
+        event_types = calendar_filter.event_types
+        return (
+            not event_types
+            or EventType.TASK in event_types
+            or EventType.TASK_DEADLINE in event_types
+        )
+
+    def _include_meetings(self, calendar_filter: CalendarFilter) -> bool:
+        event_types = calendar_filter.event_types
+        return not event_types or EventType.MEETING in event_types
+
+    @staticmethod
+    def _format_datetime(value: datetime) -> str:
+        """Дата-время в формате iCalendar (локальное время, без зоны)"""
+        return value.strftime("%Y%m%dT%H%M%S")
+
+    @staticmethod
+    def _escape(text: str) -> str:
+        """Экранировать текстовое значение (RFC 5545, 3.3.11)"""
+        return (
+            text.replace("\\", "\\\\")
+            .replace(";", "\\;")
+            .replace(",", "\\,")
+            .replace("\r\n", "\\n")
+            .replace("\n", "\\n")
+        )
+
+    @classmethod
+    def _lines(cls, *lines: str) -> str:
+        """Собрать строки с переносом длинных строк и CRLF"""
+        return "".join(f"{cls._fold(line)}\r\n" for line in lines)
+
+    @staticmethod
+    def _fold(line: str) -> str:
+        """Перенести строку длиннее 75 октетов (RFC 5545, 3.1)"""
+        encoded = line.encode("utf-8")
+        if len(encoded) <= 75:
+            return line
+
+        chunks = []
+        current = ""
+        limit = 75
+
+        for char in line:
+            if len((current + char).encode("utf-8")) > limit:
+                chunks.append(current)
+                current = char
+                # Продолжение начинается с пробела, он входит в 75 октетов
+                limit = 74
+            else:
+                current += char
+
+        chunks.append(current)
+        return "\r\n ".join(chunks)
@@ -1,5 +1,8 @@
 __all__ = (
     "SessionDep",
+    "SessionFactoryDep",
+    "ReadSessionDep",
+    "ReadSessionFactoryDep",
     "UserRepoDep",
     "TokenRepoDep",
     "PasswordHasherDep",
@@ -7,31 +10,61 @@ __all__ = (
     "UserActivationDep",
     "UUIDGeneratorDep",
     "CurrentUserDep",
+    "CurrentDBUserDep",
     "PermissionValidatorDep",
     # Teams
     "TeamRepoDep",
+    "InviteCodeRepoDep",
     "TeamMembershipDep",
     # Tasks
     "TaskRepoDep",
+    "ReadTaskRepoDep",
     # Evaluations
     "EvaluationRepoDep",
+    "ReadEvaluationRepoDep",
+    "EvaluationRollupRepoDep",
+    "ReadEvaluationRollupRepoDep",
     # Meetings
     "MeetingRepoDep",
+    "ReadMeetingRepoDep",
+    # Calendar
+    "CalendarCacheDep",
+    "CalendarRepositoryFactoryDep",
+    # User stats
+    "UserStatsCacheDep",
+    "UserStatsRepositoryFactoryDep",
+    # Routing
+    "SessionReleasingRoute",
 )
 
 from .depends import (
+    CalendarCacheDep,
+    CalendarRepositoryFactoryDep,
+    CurrentDBUserDep,
     CurrentUserDep,
     EvaluationRepoDep,
+    EvaluationRollupRepoDep,
+    InviteCodeRepoDep,
     MeetingRepoDep,
     PasswordHasherDep,
     PermissionValidatorDep,
+    ReadEvaluationRepoDep,
+    ReadEvaluationRollupRepoDep,
+    ReadMeetingRepoDep,
+    ReadSessionDep,
+    ReadSessionFactoryDep,
+    ReadTaskRepoDep,
     SessionDep,
+    SessionFactoryDep,
     TaskRepoDep,
     TeamMembershipDep,
     TeamRepoDep,
     TokenRepoDep,
     UserActivationDep,
     UserRepoDep,
+    UserStatsCacheDep,
+    UserStatsRepositoryFactoryDep,
     UserValidatorDep,
     UUIDGeneratorDep,
 )
+from .session_scope import SessionReleasingRoute
@@ -1,39 +1,68 @@
 from core.interfaces.permissions import PermissionValidator
 from core.providers.permission_validator_provider import PermissionValidatorProvider
 
+import math
 from typing import (
     Annotated,
+    Any,
     AsyncGenerator,
+    Dict,
+    Optional,
 )
 from uuid import UUID
 
 from fastapi import (
     Depends,
     HTTPException,
+    Request,
+    Response,
     status,
 )
 from fastapi.security import (
     HTTPAuthorizationCredentials,
     HTTPBearer,
 )
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+)
 
+from calendars.interfaces import (
+    CalendarCache,
+    CalendarRepositoryFactory,
+)
+from calendars.providers import calendar_cache
+from core.config import settings
+from core.dependencies.repository_factory import SessionRepositoryFactory
+from core.dependencies.session_scope import track_request_session
 from core.interfaces import (
     TokenRepository,
     UUIDGenerator,
 )
 from core.models.db_helper import db_helper
 from core.providers.jwt_provider import jwt_provider
+from core.providers.read_your_writes_provider import read_your_writes_tracker
 from core.providers.token_provider import TokenRepositoryProvider
+from core.providers.token_revocation_provider import token_revocation_registry
 from core.providers.uuid_generator_provider import UUIDGeneratorProvider
-from evaluations.crud import EvaluationCRUD
-from evaluations.interfaces import EvaluationRepository
+from evaluations.crud import (
+    EvaluationCRUD,
+    EvaluationRollupCRUD,
+)
+from evaluations.interfaces import (
+    EvaluationRepository,
+    EvaluationRollupRepository,
+)
 from meetings.crud import MeetingCRUD
 from meetings.interfaces import MeetingRepository
 from tasks.crud import TaskCRUD
 from tasks.interfaces import TaskRepository
-from teams.crud import TeamCRUD
+from teams.crud import (
+    InviteCodeCRUD,
+    TeamCRUD,
+)
 from teams.interfaces import (
+    InviteCodeRepository,
     TeamMembershipManager,
     TeamRepository,
 )
@@ -43,13 +72,19 @@ from users.interfaces import (
     PasswordHasher,
     UserActivationManager,
     UserRepository,
+    UserStatsCache,
+    UserStatsRepositoryFactory,
     UserValidator,
 )
-from users.models import User
+from users.models import (
+    RoleEnum,
+    User,
+)
 from users.providers import (
     BcryptPasswordHasherProvider,
     UserActivationManagerProvider,
     UserValidatorProvider,
+    user_stats_cache,
 )
 
 security = HTTPBearer()
@@ -58,11 +93,48 @@ security = HTTPBearer()
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """Получить сессию из БД"""
+    """
+    Получить сессию из БД.
+
+    Зависимость кэшируется FastAPI в пределах запроса: все репозитории
+    и get_current_user работают с одной сессией, и ее identity map служит
+    кэшем загрузок по UUID на время запроса.
+
+    Соединение из пула берется при первом запросе к БД, а не здесь:
+    эндпоинт, ответивший из кэша (или stateless-проверка токена), пул
+    не трогает. На маршрутах SessionReleasingRoute сессия закрывается
+    сразу после эндпоинта, до сериализации ответа.
+    """
     async for session in db_helper.session_getter():
+        track_request_session(session)
         yield session
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Получить фабрику сессий (для потоковых ответов, переживающих запрос)"""
+    return db_helper.session_factory
+
+
+# Метка последней записи, которую клиент возвращает в следующих запросах
+LAST_WRITE_COOKIE = "last_write"
+LAST_WRITE_HEADER = "X-Last-Write"
+
+
+def get_client_write_mark(request: Request) -> Optional[str]:
+    """Получить метку последней записи клиента из заголовка или cookie"""
+    return request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(
+        LAST_WRITE_COOKIE
+    )
+
+
+def should_read_from_primary(request: Request, user_uuid: str) -> bool:
+    """Нужно ли читать из основной БД: реплик нет или пользователь недавно писал"""
+    return not db_helper.has_replicas or read_your_writes_tracker.wrote_recently(
+        UUID(user_uuid),
+        get_client_write_mark(request),
+    )
+
+
 def get_uuid_generator() -> UUIDGenerator:
     """Получить генератор UUID"""
     return UUIDGeneratorProvider()
@@ -83,7 +155,7 @@ def get_user_repository(
     ],
 ) -> UserRepository:
     """Получить репозиторий пользователей"""
-    return UserCRUD(session)
+    return UserCRUD(session, token_revocation=token_revocation_registry)
 
 
 def get_token_repository(
@@ -165,7 +237,75 @@ async def get_current_user_uuid(
     return str(user_uuid)
 
 
+async def get_read_session(
+    request: Request,
+    user_uuid: Annotated[
+        str,
+        Depends(get_current_user_uuid),
+    ],
+    session: Annotated[
+        AsyncSession,
+        Depends(get_session),
+    ],
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Получить сессию для запросов только на чтение.
+
+    Если настроены реплики, сессия открывается на следующей реплике по
+    кругу. В течение read_your_writes_seconds после собственной записи
+    пользователя (по метке, которую вернул клиент) возвращается общая
+    сессия основной БД, чтобы он видел свои изменения несмотря на
+    отставание реплики.
+    """
+    if should_read_from_primary(request, user_uuid):
+        yield session
+        return
+
+    async for read_session in db_helper.read_session_getter():
+        track_request_session(read_session)
+        yield read_session
+
+
+def get_read_session_factory(
+    request: Request,
+    user_uuid: Annotated[
+        str,
+        Depends(get_current_user_uuid),
+    ],
+) -> async_sessionmaker[AsyncSession]:
+    """Получить фабрику сессий для чтения (потоковые ответы по реплике)"""
+    if should_read_from_primary(request, user_uuid):
+        return db_helper.session_factory
+    return db_helper.get_read_session_factory()
+
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def track_user_write(request: Request, response: Response, user_uuid: UUID) -> None:
+    """
+    Отметить запрос пользователя на изменение для read-your-writes.
+
+    Метка отдается клиенту в cookie и в заголовке: браузер вернет cookie
+    сам, остальные клиенты могут передать заголовок в следующем запросе.
+    """
+    if request.method in SAFE_METHODS:
+        return
+
+    mark = read_your_writes_tracker.mark_write(user_uuid)
+    response.set_cookie(
+        LAST_WRITE_COOKIE,
+        mark,
+        max_age=math.ceil(read_your_writes_tracker.window_seconds),
+        httponly=True,
+        samesite="lax",
+    )
+    response.headers[LAST_WRITE_HEADER] = mark
+
+
 async def get_current_user(
+    request: Request,
+    response: Response,
     user_uuid: Annotated[
         str,
         Depends(get_current_user_uuid),
@@ -191,28 +331,93 @@ async def get_current_user(
             detail="Аккаунт заблокирован",
         )
 
+    track_user_write(request, response, user.uuid)
     return user
 
 
+def get_user_from_claims(payload: Dict[str, Any]) -> Optional[User]:
+    """
+    Построить пользователя из claims access токена без запроса в БД.
+
+    Возвращает несохраненный объект User только с uuid, role, team_uuid
+    и is_active. None - claims неполные или устарели (роль, команда или
+    активность менялись после выдачи токена), нужен запрос в БД.
+    """
+    try:
+        user_uuid = UUID(payload["sub"])
+        role = RoleEnum(payload["role"])
+        team = payload["team"]
+        team_uuid = UUID(team) if team else None
+        issued_at = int(payload["iat"])
+        is_active = payload["active"] is True
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    if not is_active:
+        return None
+
+    if token_revocation_registry.is_revoked(user_uuid, team_uuid, issued_at):
+        return None
+
+    return User(
+        uuid=user_uuid,
+        role=role,
+        team_uuid=team_uuid,
+        is_active=True,
+    )
+
+
 async def get_current_active_user(
-    current_user: Annotated[
-        User,
-        Depends(get_current_user),
+    request: Request,
+    response: Response,
+    credentials: Annotated[
+        HTTPAuthorizationCredentials,
+        Depends(security),
+    ],
+    user_repo: Annotated[
+        UserRepository,
+        Depends(get_user_repository),
     ],
 ) -> User:
-    """Получить текущего активного пользователя"""
-    if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Аккаунт не найден",
-        )
+    """
+    Получить текущего активного пользователя.
+
+    В режиме stateless_access_tokens пользователь строится из claims
+    токена без SELECT; у него заполнены только uuid, role, team_uuid
+    и is_active. Эндпоинтам, которым нужна полная запись (профиль,
+    изменение самого пользователя), следует использовать CurrentDBUserDep.
+    """
+    token = credentials.credentials
+
+    if settings.auth.stateless_access_tokens:
+        payload = jwt_provider.verify_access_token(token)
+        if not payload:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Недействительный токен",
+            )
+
+        user = get_user_from_claims(payload)
+        if user:
+            track_user_write(request, response, user.uuid)
+            return user
 
-    return current_user
+    user_uuid = await get_current_user_uuid(credentials)
+    return await get_current_user(request, response, user_uuid, user_repo)
 
 
 # === Типы для аннотаций ===
 
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+SessionFactoryDep = Annotated[
+    async_sessionmaker[AsyncSession],
+    Depends(get_session_factory),
+]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
+ReadSessionFactoryDep = Annotated[
+    async_sessionmaker[AsyncSession],
+    Depends(get_read_session_factory),
+]
 UserRepoDep = Annotated[UserRepository, Depends(get_user_repository)]
 TokenRepoDep = Annotated[TokenRepository, Depends(get_token_repository)]
 PasswordHasherDep = Annotated[PasswordHasher, Depends(get_password_hasher)]
@@ -222,6 +427,7 @@ UserActivationDep = Annotated[
 ]
 UUIDGeneratorDep = Annotated[UUIDGenerator, Depends(get_uuid_generator)]
 CurrentUserDep = Annotated[User, Depends(get_current_active_user)]
+CurrentDBUserDep = Annotated[User, Depends(get_current_user)]
 
 
 # === Зависимости репозиториев Teams ===
@@ -234,7 +440,17 @@ def get_team_repository(
     ],
 ) -> TeamRepository:
     """Получить репозиторий команд"""
-    return TeamCRUD(session)
+    return TeamCRUD(session, token_revocation=token_revocation_registry)
+
+
+def get_invite_code_repository(
+    session: Annotated[
+        AsyncSession,
+        Depends(get_session),
+    ],
+) -> InviteCodeRepository:
+    """Получить хранилище кодов приглашения"""
+    return InviteCodeCRUD(session)
 
 
 # === Зависимости провайдеров Teams ===
@@ -249,6 +465,10 @@ def get_team_membership_manager(
         UserRepository,
         Depends(get_user_repository),
     ],
+    invite_code_repo: Annotated[
+        InviteCodeRepository,
+        Depends(get_invite_code_repository),
+    ],
     session: Annotated[
         AsyncSession,
         Depends(get_session),
@@ -258,6 +478,7 @@ def get_team_membership_manager(
     return TeamMembershipManagerProvider(
         team_repo=team_repo,
         user_repo=user_repo,
+        invite_code_repo=invite_code_repo,
         db_session=session,
     )
 
@@ -265,6 +486,10 @@ def get_team_membership_manager(
 # === Типы для аннотаций Teams ===
 
 TeamRepoDep = Annotated[TeamRepository, Depends(get_team_repository)]
+InviteCodeRepoDep = Annotated[
+    InviteCodeRepository,
+    Depends(get_invite_code_repository),
+]
 TeamMembershipDep = Annotated[
     TeamMembershipManager,
     Depends(get_team_membership_manager),
@@ -284,9 +509,20 @@ def get_task_repository(
     return TaskCRUD(session)
 
 
+def get_read_task_repository(
+    session: Annotated[
+        AsyncSession,
+        Depends(get_read_session),
+    ],
+) -> TaskRepository:
+    """Получить репозиторий задач для чтения (реплика)"""
+    return TaskCRUD(session)
+
+
 # === Типы для аннотаций Tasks ===
 
 TaskRepoDep = Annotated[TaskRepository, Depends(get_task_repository)]
+ReadTaskRepoDep = Annotated[TaskRepository, Depends(get_read_task_repository)]
 
 
 # === Зависимости репозиториев Evaluations ===
@@ -302,9 +538,51 @@ def get_evaluation_repository(
     return EvaluationCRUD(session)
 
 
+def get_read_evaluation_repository(
+    session: Annotated[
+        AsyncSession,
+        Depends(get_read_session),
+    ],
+) -> EvaluationRepository:
+    """Получить репозиторий оценок для чтения (реплика)"""
+    return EvaluationCRUD(session)
+
+
+def get_evaluation_rollup_repository(
+    session: Annotated[
+        AsyncSession,
+        Depends(get_session),
+    ],
+) -> EvaluationRollupRepository:
+    """Получить репозиторий сводок оценок"""
+    return EvaluationRollupCRUD(session)
+
+
+def get_read_evaluation_rollup_repository(
+    session: Annotated[
+        AsyncSession,
+        Depends(get_read_session),
+    ],
+) -> EvaluationRollupRepository:
+    """Получить репозиторий сводок оценок для чтения (реплика)"""
+    return EvaluationRollupCRUD(session)
+
+
 # === Типы для аннотаций Evaluations ===
 
 EvaluationRepoDep = Annotated[EvaluationRepository, Depends(get_evaluation_repository)]
+ReadEvaluationRepoDep = Annotated[
+    EvaluationRepository,
+    Depends(get_read_evaluation_repository),
+]
+EvaluationRollupRepoDep = Annotated[
+    EvaluationRollupRepository,
+    Depends(get_evaluation_rollup_repository),
+]
+ReadEvaluationRollupRepoDep = Annotated[
+    EvaluationRollupRepository,
+    Depends(get_read_evaluation_rollup_repository),
+]
 
 
 # === Зависимости репозиториев Meetings ===
@@ -320,9 +598,23 @@ def get_meeting_repository(
     return MeetingCRUD(session)
 
 
+def get_read_meeting_repository(
+    session: Annotated[
+        AsyncSession,
+        Depends(get_read_session),
+    ],
+) -> MeetingRepository:
+    """Получить репозиторий встреч для чтения (реплика)"""
+    return MeetingCRUD(session)
+
+
 # === Типы для аннотаций Meetings ===
 
 MeetingRepoDep = Annotated[MeetingRepository, Depends(get_meeting_repository)]
+ReadMeetingRepoDep = Annotated[
+    MeetingRepository,
+    Depends(get_read_meeting_repository),
+]
 
 
 def get_permission_validator() -> PermissionValidator:
@@ -334,3 +626,43 @@ PermissionValidatorDep = Annotated[
     PermissionValidator,
     Depends(get_permission_validator),
 ]
+
+
+# === Зависимости календаря ===
+
+
+def get_calendar_cache() -> CalendarCache:
+    """Получить кэш представлений календаря"""
+    return calendar_cache
+
+
+def get_read_repository_factory(
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession],
+        Depends(get_read_session_factory),
+    ],
+) -> SessionRepositoryFactory:
+    """Получить фабрику репозиториев с собственной сессией для чтения"""
+    return SessionRepositoryFactory(session_factory)
+
+
+CalendarCacheDep = Annotated[CalendarCache, Depends(get_calendar_cache)]
+CalendarRepositoryFactoryDep = Annotated[
+    CalendarRepositoryFactory,
+    Depends(get_read_repository_factory),
+]
+
+
+# === Зависимости статистики пользователей ===
+
+
+def get_user_stats_cache() -> UserStatsCache:
+    """Получить кэш статистики пользователей"""
+    return user_stats_cache
+
+
+UserStatsCacheDep = Annotated[UserStatsCache, Depends(get_user_stats_cache)]
+UserStatsRepositoryFactoryDep = Annotated[
+    UserStatsRepositoryFactory,
+    Depends(get_read_repository_factory),
+]
@@ -0,0 +1,39 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+)
+
+from evaluations.crud import EvaluationRollupCRUD
+from meetings.crud import MeetingCRUD
+from tasks.crud import TaskCRUD
+
+
+class SessionRepositories:
+    """Репозитории поверх одной сессии"""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.task_repo = TaskCRUD(session)
+        self.meeting_repo = MeetingCRUD(session)
+        self.evaluation_rollup_repo = EvaluationRollupCRUD(session)
+
+
+class SessionRepositoryFactory:
+    """
+    Фабрика репозиториев с собственной сессией.
+
+    Нужна там, где сессии запроса не хватает: потоковые ответы,
+    которые отдаются после закрытия зависимостей, и параллельные
+    запросы (одна AsyncSession не выполняет их одновременно).
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    @asynccontextmanager
+    async def open(self) -> AsyncIterator[SessionRepositories]:
+        """Открыть сессию и отдать репозитории поверх нее"""
+        async with self._session_factory() as session:
+            yield SessionRepositories(session)
@@ -0,0 +1,82 @@
+import functools
+import inspect
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    List,
+    Optional,
+)
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Сессии БД, открытые зависимостями текущего запроса
+request_sessions: ContextVar[Optional[List[AsyncSession]]] = ContextVar(
+    "request_sessions",
+    default=None,
+)
+
+
+def track_request_session(session: AsyncSession) -> None:
+    """Зарегистрировать сессию запроса для раннего освобождения"""
+    sessions = request_sessions.get()
+    if sessions is not None:
+        sessions.append(session)
+
+
+async def release_request_sessions() -> None:
+    """
+    Закрыть сессии запроса и вернуть их соединения в пул.
+
+    Загруженные объекты остаются доступны (expire_on_commit=False), а
+    незафиксированные изменения откатываются - так же, как при закрытии
+    сессии в конце запроса, только раньше.
+    """
+    sessions = request_sessions.get()
+    while sessions:
+        await sessions.pop().close()
+
+
+def release_sessions_after(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Обернуть эндпоинт: освободить сессии сразу после его выполнения"""
+    if not inspect.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            await release_request_sessions()
+
+    return wrapper
+
+
+class SessionReleasingRoute(APIRoute):
+    """
+    APIRoute, освобождающий соединения БД до сериализации ответа.
+
+    Сессия открывает соединение только при первом запросе к БД (так
+    работает AsyncSession), а держит его до закрытия. Без этого класса
+    сессия закрывается после сериализации ответа; здесь - сразу после
+    возврата из эндпоинта, когда интерактор уже отработал. Так время
+    удержания соединения на запрос меньше, и пул реже упирается в лимит.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, release_sessions_after(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        handler = super().get_route_handler()
+
+        async def session_scoped_handler(request: Request) -> Response:
+            # Свой список сессий на каждый запрос
+            token = request_sessions.set([])
+            try:
+                return await handler(request)
+            finally:
+                request_sessions.reset(token)
+
+        return session_scoped_handler
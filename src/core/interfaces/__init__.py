@@ -1,17 +1,27 @@
 __all__ = (
+    "AccessTokenRevocationRegistry",
     "PermissionValidator",
     "DBSession",
+    "ReadYourWritesTracker",
     "UUIDGenerator",
+    "StageTimings",
     "JWTProviderInterface",
+    "JWTSigningBackend",
     "TokenRepository",
+    "TokenPartitionManager",
 )
 
 from .auth import (
+    AccessTokenRevocationRegistry,
     JWTProviderInterface,
+    JWTSigningBackend,
+    TokenPartitionManager,
     TokenRepository,
 )
 from .common import (
     DBSession,
+    ReadYourWritesTracker,
+    StageTimings,
     UUIDGenerator,
 )
 from .permissions import PermissionValidator
@@ -14,6 +14,26 @@ from core.models.user_token import (
 )
 
 
+class JWTSigningBackend(Protocol):
+    """Интерфейс ключей подписи JWT (общий секрет или пара ключей)"""
+
+    algorithm: str
+    kid: Optional[str]
+
+    @property
+    def signing_key(self) -> Any:
+        """Ключ для подписи новых токенов"""
+        ...
+
+    def get_verification_key(self, kid: Optional[str]) -> Optional[Any]:
+        """Ключ для проверки токена с заголовком kid (None - неизвестный kid)"""
+        ...
+
+    def get_jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Открытые ключи в формате JWKS"""
+        ...
+
+
 class JWTProviderInterface(Protocol):
     """Интерфейс для работы с JWT токенами"""
 
@@ -34,6 +54,14 @@ class JWTProviderInterface(Protocol):
         """Проверить и декодировать Access токен"""
         ...
 
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Получить счетчики кэша проверенных токенов"""
+        ...
+
+    def get_jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Получить открытые ключи проверки токенов (JWKS)"""
+        ...
+
     def get_user_from_token(self, token: str) -> Optional[UUID]:
         """Извлечь UUID пользователя из токена"""
         ...
@@ -83,6 +111,18 @@ class TokenRepository(Protocol):
         """Создать новый токен"""
         ...
 
+    async def add_token(
+        self,
+        user_uuid: UUID,
+        token_hash: str,
+        token_type: TokenType,
+        expires_at: datetime,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> None:
+        """Добавить токен без возврата созданной записи"""
+        ...
+
     async def get_token_by_hash(
         self,
         token_hash: str,
@@ -105,6 +145,14 @@ class TokenRepository(Protocol):
         """Удалить все просроченные токены"""
         ...
 
+    async def delete_expired_tokens_batch(
+        self,
+        batch_size: int,
+        expired_before: datetime,
+    ) -> int:
+        """Удалить порцию токенов, истекших до expired_before"""
+        ...
+
     async def get_user_active_tokens(
         self,
         user_uuid: UUID,
@@ -113,16 +161,57 @@ class TokenRepository(Protocol):
         """Получить активные токены пользователя"""
         ...
 
-    async def rotate_refresh_token(
+    async def rotate_refresh_token_by_hash(
         self,
         old_token_hash: str,
         new_token_hash: str,
         new_expires_at: datetime,
-        user_uuid: UUID,
-    ) -> Optional[UserToken]:
-        """Заменить старый refresh токен на новый"""
+    ) -> Optional[Dict[str, Any]]:
+        """Заменить refresh токен одним запросом с проверкой активности владельца"""
         ...
 
     async def revoke_all_user_sessions(self, user_uuid: UUID) -> int:
         """Отозвать все сессии пользователя"""
         ...
+
+
+class AccessTokenRevocationRegistry(Protocol):
+    """
+    Интерфейс реестра отзыва claims access токенов.
+
+    Отмечает момент, после которого claims пользователя (роль, команда,
+    активность) в ранее выданных токенах считаются устаревшими.
+    """
+
+    def revoke_user(self, user_uuid: UUID) -> None:
+        """Отметить изменение прав пользователя"""
+        ...
+
+    def revoke_team(self, team_uuid: UUID) -> None:
+        """Отметить изменение состава команды (например, удаление)"""
+        ...
+
+    def is_revoked(
+        self,
+        user_uuid: UUID,
+        team_uuid: Optional[UUID],
+        issued_at: int,
+    ) -> bool:
+        """Проверить, устарели ли claims токена, выданного в issued_at"""
+        ...
+
+
+class TokenPartitionManager(Protocol):
+    """Интерфейс управления партициями таблицы токенов"""
+
+    async def is_partitioned(self) -> bool:
+        """Проверить, секционирована ли таблица токенов"""
+        ...
+
+    async def ensure_partitions(self, now: datetime, months_ahead: int) -> int:
+        """Создать недостающие партиции, вернуть количество созданных"""
+        ...
+
+    async def drop_expired_partitions(self, expired_before: datetime) -> List[str]:
+        """Удалить полностью истекшие партиции, вернуть их имена"""
+        ...
@@ -1,4 +1,8 @@
 from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Optional,
     Protocol,
 )
 from uuid import UUID
@@ -26,3 +30,43 @@ class DBSession(Protocol):
     async def flush(self) -> None:
         """Отправить изменения в БД без подтверждения транзакции"""
         ...
+
+
+class StageTimings(Protocol):
+    """Интерфейс сбора длительностей этапов обработки (гистограммы)"""
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Учесть длительность этапа"""
+        ...
+
+    def measure(self, stage: str) -> ContextManager[None]:
+        """Замерить длительность блока кода как этап stage"""
+        ...
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Получить гистограммы по этапам"""
+        ...
+
+
+class ReadYourWritesTracker(Protocol):
+    """
+    Интерфейс учета недавних записей пользователей.
+
+    Пока реплика может отставать от основной БД, чтения пользователя,
+    который только что что-то изменил, направляются в основную БД.
+    Отметка о записи хранится у клиента, поэтому учет не зависит от
+    того, какой воркер обработает следующий запрос.
+    """
+
+    @property
+    def window_seconds(self) -> float:
+        """Сколько секунд после записи метка остается действительной"""
+        ...
+
+    def mark_write(self, user_uuid: UUID) -> str:
+        """Отметить запись пользователя и получить метку для клиента"""
+        ...
+
+    def wrote_recently(self, user_uuid: UUID, client_mark: Optional[str]) -> bool:
+        """Проверить по метке клиента, писал ли пользователь в пределах окна"""
+        ...
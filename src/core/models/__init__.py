@@ -5,16 +5,26 @@ __all__ = (
     "UserToken",
     "User",
     "Evaluation",
+    "TeamEvaluationRollup",
+    "UserEvaluationRollup",
     "Meeting",
     "Task",
     "Team",
+    "TeamInviteCode",
     "TokenType",
 )
 
-from evaluations.models import Evaluation
+from evaluations.models import (
+    Evaluation,
+    TeamEvaluationRollup,
+    UserEvaluationRollup,
+)
 from meetings.models import Meeting
 from tasks.models import Task
-from teams.models import Team
+from teams.models import (
+    Team,
+    TeamInviteCode,
+)
 from users.models import User
 
 from .associations import meeting_participants
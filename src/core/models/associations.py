@@ -1,6 +1,7 @@
 from sqlalchemy import (
     Column,
     ForeignKey,
+    Index,
     Table,
 )
 from sqlalchemy.dialects.postgresql import UUID
@@ -10,6 +11,18 @@ from .base import Base
 meeting_participants = Table(
     "meeting_participants",
     Base.metadata,
-    Column("meeting_uuid", UUID(as_uuid=True), ForeignKey("meetings.uuid")),
-    Column("user_uuid", UUID(as_uuid=True), ForeignKey("users.uuid")),
+    Column(
+        "meeting_uuid",
+        UUID(as_uuid=True),
+        ForeignKey("meetings.uuid"),
+        primary_key=True,
+    ),
+    Column(
+        "user_uuid",
+        UUID(as_uuid=True),
+        ForeignKey("users.uuid"),
+        primary_key=True,
+    ),
+    # Встречи участника: подзапрос user_uuid -> meeting_uuid в MeetingCRUD
+    Index("ix_meeting_participants_user_uuid_meeting_uuid", "user_uuid", "meeting_uuid"),
 )
@@ -1,11 +1,66 @@
-from typing import AsyncGenerator
+import itertools
+import time
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
 
 from core.config import settings
+from core.interfaces.common import StageTimings
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class MeteredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool с метриками выдачи соединений.
+
+    Замеряет полное время connect(): ожидание свободного соединения,
+    открытие нового и pre-ping. Считает открытые соединения и отказы
+    по pool_timeout - по ним подбирается pool_size/max_overflow.
+    """
+
+    CHECKOUT_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000, 30000)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._timings: Optional[StageTimings] = None
+        self.connections_opened = 0
+        self.checkout_timeouts = 0
+
+    @property
+    def timings(self) -> StageTimings:
+        """Гистограмма времени выдачи соединений (этап checkout)"""
+        if self._timings is None:
+            # Пул создается при импорте core.models, а core.providers сам
+            # импортирует core.models - поэтому импорт при первом замере
+            from core.providers.stage_timings_provider import StageTimingsProvider
+
+            self._timings = StageTimingsProvider(buckets_ms=self.CHECKOUT_BUCKETS_MS)
+        return self._timings
+
+    def connect(self) -> Any:
+        with self.timings.measure("checkout"):
+            try:
+                return super().connect()
+            except exc.TimeoutError:
+                self.checkout_timeouts += 1
+                raise
+
+    def _create_connection(self) -> Any:
+        connection = super()._create_connection()
+        self.connections_opened += 1
+        return connection
 
 
 class Db_Helper:
@@ -16,28 +71,108 @@ class Db_Helper:
         echo_pool: bool = False,
         max_overflow: int = 10,
         pool_size: int = 5,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        statement_cache_size: int = 100,
+        replica_urls: Sequence[str] = (),
     ) -> None:
-        self.async_enginge = create_async_engine(
-            url=url,
-            echo=echo,
-            echo_pool=echo_pool,
-            max_overflow=max_overflow,
-            pool_size=pool_size,
-        )
-        self.session_factory = async_sessionmaker(
-            bind=self.async_enginge,
+        engine_options: Dict[str, Any] = {
+            "echo": echo,
+            "echo_pool": echo_pool,
+            "poolclass": MeteredAsyncQueuePool,
+            "max_overflow": max_overflow,
+            "pool_size": pool_size,
+            "pool_timeout": pool_timeout,
+            "pool_recycle": pool_recycle,
+            "pool_pre_ping": pool_pre_ping,
+            "connect_args": {
+                # Кэш подготовленных выражений на соединение: у asyncpg
+                # и у слоя DBAPI SQLAlchemy (0 - выключить, нужно для pgbouncer
+                # в режиме transaction)
+                "statement_cache_size": statement_cache_size,
+                "prepared_statement_cache_size": statement_cache_size,
+            },
+        }
+
+        self.async_enginge = create_async_engine(url=url, **engine_options)
+        self.session_factory = self._create_session_factory(self.async_enginge)
+
+        # Реплики для чтения: у каждой свой пул с теми же настройками
+        self.replica_engines: List[AsyncEngine] = [
+            create_async_engine(url=replica_url, **engine_options)
+            for replica_url in replica_urls
+        ]
+        self.replica_session_factories = [
+            self._create_session_factory(engine) for engine in self.replica_engines
+        ]
+        self._replica_cycle = itertools.cycle(self.replica_session_factories)
+
+    @staticmethod
+    def _create_session_factory(
+        engine: AsyncEngine,
+    ) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(
+            bind=engine,
             autoflush=False,
             autocommit=False,
             expire_on_commit=False,
         )
 
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.replica_session_factories)
+
     async def engine_dispose(self) -> None:
         await self.async_enginge.dispose()
+        for engine in self.replica_engines:
+            await engine.dispose()
 
     async def session_getter(self) -> AsyncGenerator[AsyncSession, None]:
         async with self.session_factory() as session:
             yield session
 
+    def get_read_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Фабрика сессий следующей реплики по кругу (без реплик - основная)"""
+        if not self.has_replicas:
+            return self.session_factory
+        return next(self._replica_cycle)
+
+    async def read_session_getter(self) -> AsyncGenerator[AsyncSession, None]:
+        async with self.get_read_session_factory()() as session:
+            yield session
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Получить состояние и метрики пулов соединений"""
+        stats = self._get_engine_pool_stats(self.async_enginge)
+
+        if self.has_replicas:
+            stats["replicas"] = [
+                self._get_engine_pool_stats(engine) for engine in self.replica_engines
+            ]
+
+        return stats
+
+    @staticmethod
+    def _get_engine_pool_stats(engine: AsyncEngine) -> Dict[str, Any]:
+        pool = engine.sync_engine.pool
+
+        stats: Dict[str, Any] = {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            # До заполнения pool_size SQLAlchemy возвращает отрицательное значение
+            "overflow": max(pool.overflow(), 0),
+            "timeout_seconds": pool.timeout(),
+        }
+
+        if isinstance(pool, MeteredAsyncQueuePool):
+            stats["connections_opened"] = pool.connections_opened
+            stats["checkout_timeouts"] = pool.checkout_timeouts
+            stats["timings"] = pool.timings.get_stats()
+
+        return stats
+
 
 db_helper = Db_Helper(
     url=settings.db_config.url,
@@ -45,4 +180,9 @@ db_helper = Db_Helper(
     echo_pool=settings.db_config.echo_pool,
     max_overflow=settings.db_config.max_overflow,
     pool_size=settings.db_config.pool_size,
+    pool_timeout=settings.db_config.pool_timeout,
+    pool_recycle=settings.db_config.pool_recycle,
+    pool_pre_ping=settings.db_config.pool_pre_ping,
+    statement_cache_size=settings.db_config.statement_cache_size,
+    replica_urls=settings.db_config.replica_urls,
 )
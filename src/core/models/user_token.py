@@ -37,10 +37,11 @@ class UserToken(Base):
         nullable=False,
         index=True,
     )
+    # Без UNIQUE: в секционированной таблице уникальность возможна только
+    # вместе с expires_at; хеш случайного токена уникален и так
     token_hash: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
-        unique=True,
         index=True,
     )
     token_type: Mapped[TokenType] = mapped_column(
@@ -1,15 +1,41 @@
 __all__ = (
     "TokenRepositoryProvider",
+    "TokenPartitionManagerProvider",
     "UUIDGeneratorProvider",
     "PermissionValidatorProvider",
     "jwt_provider",
     "JWTProvider",
+    "HMACSigningBackend",
+    "AsymmetricSigningBackend",
+    "InMemoryTokenRevocationProvider",
+    "token_revocation_registry",
+    "ClientMarkReadYourWritesProvider",
+    "read_your_writes_tracker",
+    "StageTimingsProvider",
+    "login_timings",
 )
 
 from .jwt_provider import (
     JWTProvider,
     jwt_provider,
 )
+from .jwt_signing_provider import (
+    AsymmetricSigningBackend,
+    HMACSigningBackend,
+)
 from .permission_validator_provider import PermissionValidatorProvider
+from .read_your_writes_provider import (
+    ClientMarkReadYourWritesProvider,
+    read_your_writes_tracker,
+)
+from .stage_timings_provider import (
+    StageTimingsProvider,
+    login_timings,
+)
+from .token_partition_provider import TokenPartitionManagerProvider
 from .token_provider import TokenRepositoryProvider
+from .token_revocation_provider import (
+    InMemoryTokenRevocationProvider,
+    token_revocation_registry,
+)
 from .uuid_generator_provider import UUIDGeneratorProvider
@@ -1,5 +1,7 @@
 import hashlib
 import secrets
+import time
+from collections import OrderedDict
 from datetime import (
     datetime,
     timedelta,
@@ -7,7 +9,9 @@ from datetime import (
 from typing import (
     Any,
     Dict,
+    List,
     Optional,
+    Tuple,
 )
 from uuid import UUID
 
@@ -15,7 +19,14 @@ import jwt
 from jwt import InvalidTokenError
 
 from core.config import settings
-from core.interfaces.auth import JWTProviderInterface
+from core.interfaces.auth import (
+    JWTProviderInterface,
+    JWTSigningBackend,
+)
+from core.providers.jwt_signing_provider import (
+    AsymmetricSigningBackend,
+    HMACSigningBackend,
+)
 
 
 class JWTProvider(JWTProviderInterface):
@@ -27,6 +38,8 @@ class JWTProvider(JWTProviderInterface):
         algorithm: str,
         access_token_expire_minutes: int = 30,
         refresh_token_expire_days: int = 7,
+        verified_cache_max_entries: int = 1024,
+        signing_backend: Optional[JWTSigningBackend] = None,
     ) -> None:
         """
         Args:
@@ -34,12 +47,27 @@ class JWTProvider(JWTProviderInterface):
             algorithm: Алгоритм шифрования (по умолчанию HS256)
             access_token_expire_minutes: Время жизни access токена в минутах
             refresh_token_expire_days: Время жизни refresh токена в днях
+            verified_cache_max_entries: Размер кэша проверенных токенов (0 - выключен)
+            signing_backend: Ключи подписи (по умолчанию - secret_key и algorithm)
         """
         self.secret_key = secret_key
         self.algorithm = algorithm
+        self._signing_backend = signing_backend or HMACSigningBackend(
+            secret_key,
+            algorithm,
+        )
         self.access_token_expire_delta = timedelta(minutes=access_token_expire_minutes)
         self.refresh_token_expire_delta = timedelta(days=refresh_token_expire_days)
 
+        # digest токена -> (exp, payload); LRU, записи живут до exp токена
+        self._verified_cache: OrderedDict[bytes, Tuple[float, Dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._verified_cache_max_entries = verified_cache_max_entries
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+
     def create_access_token(
         self,
         user_uuid: UUID,
@@ -71,10 +99,14 @@ class JWTProvider(JWTProviderInterface):
         if additional_claims:
             payload.update(additional_claims)
 
+        backend = self._signing_backend
+        headers = {"kid": backend.kid} if backend.kid else None
+
         return jwt.encode(
             payload=payload,
-            key=self.secret_key,
-            algorithm=self.algorithm,
+            key=backend.signing_key,
+            algorithm=backend.algorithm,
+            headers=headers,
         )
 
     def create_refresh_token(self) -> str:
@@ -91,17 +123,75 @@ class JWTProvider(JWTProviderInterface):
         """
         Проверить и декодировать Access токен
 
+        Проверенные токены кэшируются до их exp: повторные запросы с тем же
+        токеном не проверяют подпись и не разбирают payload заново.
+
         Args:
             token: JWT access токен
 
         Returns:
             Данные из токена или None, если токен невалидный
         """
+        if self._verified_cache_max_entries <= 0:
+            return self._decode_access_token(token)
+
+        key = hashlib.sha256(token.encode()).digest()
+        entry = self._verified_cache.get(key)
+
+        if entry is not None:
+            exp, payload = entry
+
+            if exp > time.time():
+                self._verified_cache.move_to_end(key)
+                self._cache_hits += 1
+                return dict(payload)
+
+            # Токен истек: повторная проверка тоже вернула бы None
+            del self._verified_cache[key]
+            return None
+
+        self._cache_misses += 1
+        payload = self._decode_access_token(token)
+
+        if payload is None or not isinstance(payload.get("exp"), (int, float)):
+            return payload
+
+        self._verified_cache[key] = (float(payload["exp"]), dict(payload))
+
+        if len(self._verified_cache) > self._verified_cache_max_entries:
+            self._verified_cache.popitem(last=False)
+            self._cache_evictions += 1
+
+        return payload
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Получить счетчики кэша проверенных access токенов"""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "evictions": self._cache_evictions,
+            "size": len(self._verified_cache),
+            "max_entries": self._verified_cache_max_entries,
+        }
+
+    def get_jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Получить открытые ключи проверки токенов (JWKS)"""
+        return self._signing_backend.get_jwks()
+
+    def _decode_access_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """Проверить подпись и срок действия токена"""
         try:
+            backend = self._signing_backend
+            kid = jwt.get_unverified_header(token).get("kid")
+            key = backend.get_verification_key(kid)
+
+            if key is None:
+                return None
+
             payload = jwt.decode(
                 token,
-                self.secret_key,
-                algorithms=[self.algorithm],
+                key,
+                algorithms=[backend.algorithm],
             )
 
             if payload.get("type") != "access":
@@ -237,10 +327,27 @@ class JWTProvider(JWTProviderInterface):
         return datetime.now().timestamp() > exp
 
 
+def create_signing_backend() -> JWTSigningBackend:
+    """Создать ключи подписи по настройкам (один раз при старте)"""
+    if settings.auth.keys_dir:
+        return AsymmetricSigningBackend.from_directory(
+            settings.auth.keys_dir,
+            active_kid=settings.auth.active_kid,
+            algorithm=settings.auth.algorithm,
+        )
+
+    return HMACSigningBackend(
+        settings.auth.secret_key,
+        settings.auth.algorithm,
+    )
+
+
 # Глобальный экземпляр JWT сервиса
 jwt_provider = JWTProvider(
     secret_key=settings.auth.secret_key,
     algorithm=settings.auth.algorithm,
     access_token_expire_minutes=settings.auth.access_token_expire_minutes,
     refresh_token_expire_days=settings.auth.refresh_token_expire_days,
+    verified_cache_max_entries=settings.auth.verified_token_cache_max_entries,
+    signing_backend=create_signing_backend(),
 )
@@ -0,0 +1,120 @@
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import (
+    ec,
+    ed25519,
+)
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+from core.interfaces.auth import JWTSigningBackend
+
+
+class HMACSigningBackend(JWTSigningBackend):
+    """Подпись общим секретом (HS256 и т.п.): ключи не публикуются"""
+
+    def __init__(self, secret_key: str, algorithm: str = "HS256") -> None:
+        self.algorithm = algorithm
+        self.kid: Optional[str] = None
+        self._secret_key = secret_key
+
+    @property
+    def signing_key(self) -> Any:
+        return self._secret_key
+
+    def get_verification_key(self, kid: Optional[str]) -> Optional[Any]:
+        return self._secret_key
+
+    def get_jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        return {"keys": []}
+
+
+class AsymmetricSigningBackend(JWTSigningBackend):
+    """
+    Подпись закрытым ключом (EdDSA / ES256) с ротацией по kid.
+
+    Ключи разбираются из PEM один раз при создании и хранятся как объекты
+    cryptography - при подписи и проверке PEM не парсится повторно.
+    Токены подписываются активным ключом, проверяются любым загруженным:
+    после ротации старый ключ остается, пока не истекут его токены.
+    Открытые ключи публикуются в JWKS для локальной проверки токенов.
+    """
+
+    SUPPORTED_KEY_TYPES = {
+        "EdDSA": ed25519.Ed25519PrivateKey,
+        "ES256": ec.EllipticCurvePrivateKey,
+    }
+
+    def __init__(
+        self,
+        private_keys: Dict[str, Any],
+        active_kid: str,
+        algorithm: str,
+    ) -> None:
+        """
+        Args:
+            private_keys: kid -> объект закрытого ключа
+            active_kid: kid ключа для подписи новых токенов
+            algorithm: EdDSA или ES256
+        """
+        if algorithm not in self.SUPPORTED_KEY_TYPES:
+            raise ValueError(f"Алгоритм {algorithm} не поддерживается")
+
+        if active_kid not in private_keys:
+            raise ValueError(f"Ключ {active_kid} не найден")
+
+        key_type = self.SUPPORTED_KEY_TYPES[algorithm]
+        for kid, key in private_keys.items():
+            if not isinstance(key, key_type):
+                raise ValueError(f"Ключ {kid} не подходит для {algorithm}")
+
+        self.algorithm = algorithm
+        self.kid: Optional[str] = active_kid
+        self._private_keys = private_keys
+        self._public_keys = {
+            kid: key.public_key() for kid, key in private_keys.items()
+        }
+        self._jwks = self._build_jwks()
+
+    @classmethod
+    def from_directory(
+        cls,
+        keys_dir: str,
+        active_kid: str,
+        algorithm: str,
+    ) -> "AsymmetricSigningBackend":
+        """Загрузить ключи из каталога: файл <kid>.pem на каждый ключ"""
+        private_keys = {
+            path.stem: load_pem_private_key(path.read_bytes(), password=None)
+            for path in sorted(Path(keys_dir).glob("*.pem"))
+        }
+        return cls(private_keys, active_kid, algorithm)
+
+    @property
+    def signing_key(self) -> Any:
+        return self._private_keys[self.kid]
+
+    def get_verification_key(self, kid: Optional[str]) -> Optional[Any]:
+        if kid is None:
+            return None
+        return self._public_keys.get(kid)
+
+    def get_jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        return self._jwks
+
+    def _build_jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        algorithm = jwt.get_algorithm_by_name(self.algorithm)
+        keys = []
+
+        for kid, public_key in self._public_keys.items():
+            jwk = algorithm.to_jwk(public_key, as_dict=True)
+            jwk.update({"kid": kid, "use": "sig", "alg": self.algorithm})
+            keys.append(jwk)
+
+        return {"keys": keys}
@@ -0,0 +1,61 @@
+import time
+from typing import Optional
+from uuid import UUID
+
+from core.config import settings
+from core.interfaces.common import ReadYourWritesTracker
+
+
+class ClientMarkReadYourWritesProvider(ReadYourWritesTracker):
+    """
+    Имплементация ReadYourWritesTracker на метке, хранимой клиентом.
+
+    После записи клиенту выдается метка "<user_uuid>:<unix time>", которую
+    он возвращает в последующих запросах (cookie или заголовок). В течение
+    window_seconds после записи его чтения идут в основную БД, а не в
+    реплику, и он видит собственные изменения на любом воркере.
+    Окно выбирается больше типичного отставания реплики.
+
+    Подделанная метка влияет только на то, откуда читает сам клиент.
+    """
+
+    def __init__(self, window_seconds: float = 5.0) -> None:
+        """
+        Args:
+            window_seconds: Сколько секунд после записи читать из основной БД
+        """
+        self._window = window_seconds
+
+    @property
+    def window_seconds(self) -> float:
+        """Сколько секунд после записи метка остается действительной"""
+        return self._window
+
+    def mark_write(self, user_uuid: UUID) -> str:
+        """Отметить запись пользователя и получить метку для клиента"""
+        return f"{user_uuid}:{time.time():.3f}"
+
+    def wrote_recently(self, user_uuid: UUID, client_mark: Optional[str]) -> bool:
+        """Проверить по метке клиента, писал ли пользователь в пределах окна"""
+        if not client_mark:
+            return False
+
+        try:
+            mark_user, mark_time = client_mark.split(":", 1)
+            written_at = float(mark_time)
+            mark_user_uuid = UUID(mark_user)
+        except ValueError:
+            return False
+
+        # Метка другого пользователя (общий браузер) не учитывается; модуль
+        # разницы допускает небольшое расхождение часов между воркерами
+        return (
+            mark_user_uuid == user_uuid
+            and abs(time.time() - written_at) <= self._window
+        )
+
+
+# Глобальный учет записей для маршрутизации чтений
+read_your_writes_tracker = ClientMarkReadYourWritesProvider(
+    window_seconds=settings.db_config.read_your_writes_seconds,
+)
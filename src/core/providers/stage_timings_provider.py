@@ -0,0 +1,80 @@
+import bisect
+import time
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Sequence,
+)
+
+from core.interfaces.common import StageTimings
+
+
+class StageTimingsProvider(StageTimings):
+    """
+    Имплементация StageTimings: гистограммы с фиксированными границами.
+
+    Для каждого этапа хранится количество наблюдений по корзинам
+    (верхняя граница в миллисекундах), общее число и сумма. По ним
+    оцениваются перцентили и нагрузка на этапы при всплесках.
+    """
+
+    DEFAULT_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS) -> None:
+        """
+        Args:
+            buckets_ms: Верхние границы корзин в миллисекундах (по возрастанию)
+        """
+        self._buckets_ms = tuple(sorted(buckets_ms))
+        # stage -> счетчики корзин (последняя - больше всех границ)
+        self._counts: Dict[str, List[int]] = {}
+        self._sums_ms: Dict[str, float] = {}
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Учесть длительность этапа"""
+        value_ms = seconds * 1000
+
+        counts = self._counts.get(stage)
+        if counts is None:
+            counts = self._counts[stage] = [0] * (len(self._buckets_ms) + 1)
+            self._sums_ms[stage] = 0.0
+
+        counts[bisect.bisect_left(self._buckets_ms, value_ms)] += 1
+        self._sums_ms[stage] += value_ms
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Замерить длительность блока кода как этап stage"""
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started_at)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Получить гистограммы по этапам"""
+        stats: Dict[str, Dict[str, Any]] = {}
+
+        for stage, counts in self._counts.items():
+            total = sum(counts)
+            buckets = {
+                f"<={bound}ms": count
+                for bound, count in zip(self._buckets_ms, counts)
+            }
+            buckets[f">{self._buckets_ms[-1]}ms"] = counts[-1]
+
+            stats[stage] = {
+                "count": total,
+                "sum_ms": round(self._sums_ms[stage], 3),
+                "avg_ms": round(self._sums_ms[stage] / total, 3) if total else 0.0,
+                "buckets": buckets,
+            }
+
+        return stats
+
+
+# Гистограммы этапов входа в систему
+login_timings = StageTimingsProvider()
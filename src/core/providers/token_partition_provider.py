@@ -0,0 +1,144 @@
+import re
+from datetime import (
+    date,
+    datetime,
+)
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.interfaces.auth import TokenPartitionManager
+
+
+class TokenPartitionManagerProvider(TokenPartitionManager):
+    """
+    Имплементация TokenPartitionManager для PostgreSQL.
+
+    Таблица usertokens разбита на месячные диапазоны по expires_at
+    (партиции usertokens_pYYYYMM, см. миграцию partition_usertokens).
+    Партиция, все токены которой истекли, удаляется целиком, без
+    построчного DELETE и разрастания индексов.
+
+    Партиции по умолчанию нет (с ней невозможен DETACH CONCURRENTLY),
+    поэтому партиции должны создаваться заранее, на срок жизни токенов.
+    """
+
+    TABLE_NAME = "usertokens"
+    PARTITION_NAME_RE = re.compile(r"^usertokens_p(\d{4})(\d{2})$")
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def is_partitioned(self) -> bool:
+        """Проверить, секционирована ли таблица токенов"""
+        stmt = text(
+            "SELECT EXISTS ("
+            "SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass(:table_name))"
+        )
+        result = await self._session.execute(stmt, {"table_name": self.TABLE_NAME})
+        return bool(result.scalar())
+
+    async def ensure_partitions(self, now: datetime, months_ahead: int) -> int:
+        """Создать месячные партиции от текущего месяца на months_ahead вперед"""
+
+        month = self.month_start(now)
+        created = 0
+
+        for _ in range(months_ahead + 1):
+            next_month = self.add_month(month)
+            name = self.partition_name(month)
+
+            result = await self._session.execute(
+                text("SELECT to_regclass(:name) IS NULL"),
+                {"name": name},
+            )
+            if result.scalar():
+                await self._session.execute(
+                    text(
+                        f"CREATE TABLE {name} PARTITION OF {self.TABLE_NAME} "
+                        f"FOR VALUES FROM ('{month.isoformat()}') "
+                        f"TO ('{next_month.isoformat()}')"
+                    )
+                )
+                created += 1
+
+            month = next_month
+
+        return created
+
+    async def drop_expired_partitions(self, expired_before: datetime) -> List[str]:
+        """
+        Удалить партиции, верхняя граница которых не позже expired_before.
+
+        DROP TABLE присоединенной партиции берет ACCESS EXCLUSIVE на всю
+        usertokens и останавливает вход и обновление токенов. Поэтому
+        партиция сначала отсоединяется через DETACH PARTITION CONCURRENTLY
+        (на родителе только SHARE UPDATE EXCLUSIVE), а удаляется уже
+        отдельная таблица. CONCURRENTLY не выполняется внутри транзакции,
+        так что работа идет в отдельном соединении в режиме autocommit.
+        """
+
+        dropped: List[str] = []
+
+        async with self._session.bind.connect() as connection:
+            connection = await connection.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+            result = await connection.execute(
+                text(
+                    "SELECT c.relname, i.inhdetachpending FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = to_regclass(:table_name)"
+                ),
+                {"table_name": self.TABLE_NAME},
+            )
+
+            for name, detach_pending in result.all():
+                match = self.PARTITION_NAME_RE.match(name)
+                if not match:
+                    # Чужие таблицы не трогаем
+                    continue
+
+                month = date(int(match.group(1)), int(match.group(2)), 1)
+                upper_bound = datetime.combine(
+                    self.add_month(month),
+                    datetime.min.time(),
+                )
+                if upper_bound > expired_before:
+                    continue
+
+                if detach_pending:
+                    # Прошлый DETACH CONCURRENTLY прервался между транзакциями
+                    detach = "FINALIZE"
+                else:
+                    detach = "CONCURRENTLY"
+
+                await connection.execute(
+                    text(
+                        f"ALTER TABLE {self.TABLE_NAME} "
+                        f"DETACH PARTITION {name} {detach}"
+                    )
+                )
+                await connection.execute(text(f"DROP TABLE {name}"))
+                dropped.append(name)
+
+        return dropped
+
+    @classmethod
+    def partition_name(cls, month: date) -> str:
+        """Имя партиции месяца: usertokens_pYYYYMM"""
+        return f"{cls.TABLE_NAME}_p{month.year:04d}{month.month:02d}"
+
+    @staticmethod
+    def month_start(value: datetime) -> date:
+        """Первое число месяца"""
+        return date(value.year, value.month, 1)
+
+    @staticmethod
+    def add_month(month: date) -> date:
+        """Первое число следующего месяца"""
+        if month.month == 12:
+            return date(month.year + 1, 1, 1)
+        return date(month.year, month.month + 1, 1)
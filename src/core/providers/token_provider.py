@@ -1,8 +1,24 @@
 from datetime import datetime
-from typing import List, Optional
-from uuid import UUID
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+from uuid import (
+    UUID,
+    uuid4,
+)
 
-from sqlalchemy import and_, select
+from sqlalchemy import (
+    and_,
+    delete,
+    insert,
+    literal,
+    select,
+    true,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.interfaces.auth import TokenRepository
@@ -10,6 +26,7 @@ from core.models.user_token import (
     TokenType,
     UserToken,
 )
+from users.models import User
 
 
 class TokenRepositoryProvider(TokenRepository):
@@ -43,6 +60,28 @@ class TokenRepositoryProvider(TokenRepository):
         await self._session.refresh(token)
         return token
 
+    async def add_token(
+        self,
+        user_uuid: UUID,
+        token_hash: str,
+        token_type: TokenType,
+        expires_at: datetime,
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+    ) -> None:
+        """Добавить токен одним INSERT, без загрузки созданной строки"""
+        stmt = insert(UserToken).values(
+            uuid=uuid4(),
+            user_uuid=user_uuid,
+            token_hash=token_hash,
+            token_type=token_type,
+            expires_at=expires_at,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            is_active=True,
+        )
+        await self._session.execute(stmt)
+
     async def get_token_by_hash(
         self,
         token_hash: str,
@@ -72,45 +111,64 @@ class TokenRepositoryProvider(TokenRepository):
         token_type: TokenType,
     ) -> int:
         """Деактивировать все токены пользователя определенного типа"""
-        stmt = select(UserToken).where(
-            and_(
-                UserToken.user_uuid == user_uuid,
-                UserToken.token_type == token_type,
-                UserToken.is_active == True,  # noqa: E712
+        # Один UPDATE вместо загрузки каждого токена в сессию
+        stmt = (
+            update(UserToken)
+            .where(
+                and_(
+                    UserToken.user_uuid == user_uuid,
+                    UserToken.token_type == token_type,
+                    UserToken.is_active == True,  # noqa: E712
+                )
             )
+            .values(is_active=False)
+            # Условия вычислимы в Python: загруженные токены обновляются
+            # без RETURNING, число строк берется из rowcount
+            .execution_options(synchronize_session="evaluate")
         )
 
         result = await self._session.execute(stmt)
-
-        tokens = result.scalars().all()
-
-        count = 0
-
-        for token in tokens:
-            token.is_active = False
-            count += 1
-
-        await self._session.flush()
-
-        return count
+        return result.rowcount
 
     async def cleanup_expired_tokens(self) -> int:
         """Удалить все просроченные токены"""
 
-        now = datetime.now()
-        stmt = select(UserToken).where(UserToken.expires_at < now)
+        stmt = (
+            delete(UserToken)
+            .where(UserToken.expires_at < datetime.now())
+            .execution_options(synchronize_session="evaluate")
+        )
+
         result = await self._session.execute(stmt)
+        return result.rowcount
 
-        expired_tokens = result.scalars().all()
+    async def delete_expired_tokens_batch(
+        self,
+        batch_size: int,
+        expired_before: datetime,
+    ) -> int:
+        """
+        Удалить одну порцию просроченных токенов.
 
-        count = 0
+        Строки, заблокированные другими транзакциями, пропускаются
+        (SKIP LOCKED), поэтому очистка не ждет логины и ротации.
+        """
+        batch = (
+            select(UserToken.uuid)
+            .where(UserToken.expires_at < expired_before)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
 
-        for token in expired_tokens:
-            await self._session.delete(token)
-            count += 1
+        stmt = (
+            delete(UserToken)
+            .where(UserToken.uuid.in_(batch))
+            .execution_options(synchronize_session=False)
+        )
 
-        await self._session.flush()
-        return count
+        result = await self._session.execute(stmt)
+        return result.rowcount
 
     async def get_user_active_tokens(
         self,
@@ -134,50 +192,95 @@ class TokenRepositoryProvider(TokenRepository):
 
         return list(result.scalars().all())
 
-    async def rotate_refresh_token(
+    async def rotate_refresh_token_by_hash(
         self,
         old_token_hash: str,
         new_token_hash: str,
         new_expires_at: datetime,
-        user_uuid: UUID,
-    ) -> Optional[UserToken]:
+    ) -> Optional[Dict[str, Any]]:
         """
-        Заменить старый refresh токен на новый
-
-        Args:
-            old_token_hash: Хэш старого токена
-            new_token_hash: Хэш нового токена
-            new_expires_at: Время истечения нового токена
-            user_uuid: UUID пользователя для проверки
+        Заменить refresh токен на новый одним запросом.
 
+        UPDATE ... RETURNING деактивирует старый токен, только если он
+        активен, не истек и принадлежит активному пользователю, и передает
+        его данные в INSERT нового токена (оба шага - CTE одного запроса).
 
         Returns:
-            Новый токен или None, если старый не найден
+            {"user_uuid", "role", "team_uuid"} владельца или None,
+            если токен недействителен или пользователь не активен
         """
+        now = datetime.now()
 
-        # Найти старый токен
-        old_token = await self.get_token_by_hash(
-            old_token_hash,
-            TokenType.REFRESH,
+        rotated = (
+            update(UserToken)
+            .where(
+                and_(
+                    UserToken.token_hash == old_token_hash,
+                    UserToken.token_type == TokenType.REFRESH,
+                    UserToken.is_active == True,  # noqa: E712
+                    UserToken.expires_at > now,
+                    User.uuid == UserToken.user_uuid,
+                    User.is_active == True,  # noqa: E712
+                )
+            )
+            .values(is_active=False, updated_at=now)
+            .returning(
+                UserToken.user_uuid,
+                UserToken.token_type,
+                UserToken.ip_address,
+                UserToken.user_agent,
+                User.role,
+                User.team_uuid,
+            )
+            .cte("rotated")
         )
 
-        if not old_token or old_token.user_uuid != user_uuid:
-            return None
+        inserted = (
+            insert(UserToken)
+            .from_select(
+                [
+                    "uuid",
+                    "user_uuid",
+                    "token_hash",
+                    "token_type",
+                    "expires_at",
+                    "is_active",
+                    "ip_address",
+                    "user_agent",
+                ],
+                select(
+                    literal(uuid4(), UserToken.uuid.type),
+                    rotated.c.user_uuid,
+                    literal(new_token_hash, UserToken.token_hash.type),
+                    rotated.c.token_type,
+                    literal(new_expires_at, UserToken.expires_at.type),
+                    true(),
+                    rotated.c.ip_address,
+                    rotated.c.user_agent,
+                ),
+                include_defaults=False,
+            )
+            .returning(UserToken.user_uuid)
+            .cte("inserted")
+        )
 
-        # Деактивировать старый
-        await self.deactivate_token(old_token)
+        stmt = select(
+            rotated.c.user_uuid,
+            rotated.c.role,
+            rotated.c.team_uuid,
+        ).join(inserted, inserted.c.user_uuid == rotated.c.user_uuid)
 
-        # Создать новый
-        new_token = await self.create_token(
-            user_uuid=user_uuid,
-            token_hash=new_token_hash,
-            token_type=TokenType.REFRESH,
-            expires_at=new_expires_at,
-            ip_address=old_token.ip_address,
-            user_agent=old_token.user_agent,
-        )
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
+
+        if row is None:
+            return None
 
-        return new_token
+        return {
+            "user_uuid": row.user_uuid,
+            "role": row.role,
+            "team_uuid": row.team_uuid,
+        }
 
     async def revoke_all_user_sessions(self, user_uuid: UUID) -> int:
         """Отозвать все сессии пользователя"""
@@ -0,0 +1,74 @@
+import time
+from typing import (
+    Dict,
+    Optional,
+)
+from uuid import UUID
+
+from core.config import settings
+from core.interfaces.auth import AccessTokenRevocationRegistry
+
+
+class InMemoryTokenRevocationProvider(AccessTokenRevocationRegistry):
+    """
+    Имплементация AccessTokenRevocationRegistry в памяти процесса.
+
+    Для пользователя и команды хранится момент последнего изменения прав.
+    Токен, выданный не позже этого момента, считается устаревшим, и
+    пользователь загружается из БД. Отметки старше времени жизни access
+    токена не нужны и удаляются. Реестр локален для воркера, поэтому
+    stateless-режим включается только при одном воркере или при
+    допустимом устаревании прав на время жизни access токена.
+    """
+
+    def __init__(self, retention_seconds: int = 30 * 60) -> None:
+        """
+        Args:
+            retention_seconds: Сколько хранить отметку (время жизни access токена)
+        """
+        self._retention = retention_seconds
+        self._users: Dict[UUID, float] = {}
+        self._teams: Dict[UUID, float] = {}
+
+    def revoke_user(self, user_uuid: UUID) -> None:
+        """Отметить изменение прав пользователя"""
+        self._revoke(self._users, user_uuid)
+
+    def revoke_team(self, team_uuid: UUID) -> None:
+        """Отметить изменение состава команды"""
+        self._revoke(self._teams, team_uuid)
+
+    def is_revoked(
+        self,
+        user_uuid: UUID,
+        team_uuid: Optional[UUID],
+        issued_at: int,
+    ) -> bool:
+        """Проверить, устарели ли claims токена, выданного в issued_at"""
+
+        # iat округлен до секунды вниз: токен той же секунды, что и отметка,
+        # считается устаревшим (лишний запрос в БД безопаснее лишнего доступа)
+        user_mark = self._users.get(user_uuid)
+        if user_mark is not None and issued_at <= user_mark:
+            return True
+
+        if team_uuid is not None:
+            team_mark = self._teams.get(team_uuid)
+            if team_mark is not None and issued_at <= team_mark:
+                return True
+
+        return False
+
+    def _revoke(self, marks: Dict[UUID, float], key: UUID) -> None:
+        now = time.time()
+        marks[key] = now
+
+        # Токены старше retention истекли сами, их отметки больше не нужны
+        threshold = now - self._retention
+        for stale_key in [k for k, mark in marks.items() if mark < threshold]:
+            del marks[stale_key]
+
+
+token_revocation_registry = InMemoryTokenRevocationProvider(
+    retention_seconds=settings.auth.access_token_expire_minutes * 60,
+)
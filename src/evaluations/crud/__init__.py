@@ -1,5 +1,7 @@
 __all__ = (
     "EvaluationCRUD",
+    "EvaluationRollupCRUD",
 )
 
-from .evaluations import EvaluationCRUD
\ No newline at end of file
+from .evaluations import EvaluationCRUD
+from .rollups import EvaluationRollupCRUD
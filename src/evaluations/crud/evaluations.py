@@ -1,12 +1,17 @@
 from datetime import datetime, timedelta
 from typing import (
+    Any,
+    Dict,
     List,
     Optional,
 )
 from uuid import UUID
 
 from sqlalchemy import (
+    Float,
     and_,
+    case,
+    cast,
     desc,
     func,
     select,
@@ -15,9 +20,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from evaluations.interfaces import EvaluationRepository
-from evaluations.models import Evaluation, ScoresEnum
+from evaluations.models import (
+    SCORE_VALUES,
+    Evaluation,
+    ScoresEnum,
+)
 from tasks.models import Task
 
+# Числовое значение оценки на стороне БД
+score_value = case(
+    *((Evaluation.score == score, value) for score, value in SCORE_VALUES.items())
+)
+
 
 class EvaluationCRUD(EvaluationRepository):
     """Имплементация EvaluationRepository"""
@@ -144,28 +158,61 @@ class EvaluationCRUD(EvaluationRepository):
 
     async def calculate_user_average_score(self, user_uuid: UUID) -> Optional[float]:
         """Вычислить среднюю оценку пользователя"""
-        # Преобразуем ScoresEnum в числовые значения
-        score_values = {
-            ScoresEnum.UNACCEPTABLE: 1,
-            ScoresEnum.BAD: 2,
-            ScoresEnum.SATISFACTORY: 3,
-            ScoresEnum.GOOD: 4,
-            ScoresEnum.GREAT: 5,
-        }
-
-        # Получаем все оценки пользователя
-        stmt = select(Evaluation.score).where(
+        stmt = select(cast(func.avg(score_value), Float)).where(
             Evaluation.evaluated_user_uuid == user_uuid
         )
+
         result = await self._session.execute(stmt)
-        scores = result.scalars().all()
+        return result.scalar()
+
+    async def get_evaluation_stats(
+        self,
+        user_uuid: Optional[UUID] = None,
+        team_uuid: Optional[UUID] = None,
+        days: int = 30,
+    ) -> Dict[str, Any]:
+        """
+        Получить статистику оценок пользователя или команды одним запросом.
+
+        Возвращает:
+            average_score: средний балл (None, если оценок нет)
+            total: всего оценок
+            recent: оценок за последние days дней
+            score_distribution: количество оценок по типам
+        """
+        since_date = datetime.now() - timedelta(days=days)
+
+        stmt = select(
+            cast(func.avg(score_value), Float).label("average_score"),
+            func.count(Evaluation.uuid).label("total"),
+            func.count(Evaluation.uuid)
+            .filter(Evaluation.created_at >= since_date)
+            .label("recent"),
+            *(
+                func.count(Evaluation.uuid)
+                .filter(Evaluation.score == score)
+                .label(score.name)
+                for score in ScoresEnum
+            ),
+        )
 
-        if not scores:
-            return None
+        if user_uuid:
+            stmt = stmt.where(Evaluation.evaluated_user_uuid == user_uuid)
 
-        # Вычисляем среднее
-        numeric_scores = [score_values[score] for score in scores]
-        return sum(numeric_scores) / len(numeric_scores)
+        if team_uuid:
+            stmt = stmt.join(Task, Evaluation.task_uuid == Task.uuid)
+            stmt = stmt.where(Task.team_uuid == team_uuid)
+
+        row = (await self._session.execute(stmt)).one()
+
+        return {
+            "average_score": row.average_score,
+            "total": row.total,
+            "recent": row.recent,
+            "score_distribution": {
+                score: getattr(row, score.name) for score in ScoresEnum
+            },
+        }
 
     async def get_user_score_distribution(
         self,
@@ -0,0 +1,234 @@
+from datetime import datetime
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Type,
+    Union,
+)
+from uuid import UUID
+
+from sqlalchemy import (
+    delete,
+    func,
+    insert,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from evaluations.crud.evaluations import score_value
+from evaluations.interfaces import EvaluationRollupRepository
+from evaluations.models import (
+    SCORE_VALUES,
+    Evaluation,
+    ScoresEnum,
+    TeamEvaluationRollup,
+    UserEvaluationRollup,
+    score_count_column,
+)
+from tasks.models import Task
+
+Rollup = Union[UserEvaluationRollup, TeamEvaluationRollup]
+
+# Колонки сводки в порядке агрегатов _rollup_aggregates()
+ROLLUP_COLUMNS = (
+    "evaluations_count",
+    "score_sum",
+    *(score_count_column(score) for score in ScoresEnum),
+    "last_evaluated_at",
+)
+
+
+def _rollup_aggregates() -> list:
+    """Агрегаты по оценкам, из которых строится сводка"""
+    return [
+        func.count(Evaluation.uuid),
+        func.coalesce(func.sum(score_value), 0),
+        *(
+            func.count(Evaluation.uuid).filter(Evaluation.score == score)
+            for score in ScoresEnum
+        ),
+        func.max(Evaluation.created_at),
+    ]
+
+
+class EvaluationRollupCRUD(EvaluationRollupRepository):
+    """Имплементация EvaluationRollupRepository"""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def apply_score(
+        self,
+        score: ScoresEnum,
+        delta: int,
+        evaluated_user_uuid: Optional[UUID] = None,
+        team_uuid: Optional[UUID] = None,
+        evaluated_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Учесть (delta=1) или исключить (delta=-1) оценку в сводках.
+
+        Изменения - атомарные инкременты в текущей транзакции, поэтому
+        параллельные оценки одного пользователя не теряют обновлений.
+        """
+        if evaluated_user_uuid is not None:
+            await self._apply(
+                UserEvaluationRollup,
+                "user_uuid",
+                evaluated_user_uuid,
+                score,
+                delta,
+                evaluated_at,
+                select(func.max(Evaluation.created_at))
+                .where(Evaluation.evaluated_user_uuid == evaluated_user_uuid)
+                .scalar_subquery(),
+            )
+
+        if team_uuid is not None:
+            await self._apply(
+                TeamEvaluationRollup,
+                "team_uuid",
+                team_uuid,
+                score,
+                delta,
+                evaluated_at,
+                select(func.max(Evaluation.created_at))
+                .join(Task, Evaluation.task_uuid == Task.uuid)
+                .where(Task.team_uuid == team_uuid)
+                .scalar_subquery(),
+            )
+
+    async def _apply(
+        self,
+        model: Type[Rollup],
+        key: str,
+        key_value: UUID,
+        score: ScoresEnum,
+        delta: int,
+        evaluated_at: Optional[datetime],
+        last_evaluated_at: ColumnElement[Any],
+    ) -> None:
+        """Применить изменение к одной строке сводки"""
+        score_column = score_count_column(score)
+        increments = {
+            "evaluations_count": model.evaluations_count + delta,
+            "score_sum": model.score_sum + delta * SCORE_VALUES[score],
+            score_column: getattr(model, score_column) + delta,
+            "updated_at": func.now(),
+        }
+
+        if delta > 0:
+            stmt = pg_insert(model).values(
+                {
+                    key: key_value,
+                    "evaluations_count": delta,
+                    "score_sum": delta * SCORE_VALUES[score],
+                    score_column: delta,
+                    "last_evaluated_at": evaluated_at,
+                }
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[key],
+                set_={
+                    **increments,
+                    # GREATEST пропускает NULL
+                    "last_evaluated_at": func.greatest(
+                        model.last_evaluated_at,
+                        stmt.excluded.last_evaluated_at,
+                    ),
+                },
+            )
+        else:
+            # Время последней оценки пересчитываем: удаленная могла быть последней
+            stmt = (
+                update(model)
+                .where(getattr(model, key) == key_value)
+                .values(**increments, last_evaluated_at=last_evaluated_at)
+            )
+
+        await self._session.execute(stmt)
+
+    async def get_user_stats(self, user_uuid: UUID) -> Dict[str, Any]:
+        """Получить статистику оценок пользователя из сводки"""
+        stmt = select(UserEvaluationRollup).where(
+            UserEvaluationRollup.user_uuid == user_uuid
+        )
+        result = await self._session.execute(stmt)
+        return self._to_stats(result.scalar_one_or_none())
+
+    async def get_team_stats(self, team_uuid: UUID) -> Dict[str, Any]:
+        """Получить статистику оценок команды из сводки"""
+        stmt = select(TeamEvaluationRollup).where(
+            TeamEvaluationRollup.team_uuid == team_uuid
+        )
+        result = await self._session.execute(stmt)
+        return self._to_stats(result.scalar_one_or_none())
+
+    @staticmethod
+    def _to_stats(rollup: Optional[Rollup]) -> Dict[str, Any]:
+        """Преобразовать сводку в формат EvaluationRepository.get_evaluation_stats"""
+        if rollup is None or rollup.evaluations_count <= 0:
+            return {
+                "average_score": None,
+                "total": 0,
+                "score_distribution": {score: 0 for score in ScoresEnum},
+                "last_evaluated_at": None,
+            }
+
+        return {
+            "average_score": rollup.score_sum / rollup.evaluations_count,
+            "total": rollup.evaluations_count,
+            "score_distribution": {
+                score: getattr(rollup, score_count_column(score))
+                for score in ScoresEnum
+            },
+            "last_evaluated_at": rollup.last_evaluated_at,
+        }
+
+    async def rebuild(self) -> Dict[str, int]:
+        """
+        Пересчитать сводки по таблице оценок.
+
+        Нужен после первого развертывания и если сводки разошлись с
+        оценками (изменения в обход интеракторов, ручные правки в БД).
+        На время пересчета запись в evaluations блокируется.
+        """
+        await self._session.execute(text("LOCK TABLE evaluations IN SHARE MODE"))
+        await self._session.execute(delete(UserEvaluationRollup))
+        await self._session.execute(delete(TeamEvaluationRollup))
+
+        users_stmt = insert(UserEvaluationRollup).from_select(
+            ["uuid", "user_uuid", *ROLLUP_COLUMNS],
+            select(
+                func.gen_random_uuid(),
+                Evaluation.evaluated_user_uuid,
+                *_rollup_aggregates(),
+            )
+            .where(Evaluation.evaluated_user_uuid.is_not(None))
+            .group_by(Evaluation.evaluated_user_uuid),
+        )
+        users_result = await self._session.execute(users_stmt)
+
+        teams_stmt = insert(TeamEvaluationRollup).from_select(
+            ["uuid", "team_uuid", *ROLLUP_COLUMNS],
+            select(
+                func.gen_random_uuid(),
+                Task.team_uuid,
+                *_rollup_aggregates(),
+            )
+            .select_from(Evaluation)
+            .join(Task, Evaluation.task_uuid == Task.uuid)
+            .where(Task.team_uuid.is_not(None))
+            .group_by(Task.team_uuid),
+        )
+        teams_result = await self._session.execute(teams_stmt)
+
+        return {
+            "users": users_result.rowcount,
+            "teams": teams_result.rowcount,
+        }
@@ -7,6 +7,7 @@ __all__ = (
     "QueryEvaluationsInteractor",
     "GetUserEvaluationStatsInteractor",
     "GetTeamEvaluationStatsInteractor",
+    "RebuildEvaluationRollupsInteractor",
 )
 
 from .evaluation_interactors import (
@@ -17,5 +18,6 @@ from .evaluation_interactors import (
     GetTeamEvaluationStatsInteractor,
     GetUserEvaluationStatsInteractor,
     QueryEvaluationsInteractor,
+    RebuildEvaluationRollupsInteractor,
     UpdateEvaluationInteractor,
 )
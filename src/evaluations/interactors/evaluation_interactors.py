@@ -9,7 +9,10 @@ from core.interfaces import (
     PermissionValidator,
     UUIDGenerator,
 )
-from evaluations.interfaces import EvaluationRepository
+from evaluations.interfaces import (
+    EvaluationRepository,
+    EvaluationRollupRepository,
+)
 from evaluations.models import (
     Evaluation,
     ScoresEnum,
@@ -18,8 +21,12 @@ from evaluations.schemas.evaluation import EvaluationUpdate
 from users.models import User
 from tasks.interfaces import TaskRepository
 from tasks.models import StatusEnum
-from users.interfaces import UserRepository
+from users.interfaces import (
+    UserRepository,
+    UserStatsCache,
+)
 from users.models import RoleEnum
+from users.providers import invalidate_user_stats
 
 
 class CreateEvaluationDTO:
@@ -51,6 +58,8 @@ class CreateEvaluationInteractor:
         permission_validator: Optional[PermissionValidator],
         uuid_generator: UUIDGenerator,
         db_session: DBSession,
+        rollup_repo: Optional[EvaluationRollupRepository] = None,
+        stats_cache: Optional[UserStatsCache] = None,
     ) -> None:
         self._evaluation_repo = evaluation_repo
         self._task_repo = task_repo
@@ -58,6 +67,8 @@ class CreateEvaluationInteractor:
         self._permission_validator = permission_validator
         self._uuid_generator = uuid_generator
         self._db_session = db_session
+        self._rollup_repo = rollup_repo
+        self._stats_cache = stats_cache
 
     async def __call__(
         self,
@@ -129,7 +140,22 @@ class CreateEvaluationInteractor:
             created_evaluation = await self._evaluation_repo.create_evaluation(
                 evaluation
             )
+
+            # 6. Учесть оценку в сводках (в той же транзакции)
+            if self._rollup_repo:
+                await self._rollup_repo.apply_score(
+                    score=created_evaluation.score,
+                    delta=1,
+                    evaluated_user_uuid=created_evaluation.evaluated_user_uuid,
+                    team_uuid=task.team_uuid,
+                    evaluated_at=created_evaluation.created_at,
+                )
+
             await self._db_session.commit()
+            invalidate_user_stats(
+                self._stats_cache,
+                created_evaluation.evaluated_user_uuid,
+            )
             return created_evaluation
 
         except Exception:
@@ -228,11 +254,15 @@ class UpdateEvaluationInteractor:
         user_repo: UserRepository,
         permission_validator: Optional[PermissionValidator],
         db_session: DBSession,
+        rollup_repo: Optional[EvaluationRollupRepository] = None,
+        stats_cache: Optional[UserStatsCache] = None,
     ) -> None:
         self._evaluation_repo = evaluation_repo
         self._user_repo = user_repo
         self._permission_validator = permission_validator
         self._db_session = db_session
+        self._rollup_repo = rollup_repo
+        self._stats_cache = stats_cache
 
     async def __call__(
         self,
@@ -271,6 +301,8 @@ class UpdateEvaluationInteractor:
                     )
 
             # 3. Валидация изменений
+            previous_score = evaluation.score
+
             if update_data.score is not None:
                 evaluation.score = update_data.score
 
@@ -281,7 +313,30 @@ class UpdateEvaluationInteractor:
             updated_evaluation = await self._evaluation_repo.update_evaluation(
                 evaluation
             )
+
+            # 5. Перенести оценку в сводках на новый балл
+            if self._rollup_repo and updated_evaluation.score != previous_score:
+                team_uuid = evaluation.task.team_uuid if evaluation.task else None
+
+                await self._rollup_repo.apply_score(
+                    score=previous_score,
+                    delta=-1,
+                    evaluated_user_uuid=updated_evaluation.evaluated_user_uuid,
+                    team_uuid=team_uuid,
+                )
+                await self._rollup_repo.apply_score(
+                    score=updated_evaluation.score,
+                    delta=1,
+                    evaluated_user_uuid=updated_evaluation.evaluated_user_uuid,
+                    team_uuid=team_uuid,
+                    evaluated_at=updated_evaluation.created_at,
+                )
+
             await self._db_session.commit()
+            invalidate_user_stats(
+                self._stats_cache,
+                updated_evaluation.evaluated_user_uuid,
+            )
             return updated_evaluation
 
         except Exception:
@@ -298,11 +353,15 @@ class DeleteEvaluationInteractor:
         user_repo: UserRepository,
         permission_validator: Optional[PermissionValidator],
         db_session: DBSession,
+        rollup_repo: Optional[EvaluationRollupRepository] = None,
+        stats_cache: Optional[UserStatsCache] = None,
     ) -> None:
         self._evaluation_repo = evaluation_repo
         self._user_repo = user_repo
         self._permission_validator = permission_validator
         self._db_session = db_session
+        self._rollup_repo = rollup_repo
+        self._stats_cache = stats_cache
 
     async def __call__(
         self,
@@ -340,9 +399,24 @@ class DeleteEvaluationInteractor:
                     )
 
             # 3. Удалить оценку
+            score = evaluation.score
+            evaluated_user_uuid = evaluation.evaluated_user_uuid
+            team_uuid = evaluation.task.team_uuid if evaluation.task else None
+
             result = await self._evaluation_repo.delete_evaluation(evaluation_uuid)
+
+            # 4. Исключить оценку из сводок
+            if result and self._rollup_repo:
+                await self._rollup_repo.apply_score(
+                    score=score,
+                    delta=-1,
+                    evaluated_user_uuid=evaluated_user_uuid,
+                    team_uuid=team_uuid,
+                )
+
             if result:
                 await self._db_session.commit()
+                invalidate_user_stats(self._stats_cache, evaluated_user_uuid)
             return result
 
         except Exception:
@@ -432,10 +506,12 @@ class GetUserEvaluationStatsInteractor:
         evaluation_repo: EvaluationRepository,
         user_repo: UserRepository,
         permission_validator: Optional[PermissionValidator],
+        rollup_repo: Optional[EvaluationRollupRepository] = None,
     ) -> None:
         self._evaluation_repo = evaluation_repo
         self._user_repo = user_repo
         self._permission_validator = permission_validator
+        self._rollup_repo = rollup_repo
 
     async def __call__(
         self,
@@ -467,27 +543,29 @@ class GetUserEvaluationStatsInteractor:
             if not (is_self or is_admin or (is_manager and is_same_team)):
                 raise PermissionError("Нет прав для просмотра статистики оценок")
 
-        # 3. Собрать статистику
-        average_score = await self._evaluation_repo.calculate_user_average_score(
-            target_user_uuid
-        )
-        score_distribution = await self._evaluation_repo.get_user_score_distribution(
-            target_user_uuid
-        )
-        recent_count = await self._evaluation_repo.count_evaluations_by_period(
-            user_uuid=target_user_uuid,
-            days=30,
-        )
-        total_evaluations = sum(score_distribution.values())
+        # 3. Собрать статистику: из сводки, если она подключена
+        if self._rollup_repo:
+            stats = await self._rollup_repo.get_user_stats(target_user_uuid)
+            stats["recent"] = await self._evaluation_repo.count_evaluations_by_period(
+                user_uuid=target_user_uuid,
+                days=30,
+            )
+        else:
+            stats = await self._evaluation_repo.get_evaluation_stats(
+                user_uuid=target_user_uuid,
+                days=30,
+            )
+        average_score = stats["average_score"]
 
         return {
             "user_uuid": str(target_user_uuid),
             "user_name": f"{target_user.name} {target_user.surname}",
             "average_score": round(average_score, 2) if average_score else 0.0,
-            "total_evaluations": total_evaluations,
-            "evaluations_last_30_days": recent_count,
+            "total_evaluations": stats["total"],
+            "evaluations_last_30_days": stats["recent"],
             "score_distribution": {
-                score.value: count for score, count in score_distribution.items()
+                score.value: count
+                for score, count in stats["score_distribution"].items()
             },
             "performance_level": self._get_performance_level(average_score)
             if average_score
@@ -516,10 +594,12 @@ class GetTeamEvaluationStatsInteractor:
         evaluation_repo: EvaluationRepository,
         user_repo: UserRepository,
         permission_validator: Optional[PermissionValidator],
+        rollup_repo: Optional[EvaluationRollupRepository] = None,
     ) -> None:
         self._evaluation_repo = evaluation_repo
         self._user_repo = user_repo
         self._permission_validator = permission_validator
+        self._rollup_repo = rollup_repo
 
     async def __call__(
         self,
@@ -541,50 +621,51 @@ class GetTeamEvaluationStatsInteractor:
                     "Нет прав для просмотра статистики другой команды"
                 )
 
-        # 3. Собрать статистику команды
-        team_evaluations = await self._evaluation_repo.get_team_evaluations(
-            team_uuid=team_uuid,
-            limit=1000,  # Большой лимит для полной статистики
-        )
-
-        if not team_evaluations:
-            return {
-                "team_uuid": str(team_uuid),
-                "total_evaluations": 0,
-                "average_score": 0.0,
-                "evaluations_last_30_days": 0,
-                "score_distribution": {score.value: 0 for score in ScoresEnum},
-            }
-
-        # Вычисляем статистику
-        score_values = {
-            ScoresEnum.UNACCEPTABLE: 1,
-            ScoresEnum.BAD: 2,
-            ScoresEnum.SATISFACTORY: 3,
-            ScoresEnum.GOOD: 4,
-            ScoresEnum.GREAT: 5,
-        }
-
-        scores = [score_values[evaluation.score] for evaluation in team_evaluations]
-        average_score = sum(scores) / len(scores)
-
-        # Распределение оценок
-        score_distribution = {score: 0 for score in ScoresEnum}
-        for evaluation in team_evaluations:
-            score_distribution[evaluation.score] += 1
-
-        # Оценки за последние 30 дней
-        recent_count = await self._evaluation_repo.count_evaluations_by_period(
-            team_uuid=team_uuid,
-            days=30,
-        )
+        # 3. Собрать статистику команды: из сводки, если она подключена
+        if self._rollup_repo:
+            stats = await self._rollup_repo.get_team_stats(team_uuid)
+            stats["recent"] = await self._evaluation_repo.count_evaluations_by_period(
+                team_uuid=team_uuid,
+                days=30,
+            )
+        else:
+            stats = await self._evaluation_repo.get_evaluation_stats(
+                team_uuid=team_uuid,
+                days=30,
+            )
+        average_score = stats["average_score"]
 
         return {
             "team_uuid": str(team_uuid),
-            "total_evaluations": len(team_evaluations),
-            "average_score": round(average_score, 2),
-            "evaluations_last_30_days": recent_count,
+            "total_evaluations": stats["total"],
+            "average_score": round(average_score, 2) if average_score else 0.0,
+            "evaluations_last_30_days": stats["recent"],
             "score_distribution": {
-                score.value: count for score, count in score_distribution.items()
+                score.value: count
+                for score, count in stats["score_distribution"].items()
             },
         }
+
+
+class RebuildEvaluationRollupsInteractor:
+    """Интерактор для пересчета сводок оценок"""
+
+    def __init__(
+        self,
+        rollup_repo: EvaluationRollupRepository,
+        db_session: DBSession,
+    ) -> None:
+        self._rollup_repo = rollup_repo
+        self._db_session = db_session
+
+    async def __call__(self) -> dict:
+        """Пересчитать сводки по пользователям и командам"""
+
+        try:
+            counts = await self._rollup_repo.rebuild()
+            await self._db_session.commit()
+            return counts
+
+        except Exception:
+            await self._db_session.rollback()
+            raise
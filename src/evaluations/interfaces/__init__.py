@@ -1,5 +1,9 @@
 __all__ = (
     "EvaluationRepository",
+    "EvaluationRollupRepository",
 )
 
-from .interfaces import EvaluationRepository
\ No newline at end of file
+from .interfaces import (
+    EvaluationRepository,
+    EvaluationRollupRepository,
+)
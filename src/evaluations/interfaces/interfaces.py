@@ -1,4 +1,7 @@
+from datetime import datetime
 from typing import (
+    Any,
+    Dict,
     List,
     Optional,
     Protocol,
@@ -80,6 +83,15 @@ class EvaluationRepository(Protocol):
         """Вычислить среднюю оценку пользователя"""
         ...
 
+    async def get_evaluation_stats(
+        self,
+        user_uuid: Optional[UUID] = None,
+        team_uuid: Optional[UUID] = None,
+        days: int = 30,
+    ) -> Dict[str, Any]:
+        """Получить статистику оценок (средний балл, количество, распределение)"""
+        ...
+
     async def get_user_score_distribution(
         self,
         user_uuid: UUID,
@@ -104,3 +116,30 @@ class EvaluationRepository(Protocol):
     ) -> List[Evaluation]:
         """Получить последние оценки"""
         ...
+
+
+class EvaluationRollupRepository(Protocol):
+    """Интерфейс для сводок оценок по пользователям и командам"""
+
+    async def apply_score(
+        self,
+        score: ScoresEnum,
+        delta: int,
+        evaluated_user_uuid: Optional[UUID] = None,
+        team_uuid: Optional[UUID] = None,
+        evaluated_at: Optional[datetime] = None,
+    ) -> None:
+        """Учесть (delta=1) или исключить (delta=-1) оценку в сводках"""
+        ...
+
+    async def get_user_stats(self, user_uuid: UUID) -> Dict[str, Any]:
+        """Получить статистику оценок пользователя из сводки"""
+        ...
+
+    async def get_team_stats(self, team_uuid: UUID) -> Dict[str, Any]:
+        """Получить статистику оценок команды из сводки"""
+        ...
+
+    async def rebuild(self) -> Dict[str, int]:
+        """Пересчитать сводки по таблице оценок"""
+        ...
@@ -1,9 +1,19 @@
 __all__ = (
     "Evaluation",
+    "SCORE_VALUES",
     "ScoresEnum",
+    "TeamEvaluationRollup",
+    "UserEvaluationRollup",
+    "score_count_column",
 )
 
 from .evaluation import (
+    SCORE_VALUES,
     Evaluation,
     ScoresEnum,
 )
+from .rollup import (
+    TeamEvaluationRollup,
+    UserEvaluationRollup,
+    score_count_column,
+)
@@ -7,6 +7,7 @@ from uuid import UUID
 from sqlalchemy import (
     Enum,
     ForeignKey,
+    Index,
     String,
 )
 from sqlalchemy.orm import (
@@ -30,7 +31,32 @@ class ScoresEnum(PyEnum.Enum):
     GREAT = "Great"
 
 
+# Числовые значения оценок для средних и рейтингов
+SCORE_VALUES = {
+    ScoresEnum.UNACCEPTABLE: 1,
+    ScoresEnum.BAD: 2,
+    ScoresEnum.SATISFACTORY: 3,
+    ScoresEnum.GOOD: 4,
+    ScoresEnum.GREAT: 5,
+}
+
+
 class Evaluation(Base):
+    # Индексы повторяют фильтры и сортировки EvaluationCRUD
+    __table_args__ = (
+        Index(
+            "ix_evaluations_evaluated_user_uuid_created_at",
+            "evaluated_user_uuid",
+            "created_at",
+        ),
+        Index(
+            "ix_evaluations_evaluator_uuid_created_at",
+            "evaluator_uuid",
+            "created_at",
+        ),
+        Index("ix_evaluations_created_at", "created_at"),
+    )
+
     task_uuid: Mapped[UUID] = mapped_column(
         ForeignKey("tasks.uuid", ondelete="CASCADE"),
         nullable=False,
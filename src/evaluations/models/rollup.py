@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+from core.models.base import Base
+
+from .evaluation import ScoresEnum
+
+
+def score_count_column(score: ScoresEnum) -> str:
+    """Имя колонки сводки со счетчиком оценок данного типа"""
+    return f"{score.name.lower()}_count"
+
+
+class EvaluationRollupMixin:
+    """
+    Счетчики оценок, которые интеракторы обновляют в той же транзакции,
+    что и саму оценку. Средний балл = score_sum / evaluations_count.
+    """
+
+    evaluations_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    # Сумма числовых значений оценок (SCORE_VALUES)
+    score_sum: Mapped[int] = mapped_column(default=0, nullable=False)
+    # Количество оценок каждого типа: <score>_count для ScoresEnum
+    unacceptable_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    bad_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    satisfactory_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    good_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    great_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    last_evaluated_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
+
+
+class UserEvaluationRollup(EvaluationRollupMixin, Base):
+    """Сводка оценок, полученных пользователем"""
+
+    user_uuid: Mapped[UUID] = mapped_column(
+        ForeignKey("users.uuid", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+
+
+class TeamEvaluationRollup(EvaluationRollupMixin, Base):
+    """Сводка оценок по задачам команды"""
+
+    team_uuid: Mapped[UUID] = mapped_column(
+        ForeignKey("teams.uuid", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
@@ -16,10 +16,15 @@ from fastapi import (
 from core.dependencies import (
     CurrentUserDep,
     EvaluationRepoDep,
+    EvaluationRollupRepoDep,
+    ReadEvaluationRepoDep,
+    ReadEvaluationRollupRepoDep,
     SessionDep,
+    SessionReleasingRoute,
     TaskRepoDep,
     UUIDGeneratorDep,
     UserRepoDep,
+    UserStatsCacheDep,
 )
 from evaluations.interactors import (
     CreateEvaluationDTO,
@@ -29,6 +34,7 @@ from evaluations.interactors import (
     GetTeamEvaluationStatsInteractor,
     GetUserEvaluationStatsInteractor,
     QueryEvaluationsInteractor,
+    RebuildEvaluationRollupsInteractor,
     UpdateEvaluationInteractor,
 )
 from evaluations.models import ScoresEnum
@@ -38,8 +44,9 @@ from evaluations.schemas.evaluation import (
     EvaluationUpdate,
     EvaluationWithDetails,
 )
+from users.models import RoleEnum
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.post(
@@ -52,9 +59,11 @@ async def create_evaluation(
     current_user: CurrentUserDep,
     session: SessionDep,
     evaluation_repo: EvaluationRepoDep,
+    rollup_repo: EvaluationRollupRepoDep,
     task_repo: TaskRepoDep,
     user_repo: UserRepoDep,
     uuid_generator: UUIDGeneratorDep,
+    stats_cache: UserStatsCacheDep,
 ) -> EvaluationResponse:
     """Создать новую оценку"""
 
@@ -73,6 +82,8 @@ async def create_evaluation(
         permission_validator=None,
         uuid_generator=uuid_generator,
         db_session=session,
+        rollup_repo=rollup_repo,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -101,7 +112,7 @@ async def create_evaluation(
 )
 async def list_evaluations(
     current_user: CurrentUserDep,
-    evaluation_repo: EvaluationRepoDep,
+    evaluation_repo: ReadEvaluationRepoDep,
     user_repo: UserRepoDep,
     limit: int = Query(default=50, le=100),
     offset: int = Query(default=0, ge=0),
@@ -156,7 +167,7 @@ async def list_evaluations(
 async def get_evaluation(
     evaluation_uuid: UUID,
     current_user: CurrentUserDep,
-    evaluation_repo: EvaluationRepoDep,
+    evaluation_repo: ReadEvaluationRepoDep,
     user_repo: UserRepoDep,
 ) -> EvaluationResponse:
     """Получить оценку по UUID"""
@@ -197,7 +208,7 @@ async def get_evaluation(
 async def get_evaluation_with_details(
     evaluation_uuid: UUID,
     current_user: CurrentUserDep,
-    evaluation_repo: EvaluationRepoDep,
+    evaluation_repo: ReadEvaluationRepoDep,
     user_repo: UserRepoDep,
 ) -> EvaluationWithDetails:
     """Получить оценку с деталями (оценивающий, оцениваемый)"""
@@ -238,7 +249,7 @@ async def get_evaluation_with_details(
 async def get_evaluation_by_task(
     task_uuid: UUID,
     current_user: CurrentUserDep,
-    evaluation_repo: EvaluationRepoDep,
+    evaluation_repo: ReadEvaluationRepoDep,
     user_repo: UserRepoDep,
 ) -> EvaluationResponse:
     """Получить оценку по UUID задачи"""
@@ -281,7 +292,9 @@ async def update_evaluation(
     current_user: CurrentUserDep,
     session: SessionDep,
     evaluation_repo: EvaluationRepoDep,
+    rollup_repo: EvaluationRollupRepoDep,
     user_repo: UserRepoDep,
+    stats_cache: UserStatsCacheDep,
 ) -> EvaluationResponse:
     """Обновить оценку"""
 
@@ -290,6 +303,8 @@ async def update_evaluation(
         user_repo=user_repo,
         permission_validator=None,
         db_session=session,
+        rollup_repo=rollup_repo,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -322,7 +337,9 @@ async def delete_evaluation(
     current_user: CurrentUserDep,
     session: SessionDep,
     evaluation_repo: EvaluationRepoDep,
+    rollup_repo: EvaluationRollupRepoDep,
     user_repo: UserRepoDep,
+    stats_cache: UserStatsCacheDep,
 ) -> Dict[str, str]:
     """Удалить оценку"""
 
@@ -331,6 +348,8 @@ async def delete_evaluation(
         user_repo=user_repo,
         permission_validator=None,
         db_session=session,
+        rollup_repo=rollup_repo,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -361,7 +380,8 @@ async def delete_evaluation(
 async def get_user_evaluation_stats(
     user_uuid: UUID,
     current_user: CurrentUserDep,
-    evaluation_repo: EvaluationRepoDep,
+    evaluation_repo: ReadEvaluationRepoDep,
+    rollup_repo: ReadEvaluationRollupRepoDep,
     user_repo: UserRepoDep,
 ) -> Dict[str, Any]:
     """Получить статистику оценок пользователя"""
@@ -370,6 +390,7 @@ async def get_user_evaluation_stats(
         evaluation_repo=evaluation_repo,
         user_repo=user_repo,
         permission_validator=None,
+        rollup_repo=rollup_repo,
     )
 
     try:
@@ -399,7 +420,8 @@ async def get_user_evaluation_stats(
 async def get_team_evaluation_stats(
     team_uuid: UUID,
     current_user: CurrentUserDep,
-    evaluation_repo: EvaluationRepoDep,
+    evaluation_repo: ReadEvaluationRepoDep,
+    rollup_repo: ReadEvaluationRollupRepoDep,
     user_repo: UserRepoDep,
 ) -> Dict[str, Any]:
     """Получить статистику оценок команды"""
@@ -408,6 +430,7 @@ async def get_team_evaluation_stats(
         evaluation_repo=evaluation_repo,
         user_repo=user_repo,
         permission_validator=None,
+        rollup_repo=rollup_repo,
     )
 
     try:
@@ -428,3 +451,28 @@ async def get_team_evaluation_stats(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e),
         )
+
+
+@router.post(
+    "/rollups/rebuild",
+    status_code=status.HTTP_200_OK,
+)
+async def rebuild_evaluation_rollups(
+    current_user: CurrentUserDep,
+    session: SessionDep,
+    rollup_repo: EvaluationRollupRepoDep,
+) -> Dict[str, int]:
+    """Пересчитать сводки оценок по пользователям и командам (только для администраторов)"""
+
+    if current_user.role != RoleEnum.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Нет прав для пересчета сводок",
+        )
+
+    interactor = RebuildEvaluationRollupsInteractor(
+        rollup_repo=rollup_repo,
+        db_session=session,
+    )
+
+    return await interactor()
@@ -7,6 +7,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from core.config import settings
+from core.dependencies.depends import LAST_WRITE_HEADER
 from core.models import db_helper
 from evaluations.routers import evaluations_router
 from tasks.routers import tasks_router
@@ -14,6 +15,10 @@ from teams.routers import (
     members_router,
     teams_router,
 )
+from users.providers import (
+    TokenJanitorProvider,
+    password_hashing_pool,
+)
 from users.routers import (
     auth_router,
     users_router,
@@ -25,10 +30,25 @@ from calendars.routers import calendar_router
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # startup
+    token_janitor = TokenJanitorProvider(
+        session_factory=db_helper.session_factory,
+        interval_seconds=settings.token_cleanup.interval_seconds,
+        batch_size=settings.token_cleanup.batch_size,
+        time_budget_seconds=settings.token_cleanup.time_budget_seconds,
+        partition_months_ahead=settings.token_cleanup.partition_months_ahead,
+    )
+    # Партиции токенов нужны и при выключенной очистке: без них
+    # вставка токенов при входе и обновлении падает
+    await token_janitor.ensure_partitions()
+    if settings.token_cleanup.janitor_enabled:
+        token_janitor.start()
+
     yield
     # shutdown
+    await token_janitor.stop()
     print("dispose engine")
     await db_helper.engine_dispose()
+    password_hashing_pool.shutdown()
 
 
 def create_app() -> FastAPI:
@@ -55,6 +75,8 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Метку read-your-writes клиент возвращает в следующих запросах
+        expose_headers=[LAST_WRITE_HEADER],
     )
 
     # Auth роутеры
@@ -126,6 +148,11 @@ def create_app() -> FastAPI:
         """Проверка здоровья приложения"""
         return {"status": "ok"}
 
+    @app.get("/metrics/db-pool")
+    async def db_pool_metrics():
+        """Состояние пула соединений с БД текущего воркера"""
+        return db_helper.get_pool_stats()
+
     return app
 
 
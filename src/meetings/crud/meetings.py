@@ -1,19 +1,29 @@
 from datetime import (
+    date,
     datetime,
     timedelta,
 )
 from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
     List,
     Optional,
+    Tuple,
 )
 from uuid import UUID
 
 from sqlalchemy import (
+    ColumnElement,
+    Text,
     and_,
+    case,
+    cast,
     func,
-    or_,
     select,
+    union,
 )
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -117,6 +127,68 @@ class MeetingCRUD(MeetingRepository):
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def stream_meetings_in_period(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        participant_uuid: Optional[UUID] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Meeting]:
+        """Потоково получить встречи за период (серверный курсор)"""
+        conditions = self._period_conditions(
+            date_from,
+            date_to,
+            team_uuid,
+            participant_uuid,
+        )
+
+        stmt = select(Meeting).where(and_(*conditions))
+        stmt = stmt.order_by(Meeting.date_time.asc(), Meeting.uuid.asc())
+        stmt = stmt.execution_options(yield_per=batch_size)
+
+        result = await self._session.stream_scalars(stmt)
+        async for meeting in result:
+            yield meeting
+
+    async def get_period_fingerprint(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        participant_uuid: Optional[UUID] = None,
+    ) -> Tuple[int, Optional[datetime], Optional[str]]:
+        """
+        Получить количество встреч периода, время последнего изменения
+        и хэш набора их UUID.
+
+        Добавление и удаление участника меняют только meeting_participants,
+        не updated_at встречи: если пользователя перевели с одной встречи
+        периода на другую, количество и время совпадут, а хэш - нет.
+        """
+        conditions = self._period_conditions(
+            date_from,
+            date_to,
+            team_uuid,
+            participant_uuid,
+        )
+
+        stmt = select(
+            func.count(Meeting.uuid),
+            func.max(Meeting.updated_at),
+            func.md5(
+                func.string_agg(
+                    cast(Meeting.uuid, Text),
+                    aggregate_order_by(",", Meeting.uuid),
+                )
+            ),
+        )
+        stmt = stmt.where(and_(*conditions))
+
+        result = await self._session.execute(stmt)
+        count, last_updated_at, uuids_hash = result.one()
+        return count, last_updated_at, uuids_hash
+
     async def get_user_meetings(
         self,
         user_uuid: UUID,
@@ -126,17 +198,7 @@ class MeetingCRUD(MeetingRepository):
         offset: int = 0,
     ) -> List[Meeting]:
         """Получить встречи пользователя (созданные или участвует)"""
-        # Подзапрос для встреч, где пользователь участник
-        participant_subquery = select(meeting_participants.c.meeting_uuid).where(
-            meeting_participants.c.user_uuid == user_uuid
-        )
-
-        conditions = [
-            or_(
-                Meeting.creator_uuid == user_uuid,
-                Meeting.uuid.in_(participant_subquery),
-            )
-        ]
+        conditions = [self._user_meetings_condition(user_uuid)]
 
         if date_from is not None:
             conditions.append(Meeting.date_time >= date_from)
@@ -187,15 +249,7 @@ class MeetingCRUD(MeetingRepository):
 
         if user_uuid is not None:
             # Встречи где пользователь создатель или участник
-            participant_subquery = select(meeting_participants.c.meeting_uuid).where(
-                meeting_participants.c.user_uuid == user_uuid
-            )
-            conditions.append(
-                or_(
-                    Meeting.creator_uuid == user_uuid,
-                    Meeting.uuid.in_(participant_subquery),
-                )
-            )
+            conditions.append(self._user_meetings_condition(user_uuid))
 
         if team_uuid is not None:
             conditions.append(Meeting.team_uuid == team_uuid)
@@ -224,15 +278,7 @@ class MeetingCRUD(MeetingRepository):
         ]
 
         if user_uuid is not None:
-            participant_subquery = select(meeting_participants.c.meeting_uuid).where(
-                meeting_participants.c.user_uuid == user_uuid
-            )
-            conditions.append(
-                or_(
-                    Meeting.creator_uuid == user_uuid,
-                    Meeting.uuid.in_(participant_subquery),
-                )
-            )
+            conditions.append(self._user_meetings_condition(user_uuid))
 
         if team_uuid is not None:
             conditions.append(Meeting.team_uuid == team_uuid)
@@ -251,16 +297,9 @@ class MeetingCRUD(MeetingRepository):
         exclude_meeting_uuid: Optional[UUID] = None,
     ) -> List[Meeting]:
         """Проверить конфликты времени для пользователя"""
-        # Встречи где пользователь создатель или участник
-        participant_subquery = select(meeting_participants.c.meeting_uuid).where(
-            meeting_participants.c.user_uuid == user_uuid
-        )
-
         conditions = [
-            or_(
-                Meeting.creator_uuid == user_uuid,
-                Meeting.uuid.in_(participant_subquery),
-            ),
+            # Встречи где пользователь создатель или участник
+            self._user_meetings_condition(user_uuid),
             # Пересечение времени
             Meeting.date_time < end_time,
             # Предполагаем, что встреча длится 1 час по умолчанию
@@ -338,15 +377,7 @@ class MeetingCRUD(MeetingRepository):
         conditions = [Meeting.date_time >= since_date]
 
         if user_uuid is not None:
-            participant_subquery = select(meeting_participants.c.meeting_uuid).where(
-                meeting_participants.c.user_uuid == user_uuid
-            )
-            conditions.append(
-                or_(
-                    Meeting.creator_uuid == user_uuid,
-                    Meeting.uuid.in_(participant_subquery),
-                )
-            )
+            conditions.append(self._user_meetings_condition(user_uuid))
 
         if team_uuid is not None:
             conditions.append(Meeting.team_uuid == team_uuid)
@@ -354,3 +385,162 @@ class MeetingCRUD(MeetingRepository):
         stmt = select(func.count(Meeting.uuid)).where(and_(*conditions))
         result = await self._session.execute(stmt)
         return result.scalar() or 0
+
+    async def get_meeting_stats(
+        self,
+        user_uuid: Optional[UUID] = None,
+        team_uuid: Optional[UUID] = None,
+        days: int = 30,
+        weeks_ahead: int = 4,
+    ) -> Dict[str, Any]:
+        """
+        Получить статистику встреч одним запросом.
+
+        Возвращает:
+            total_last_days: встречи начиная с days дней назад, включая будущие
+            upcoming: все предстоящие встречи
+            by_week: счетчики total/upcoming по неделям (ключ - понедельник)
+                от начала периода до weeks_ahead недель вперед
+        """
+        now = datetime.now()
+        since_date = now - timedelta(days=days)
+        until_date = now + timedelta(weeks=weeks_ahead)
+
+        conditions = [Meeting.date_time >= since_date]
+
+        if user_uuid is not None:
+            conditions.append(self._user_meetings_condition(user_uuid))
+
+        if team_uuid is not None:
+            conditions.append(Meeting.team_uuid == team_uuid)
+
+        # Встречи дальше окна попадают в одну группу с week = NULL: они
+        # учитываются в итогах, но число недельных строк ограничено окном
+        week = case(
+            (
+                Meeting.date_time < until_date,
+                func.date_trunc("week", Meeting.date_time),
+            ),
+        ).label("week")
+
+        stmt = select(
+            week,
+            func.count(Meeting.uuid).label("total"),
+            func.count(Meeting.uuid).filter(Meeting.date_time > now).label("upcoming"),
+        )
+        stmt = stmt.where(and_(*conditions))
+        stmt = stmt.group_by(week)
+        stmt = stmt.order_by(week)
+
+        result = await self._session.execute(stmt)
+
+        rows = result.all()
+
+        # Каждая встреча попадает ровно в одну группу, поэтому итоги по
+        # периоду - это суммы счетчиков групп
+        return {
+            "total_last_days": sum(row.total for row in rows),
+            "upcoming": sum(row.upcoming for row in rows),
+            "by_week": {
+                row.week.date(): {"total": row.total, "upcoming": row.upcoming}
+                for row in rows
+                if row.week is not None
+            },
+        }
+
+    async def count_meetings_by_day(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        participant_uuid: Optional[UUID] = None,
+    ) -> Dict[date, Dict[str, int]]:
+        """
+        Получить агрегаты встреч по дням за период.
+
+        Для каждого дня возвращаются счетчики:
+            total: всего встреч
+            upcoming: еще не начавшиеся
+            within_hours: начинаются в ближайшие 2 часа (или уже прошли)
+            within_day: начинаются через 2-24 часа
+        """
+        now = datetime.now()
+
+        is_within_hours = Meeting.date_time < now + timedelta(hours=2)
+        is_within_day = and_(
+            Meeting.date_time >= now + timedelta(hours=2),
+            Meeting.date_time < now + timedelta(days=1),
+        )
+
+        conditions = self._period_conditions(
+            date_from,
+            date_to,
+            team_uuid,
+            participant_uuid,
+        )
+
+        day = func.date_trunc("day", Meeting.date_time).label("day")
+
+        stmt = select(
+            day,
+            func.count(Meeting.uuid).label("total"),
+            func.count(Meeting.uuid).filter(Meeting.date_time > now).label("upcoming"),
+            func.count(Meeting.uuid).filter(is_within_hours).label("within_hours"),
+            func.count(Meeting.uuid).filter(is_within_day).label("within_day"),
+        )
+        stmt = stmt.where(and_(*conditions))
+        stmt = stmt.group_by(day)
+
+        result = await self._session.execute(stmt)
+
+        return {
+            row.day.date(): {
+                "total": row.total,
+                "upcoming": row.upcoming,
+                "within_hours": row.within_hours,
+                "within_day": row.within_day,
+            }
+            for row in result.all()
+        }
+
+    def _user_meetings_condition(self, user_uuid: UUID) -> ColumnElement[bool]:
+        """
+        Условие "пользователь создатель или участник встречи".
+
+        OR с подзапросом PostgreSQL не может обслужить индексами и сканирует
+        meetings целиком; IN по объединению двух выборок идет по индексам
+        meeting_participants(user_uuid) и meetings(creator_uuid).
+        """
+        participant_meetings = select(meeting_participants.c.meeting_uuid).where(
+            meeting_participants.c.user_uuid == user_uuid
+        )
+        created_meetings = (
+            select(Meeting.uuid)
+            .where(Meeting.creator_uuid == user_uuid)
+            .correlate(None)
+        )
+        return Meeting.uuid.in_(union(participant_meetings, created_meetings))
+
+    def _period_conditions(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID],
+        participant_uuid: Optional[UUID],
+    ) -> list:
+        """Условия выборки встреч за период"""
+        conditions = [
+            Meeting.date_time >= date_from,
+            Meeting.date_time <= date_to,
+        ]
+
+        if team_uuid is not None:
+            conditions.append(Meeting.team_uuid == team_uuid)
+
+        if participant_uuid is not None:
+            participant_subquery = select(meeting_participants.c.meeting_uuid).where(
+                meeting_participants.c.user_uuid == participant_uuid
+            )
+            conditions.append(Meeting.uuid.in_(participant_subquery))
+
+        return conditions
@@ -8,6 +8,8 @@ from typing import (
 )
 from uuid import UUID
 
+from calendars.interfaces import CalendarCache
+from calendars.providers import invalidate_calendar
 from core.interfaces import (
     DBSession,
     PermissionValidator,
@@ -17,8 +19,23 @@ from meetings.interfaces import MeetingRepository
 from meetings.models import Meeting
 from meetings.schemas.meeting import MeetingUpdate
 from teams.interfaces import TeamRepository
-from users.interfaces import UserRepository
+from users.interfaces import (
+    UserRepository,
+    UserStatsCache,
+)
 from users.models import RoleEnum
+from users.providers import invalidate_user_stats
+
+
+async def _meeting_user_uuids(
+    meeting_repo: MeetingRepository,
+    meeting_uuid: UUID,
+) -> List[UUID]:
+    """Создатель и участники встречи - пользователи, в чью статистику она входит"""
+    meeting = await meeting_repo.get_meeting_with_participants(meeting_uuid)
+    if not meeting:
+        return []
+    return [meeting.creator_uuid, *(user.uuid for user in meeting.participants)]
 
 
 class CreateMeetingDTO:
@@ -52,6 +69,8 @@ class CreateMeetingInteractor:
         permission_validator: Optional[PermissionValidator],
         uuid_generator: UUIDGenerator,
         db_session: DBSession,
+        calendar_cache: Optional[CalendarCache] = None,
+        stats_cache: Optional[UserStatsCache] = None,
     ) -> None:
         self._meeting_repo = meeting_repo
         self._user_repo = user_repo
@@ -59,6 +78,8 @@ class CreateMeetingInteractor:
         self._permission_validator = permission_validator
         self._uuid_generator = uuid_generator
         self._db_session = db_session
+        self._calendar_cache = calendar_cache
+        self._stats_cache = stats_cache
 
     async def __call__(
         self,
@@ -154,6 +175,14 @@ class CreateMeetingInteractor:
                 )
 
             await self._db_session.commit()
+
+            invalidate_calendar(self._calendar_cache, created_meeting.team_uuid)
+            invalidate_user_stats(
+                self._stats_cache,
+                created_meeting.creator_uuid,
+                *(participant.uuid for participant in participants),
+            )
+
             return created_meeting
 
         except Exception:
@@ -229,11 +258,15 @@ class UpdateMeetingInteractor:
         user_repo: UserRepository,
         permission_validator: Optional[PermissionValidator],
         db_session: DBSession,
+        calendar_cache: Optional[CalendarCache] = None,
+        stats_cache: Optional[UserStatsCache] = None,
     ) -> None:
         self._meeting_repo = meeting_repo
         self._user_repo = user_repo
         self._permission_validator = permission_validator
         self._db_session = db_session
+        self._calendar_cache = calendar_cache
+        self._stats_cache = stats_cache
 
     async def __call__(
         self,
@@ -300,7 +333,20 @@ class UpdateMeetingInteractor:
 
             # 4. Сохранить
             updated_meeting = await self._meeting_repo.update_meeting(meeting)
+
+            # Перенос встречи меняет статистику создателя и участников
+            affected_user_uuids: List[UUID] = []
+            if self._stats_cache and update_data.date_time is not None:
+                affected_user_uuids = await _meeting_user_uuids(
+                    self._meeting_repo,
+                    meeting_uuid,
+                )
+
             await self._db_session.commit()
+
+            invalidate_calendar(self._calendar_cache, updated_meeting.team_uuid)
+            invalidate_user_stats(self._stats_cache, *affected_user_uuids)
+
             return updated_meeting
 
         except Exception:
@@ -317,11 +363,15 @@ class DeleteMeetingInteractor:
         user_repo: UserRepository,
         permission_validator: Optional[PermissionValidator],
         db_session: DBSession,
+        calendar_cache: Optional[CalendarCache] = None,
+        stats_cache: Optional[UserStatsCache] = None,
     ) -> None:
         self._meeting_repo = meeting_repo
         self._user_repo = user_repo
         self._permission_validator = permission_validator
         self._db_session = db_session
+        self._calendar_cache = calendar_cache
+        self._stats_cache = stats_cache
 
     async def __call__(
         self,
@@ -356,10 +406,22 @@ class DeleteMeetingInteractor:
                         "Только создатель встречи или админ может удалять встречу"
                     )
 
-            # 3. Удалить встречу (участники удалятся автоматически по CASCADE)
+            # 3. Запомнить, чью статистику меняет удаление
+            affected_user_uuids: List[UUID] = []
+            if self._stats_cache:
+                affected_user_uuids = await _meeting_user_uuids(
+                    self._meeting_repo,
+                    meeting_uuid,
+                )
+
+            # 4. Удалить встречу (участники удалятся автоматически по CASCADE)
             result = await self._meeting_repo.delete_meeting(meeting_uuid)
             if result:
                 await self._db_session.commit()
+
+                invalidate_calendar(self._calendar_cache, meeting.team_uuid)
+                invalidate_user_stats(self._stats_cache, *affected_user_uuids)
+
             return result
 
         except Exception:
@@ -376,11 +438,15 @@ class ManageMeetingParticipantsInteractor:
         user_repo: UserRepository,
         permission_validator: Optional[PermissionValidator],
         db_session: DBSession,
+        calendar_cache: Optional[CalendarCache] = None,
+        stats_cache: Optional[UserStatsCache] = None,
     ) -> None:
         self._meeting_repo = meeting_repo
         self._user_repo = user_repo
         self._permission_validator = permission_validator
         self._db_session = db_session
+        self._calendar_cache = calendar_cache
+        self._stats_cache = stats_cache
 
     async def add_participants(
         self,
@@ -442,6 +508,10 @@ class ManageMeetingParticipantsInteractor:
                     added_count += 1
 
             await self._db_session.commit()
+
+            invalidate_calendar(self._calendar_cache, meeting.team_uuid)
+            invalidate_user_stats(self._stats_cache, *participant_uuids)
+
             return added_count > 0
 
         except Exception:
@@ -493,6 +563,10 @@ class ManageMeetingParticipantsInteractor:
                     removed_count += 1
 
             await self._db_session.commit()
+
+            invalidate_calendar(self._calendar_cache, meeting.team_uuid)
+            invalidate_user_stats(self._stats_cache, *participant_uuids)
+
             return removed_count > 0
 
         except Exception:
@@ -627,22 +701,20 @@ class GetMeetingStatsInteractor:
             final_team_uuid = team_uuid
             final_user_uuid = user_uuid
 
-        # 3. Собрать статистику
-        total_meetings_30_days = await self._meeting_repo.count_meetings_by_period(
+        # 3. Собрать статистику одним агрегирующим запросом
+        stats = await self._meeting_repo.get_meeting_stats(
             user_uuid=final_user_uuid,
             team_uuid=final_team_uuid,
             days=30,
         )
 
-        upcoming_meetings = await self._meeting_repo.get_upcoming_meetings(
-            user_uuid=final_user_uuid,
-            team_uuid=final_team_uuid,
-            limit=100,  # Большой лимит для подсчета
-        )
-
         return {
-            "total_meetings_last_30_days": total_meetings_30_days,
-            "upcoming_meetings_count": len(upcoming_meetings),
+            "total_meetings_last_30_days": stats["total_last_days"],
+            "upcoming_meetings_count": stats["upcoming"],
+            "meetings_by_week": [
+                {"week_start": week_start.isoformat(), **counts}
+                for week_start, counts in stats["by_week"].items()
+            ],
             "user_uuid": str(final_user_uuid) if final_user_uuid else None,
             "team_uuid": str(final_team_uuid) if final_team_uuid else None,
         }
@@ -1,8 +1,15 @@
-from datetime import datetime
+from datetime import (
+    date,
+    datetime,
+)
 from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
     List,
     Optional,
     Protocol,
+    Tuple,
 )
 from uuid import UUID
 
@@ -47,6 +54,27 @@ class MeetingRepository(Protocol):
         """Получить список встреч с фильтрацией"""
         ...
 
+    def stream_meetings_in_period(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        participant_uuid: Optional[UUID] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Meeting]:
+        """Потоково получить встречи за период (серверный курсор)"""
+        ...
+
+    async def get_period_fingerprint(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        participant_uuid: Optional[UUID] = None,
+    ) -> Tuple[int, Optional[datetime], Optional[str]]:
+        """Получить количество встреч периода, время последнего изменения и хэш набора UUID"""
+        ...
+
     async def get_user_meetings(
         self,
         user_uuid: UUID,
@@ -129,3 +157,23 @@ class MeetingRepository(Protocol):
     ) -> int:
         """Подсчитать количество встреч за период"""
         ...
+
+    async def get_meeting_stats(
+        self,
+        user_uuid: Optional[UUID] = None,
+        team_uuid: Optional[UUID] = None,
+        days: int = 30,
+        weeks_ahead: int = 4,
+    ) -> Dict[str, Any]:
+        """Получить статистику встреч (за период, предстоящие, по неделям)"""
+        ...
+
+    async def count_meetings_by_day(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        participant_uuid: Optional[UUID] = None,
+    ) -> Dict[date, Dict[str, int]]:
+        """Получить агрегаты встреч по дням за период"""
+        ...
@@ -7,6 +7,7 @@ from uuid import UUID
 
 from sqlalchemy import (
     ForeignKey,
+    Index,
     String,
 )
 from sqlalchemy.orm import (
@@ -24,6 +25,13 @@ if TYPE_CHECKING:
 
 
 class Meeting(Base):
+    # Индексы повторяют фильтры и сортировки MeetingCRUD
+    __table_args__ = (
+        Index("ix_meetings_team_uuid_date_time", "team_uuid", "date_time", "uuid"),
+        Index("ix_meetings_creator_uuid_date_time", "creator_uuid", "date_time"),
+        Index("ix_meetings_date_time_uuid", "date_time", "uuid"),
+    )
+
     title: Mapped[str] = mapped_column(
         String(120),
         nullable=False,
@@ -15,12 +15,16 @@ from fastapi import (
 )
 
 from core.dependencies import (
+    CalendarCacheDep,
     CurrentUserDep,
     MeetingRepoDep,
+    ReadMeetingRepoDep,
     SessionDep,
+    SessionReleasingRoute,
     TeamRepoDep,
     UUIDGeneratorDep,
     UserRepoDep,
+    UserStatsCacheDep,
 )
 from meetings.interactors import (
     CreateMeetingDTO,
@@ -41,7 +45,7 @@ from meetings.schemas.meeting import (
     MeetingWithDetails,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.post(
@@ -53,10 +57,12 @@ async def create_meeting(
     meeting_data: MeetingCreate,
     current_user: CurrentUserDep,
     session: SessionDep,
+    calendar_cache: CalendarCacheDep,
     meeting_repo: MeetingRepoDep,
     user_repo: UserRepoDep,
     team_repo: TeamRepoDep,
     uuid_generator: UUIDGeneratorDep,
+    stats_cache: UserStatsCacheDep,
 ) -> MeetingResponse:
     """Создать новую встречу"""
 
@@ -76,6 +82,8 @@ async def create_meeting(
         permission_validator=None,
         uuid_generator=uuid_generator,
         db_session=session,
+        calendar_cache=calendar_cache,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -104,7 +112,7 @@ async def create_meeting(
 )
 async def list_meetings(
     current_user: CurrentUserDep,
-    meeting_repo: MeetingRepoDep,
+    meeting_repo: ReadMeetingRepoDep,
     user_repo: UserRepoDep,
     limit: int = Query(default=50, le=100),
     offset: int = Query(default=0, ge=0),
@@ -158,7 +166,7 @@ async def list_meetings(
 )
 async def get_meetings_by_date(
     current_user: CurrentUserDep,
-    meeting_repo: MeetingRepoDep,
+    meeting_repo: ReadMeetingRepoDep,
     user_repo: UserRepoDep,
     target_date: datetime = Query(description="Дата для поиска встреч"),
     team_uuid: Optional[UUID] = Query(default=None),
@@ -201,7 +209,7 @@ async def get_meetings_by_date(
 async def get_meeting(
     meeting_uuid: UUID,
     current_user: CurrentUserDep,
-    meeting_repo: MeetingRepoDep,
+    meeting_repo: ReadMeetingRepoDep,
     user_repo: UserRepoDep,
 ) -> MeetingResponse:
     """Получить встречу по UUID"""
@@ -242,7 +250,7 @@ async def get_meeting(
 async def get_meeting_with_details(
     meeting_uuid: UUID,
     current_user: CurrentUserDep,
-    meeting_repo: MeetingRepoDep,
+    meeting_repo: ReadMeetingRepoDep,
     user_repo: UserRepoDep,
 ) -> MeetingWithDetails:
     """Получить встречу с участниками"""
@@ -285,8 +293,10 @@ async def update_meeting(
     update_data: MeetingUpdate,
     current_user: CurrentUserDep,
     session: SessionDep,
+    calendar_cache: CalendarCacheDep,
     meeting_repo: MeetingRepoDep,
     user_repo: UserRepoDep,
+    stats_cache: UserStatsCacheDep,
 ) -> MeetingResponse:
     """Обновить встречу"""
 
@@ -295,6 +305,8 @@ async def update_meeting(
         user_repo=user_repo,
         permission_validator=None,
         db_session=session,
+        calendar_cache=calendar_cache,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -326,8 +338,10 @@ async def delete_meeting(
     meeting_uuid: UUID,
     current_user: CurrentUserDep,
     session: SessionDep,
+    calendar_cache: CalendarCacheDep,
     meeting_repo: MeetingRepoDep,
     user_repo: UserRepoDep,
+    stats_cache: UserStatsCacheDep,
 ) -> Dict[str, str]:
     """Удалить встречу"""
 
@@ -336,6 +350,8 @@ async def delete_meeting(
         user_repo=user_repo,
         permission_validator=None,
         db_session=session,
+        calendar_cache=calendar_cache,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -368,8 +384,10 @@ async def add_meeting_participants(
     participants_data: MeetingAddParticipants,
     current_user: CurrentUserDep,
     session: SessionDep,
+    calendar_cache: CalendarCacheDep,
     meeting_repo: MeetingRepoDep,
     user_repo: UserRepoDep,
+    stats_cache: UserStatsCacheDep,
 ) -> Dict[str, str]:
     """Добавить участников во встречу"""
 
@@ -378,6 +396,8 @@ async def add_meeting_participants(
         user_repo=user_repo,
         permission_validator=None,
         db_session=session,
+        calendar_cache=calendar_cache,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -416,8 +436,10 @@ async def remove_meeting_participants(
     participants_data: MeetingRemoveParticipants,
     current_user: CurrentUserDep,
     session: SessionDep,
+    calendar_cache: CalendarCacheDep,
     meeting_repo: MeetingRepoDep,
     user_repo: UserRepoDep,
+    stats_cache: UserStatsCacheDep,
 ) -> Dict[str, str]:
     """Удалить участников из встречи"""
 
@@ -426,6 +448,8 @@ async def remove_meeting_participants(
         user_repo=user_repo,
         permission_validator=None,
         db_session=session,
+        calendar_cache=calendar_cache,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -463,8 +487,10 @@ async def leave_meeting(
     meeting_uuid: UUID,
     current_user: CurrentUserDep,
     session: SessionDep,
+    calendar_cache: CalendarCacheDep,
     meeting_repo: MeetingRepoDep,
     user_repo: UserRepoDep,
+    stats_cache: UserStatsCacheDep,
 ) -> Dict[str, str]:
     """Покинуть встречу (удалить себя из участников)"""
 
@@ -473,6 +499,8 @@ async def leave_meeting(
         user_repo=user_repo,
         permission_validator=None,
         db_session=session,
+        calendar_cache=calendar_cache,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -508,7 +536,7 @@ async def leave_meeting(
 )
 async def get_meeting_stats(
     current_user: CurrentUserDep,
-    meeting_repo: MeetingRepoDep,
+    meeting_repo: ReadMeetingRepoDep,
     user_repo: UserRepoDep,
     user_uuid: Optional[UUID] = Query(default=None),
     team_uuid: Optional[UUID] = Query(default=None),
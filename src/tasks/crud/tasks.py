@@ -1,7 +1,15 @@
-from datetime import datetime
+from datetime import (
+    date,
+    datetime,
+    timedelta,
+)
 from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
     List,
     Optional,
+    Tuple,
 )
 from uuid import UUID
 
@@ -10,6 +18,7 @@ from sqlalchemy import (
     func,
     or_,
     select,
+    tuple_,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -36,9 +45,7 @@ class TaskCRUD(TaskRepository):
 
     async def get_by_uuid(self, task_uuid: UUID) -> Optional[Task]:
         """Получить задачу по UUID"""
-        stmt = select(Task).where(Task.uuid == task_uuid)
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self._session.get(Task, task_uuid)
 
     async def update_task(self, task: Task) -> Task:
         """Обновить задачу"""
@@ -94,6 +101,93 @@ class TaskCRUD(TaskRepository):
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_tasks_in_period(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        assignee_uuid: Optional[UUID] = None,
+        include_completed: bool = True,
+        after_deadline: Optional[datetime] = None,
+        after_uuid: Optional[UUID] = None,
+        limit: int = 500,
+    ) -> List[Task]:
+        """
+        Получить задачи с дедлайном в периоде [date_from, date_to].
+
+        Пагинация keyset по (deadline, uuid): для следующей страницы
+        передаются deadline и uuid последней задачи предыдущей страницы.
+        """
+        conditions = self._period_conditions(
+            date_from,
+            date_to,
+            team_uuid,
+            assignee_uuid,
+            include_completed,
+        )
+
+        if after_deadline is not None and after_uuid is not None:
+            conditions.append(
+                tuple_(Task.deadline, Task.uuid) > tuple_(after_deadline, after_uuid)
+            )
+
+        stmt = select(Task).where(and_(*conditions))
+        stmt = stmt.order_by(Task.deadline.asc(), Task.uuid.asc())
+        stmt = stmt.limit(limit)
+
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def stream_tasks_in_period(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        assignee_uuid: Optional[UUID] = None,
+        include_completed: bool = True,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Task]:
+        """Потоково получить задачи с дедлайном в периоде (серверный курсор)"""
+        conditions = self._period_conditions(
+            date_from,
+            date_to,
+            team_uuid,
+            assignee_uuid,
+            include_completed,
+        )
+
+        stmt = select(Task).where(and_(*conditions))
+        stmt = stmt.order_by(Task.deadline.asc(), Task.uuid.asc())
+        stmt = stmt.execution_options(yield_per=batch_size)
+
+        result = await self._session.stream_scalars(stmt)
+        async for task in result:
+            yield task
+
+    async def get_period_fingerprint(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        assignee_uuid: Optional[UUID] = None,
+        include_completed: bool = True,
+    ) -> Tuple[int, Optional[datetime]]:
+        """Получить количество задач периода и время последнего изменения"""
+        conditions = self._period_conditions(
+            date_from,
+            date_to,
+            team_uuid,
+            assignee_uuid,
+            include_completed,
+        )
+
+        stmt = select(func.count(Task.uuid), func.max(Task.updated_at))
+        stmt = stmt.where(and_(*conditions))
+
+        result = await self._session.execute(stmt)
+        count, last_updated_at = result.one()
+        return count, last_updated_at
+
     async def get_user_tasks(
         self,
         user_uuid: UUID,
@@ -143,6 +237,7 @@ class TaskCRUD(TaskRepository):
         self,
         team_uuid: Optional[UUID] = None,
         limit: int = 50,
+        assignee_uuid: Optional[UUID] = None,
     ) -> List[Task]:
         """Получить просроченные задачи"""
         now = datetime.now()
@@ -155,6 +250,9 @@ class TaskCRUD(TaskRepository):
         if team_uuid is not None:
             conditions.append(Task.team_uuid == team_uuid)
 
+        if assignee_uuid is not None:
+            conditions.append(Task.assignee_uuid == assignee_uuid)
+
         stmt = select(Task).where(and_(*conditions))
         stmt = stmt.limit(limit)
         stmt = stmt.order_by(Task.deadline.asc())
@@ -232,3 +330,147 @@ class TaskCRUD(TaskRepository):
             counts[status] = count
 
         return counts
+
+    async def get_task_stats(
+        self,
+        team_uuid: Optional[UUID] = None,
+        assignee_uuid: Optional[UUID] = None,
+    ) -> Dict[str, Any]:
+        """
+        Получить статистику задач одним запросом.
+
+        Возвращает:
+            status_counts: количество задач по статусам
+            total: всего задач
+            overdue: просроченные (дедлайн прошел, не завершены)
+            completion_rate: доля завершенных задач в процентах
+        """
+        conditions = []
+
+        if team_uuid is not None:
+            conditions.append(Task.team_uuid == team_uuid)
+
+        if assignee_uuid is not None:
+            conditions.append(Task.assignee_uuid == assignee_uuid)
+
+        is_overdue = and_(
+            Task.deadline < datetime.now(),
+            Task.status != StatusEnum.DONE,
+        )
+
+        stmt = select(
+            func.count(Task.uuid).label("total"),
+            func.count(Task.uuid).filter(is_overdue).label("overdue"),
+            *(
+                func.count(Task.uuid)
+                .filter(Task.status == status)
+                .label(status.name)
+                for status in StatusEnum
+            ),
+        )
+
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+
+        row = (await self._session.execute(stmt)).one()
+
+        status_counts = {status: getattr(row, status.name) for status in StatusEnum}
+        done = status_counts[StatusEnum.DONE]
+
+        return {
+            "status_counts": status_counts,
+            "total": row.total,
+            "overdue": row.overdue,
+            "completion_rate": done / row.total * 100 if row.total else 0,
+        }
+
+    async def count_tasks_by_deadline_day(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        assignee_uuid: Optional[UUID] = None,
+        include_completed: bool = True,
+    ) -> Dict[date, Dict[str, int]]:
+        """
+        Получить агрегаты задач по дням дедлайна за период.
+
+        Для каждого дня возвращаются счетчики:
+            total: всего задач
+            completed: завершенные
+            overdue: просроченные (дедлайн прошел, не завершены)
+            due_in_day: не просрочены, дедлайн в ближайшие сутки
+            due_in_week: дедлайн через 1-7 дней
+        """
+        now = datetime.now()
+
+        is_overdue = and_(Task.deadline < now, Task.status != StatusEnum.DONE)
+        is_due_in_day = and_(
+            Task.deadline < now + timedelta(days=1),
+            ~is_overdue,
+        )
+        is_due_in_week = and_(
+            Task.deadline >= now + timedelta(days=1),
+            Task.deadline < now + timedelta(days=7),
+        )
+
+        conditions = self._period_conditions(
+            date_from,
+            date_to,
+            team_uuid,
+            assignee_uuid,
+            include_completed,
+        )
+
+        day = func.date_trunc("day", Task.deadline).label("day")
+
+        stmt = select(
+            day,
+            func.count(Task.uuid).label("total"),
+            func.count(Task.uuid)
+            .filter(Task.status == StatusEnum.DONE)
+            .label("completed"),
+            func.count(Task.uuid).filter(is_overdue).label("overdue"),
+            func.count(Task.uuid).filter(is_due_in_day).label("due_in_day"),
+            func.count(Task.uuid).filter(is_due_in_week).label("due_in_week"),
+        )
+        stmt = stmt.where(and_(*conditions))
+        stmt = stmt.group_by(day)
+
+        result = await self._session.execute(stmt)
+
+        return {
+            row.day.date(): {
+                "total": row.total,
+                "completed": row.completed,
+                "overdue": row.overdue,
+                "due_in_day": row.due_in_day,
+                "due_in_week": row.due_in_week,
+            }
+            for row in result.all()
+        }
+
+    def _period_conditions(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID],
+        assignee_uuid: Optional[UUID],
+        include_completed: bool,
+    ) -> list:
+        """Условия выборки задач с дедлайном в периоде"""
+        conditions = [
+            Task.deadline >= date_from,
+            Task.deadline <= date_to,
+        ]
+
+        if team_uuid is not None:
+            conditions.append(Task.team_uuid == team_uuid)
+
+        if assignee_uuid is not None:
+            conditions.append(Task.assignee_uuid == assignee_uuid)
+
+        if not include_completed:
+            conditions.append(Task.status != StatusEnum.DONE)
+
+        return conditions
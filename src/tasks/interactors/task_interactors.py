@@ -5,17 +5,27 @@ from typing import (
 )
 from uuid import UUID
 
+from calendars.interfaces import CalendarCache
+from calendars.providers import invalidate_calendar
 from core.interfaces import (
     DBSession,
     PermissionValidator,
     UUIDGenerator,
 )
+from evaluations.interfaces import (
+    EvaluationRepository,
+    EvaluationRollupRepository,
+)
 from tasks.interfaces import TaskRepository
 from tasks.models import Task, StatusEnum
 from tasks.schemas.task import TaskUpdate
 from teams.interfaces import TeamRepository
-from users.interfaces import UserRepository
+from users.interfaces import (
+    UserRepository,
+    UserStatsCache,
+)
 from users.models import RoleEnum
+from users.providers import invalidate_user_stats
 
 
 class CreateTaskDTO:
@@ -49,6 +59,8 @@ class CreateTaskInteractor:
         permission_validator: Optional[PermissionValidator],
         uuid_generator: UUIDGenerator,
         db_session: DBSession,
+        calendar_cache: Optional[CalendarCache] = None,
+        stats_cache: Optional[UserStatsCache] = None,
     ) -> None:
         self._task_repo = task_repo
         self._user_repo = user_repo
@@ -56,6 +68,8 @@ class CreateTaskInteractor:
         self._permission_validator = permission_validator
         self._uuid_generator = uuid_generator
         self._db_session = db_session
+        self._calendar_cache = calendar_cache
+        self._stats_cache = stats_cache
 
     async def __call__(
         self,
@@ -121,6 +135,10 @@ class CreateTaskInteractor:
             # 7. Сохранить
             created_task = await self._task_repo.create_task(task)
             await self._db_session.commit()
+
+            invalidate_calendar(self._calendar_cache, created_task.team_uuid)
+            invalidate_user_stats(self._stats_cache, created_task.assignee_uuid)
+
             return created_task
 
         except Exception:
@@ -189,11 +207,19 @@ class UpdateTaskInteractor:
         user_repo: UserRepository,
         permission_validator: Optional[PermissionValidator],
         db_session: DBSession,
+        calendar_cache: Optional[CalendarCache] = None,
+        evaluation_repo: Optional[EvaluationRepository] = None,
+        rollup_repo: Optional[EvaluationRollupRepository] = None,
+        stats_cache: Optional[UserStatsCache] = None,
     ) -> None:
         self._task_repo = task_repo
         self._user_repo = user_repo
         self._permission_validator = permission_validator
         self._db_session = db_session
+        self._calendar_cache = calendar_cache
+        self._evaluation_repo = evaluation_repo
+        self._rollup_repo = rollup_repo
+        self._stats_cache = stats_cache
 
     async def __call__(
         self,
@@ -230,6 +256,10 @@ class UpdateTaskInteractor:
                         "Только создатель, админ или менеджер команды может обновлять задачу"
                     )
 
+            # Команда и исполнитель до изменений - их кэши тоже нужно сбросить
+            previous_team_uuid = task.team_uuid
+            previous_assignee_uuid = task.assignee_uuid
+
             # 3. Валидация изменений
             if update_data.title is not None:
                 task.title = update_data.title
@@ -260,13 +290,58 @@ class UpdateTaskInteractor:
 
             # 4. Сохранить
             updated_task = await self._task_repo.update_task(task)
+
+            # 5. Перенести оценку задачи в сводку новой команды
+            if previous_team_uuid != updated_task.team_uuid:
+                await self._move_evaluation_rollup(
+                    updated_task,
+                    previous_team_uuid,
+                )
+
             await self._db_session.commit()
+
+            invalidate_calendar(
+                self._calendar_cache,
+                updated_task.team_uuid,
+                previous_team_uuid,
+            )
+            invalidate_user_stats(
+                self._stats_cache,
+                previous_assignee_uuid,
+                updated_task.assignee_uuid,
+            )
+
             return updated_task
 
         except Exception:
             await self._db_session.rollback()
             raise
 
+    async def _move_evaluation_rollup(
+        self,
+        task: Task,
+        previous_team_uuid: Optional[UUID],
+    ) -> None:
+        """Перенести оценку задачи из сводки прежней команды в сводку новой"""
+        if not (self._evaluation_repo and self._rollup_repo):
+            return
+
+        evaluation = await self._evaluation_repo.get_by_task_uuid(task.uuid)
+        if not evaluation:
+            return
+
+        await self._rollup_repo.apply_score(
+            score=evaluation.score,
+            delta=-1,
+            team_uuid=previous_team_uuid,
+        )
+        await self._rollup_repo.apply_score(
+            score=evaluation.score,
+            delta=1,
+            team_uuid=task.team_uuid,
+            evaluated_at=evaluation.created_at,
+        )
+
 
 class DeleteTaskInteractor:
     """Интерактор для удаления задачи"""
@@ -277,11 +352,19 @@ class DeleteTaskInteractor:
         user_repo: UserRepository,
         permission_validator: Optional[PermissionValidator],
         db_session: DBSession,
+        calendar_cache: Optional[CalendarCache] = None,
+        evaluation_repo: Optional[EvaluationRepository] = None,
+        rollup_repo: Optional[EvaluationRollupRepository] = None,
+        stats_cache: Optional[UserStatsCache] = None,
     ) -> None:
         self._task_repo = task_repo
         self._user_repo = user_repo
         self._permission_validator = permission_validator
         self._db_session = db_session
+        self._calendar_cache = calendar_cache
+        self._evaluation_repo = evaluation_repo
+        self._rollup_repo = rollup_repo
+        self._stats_cache = stats_cache
 
     async def __call__(
         self,
@@ -314,10 +397,33 @@ class DeleteTaskInteractor:
                         "Только создатель или админ может удалять задачу"
                     )
 
-            # 3. Удалить задачу
+            # 3. Запомнить оценку: она удаляется каскадно вместе с задачей
+            evaluation = None
+            if self._evaluation_repo and (self._rollup_repo or self._stats_cache):
+                evaluation = await self._evaluation_repo.get_by_task_uuid(task_uuid)
+
+            # 4. Удалить задачу
             result = await self._task_repo.delete_task(task_uuid)
+
+            # 5. Исключить удаленную оценку из сводок
+            if result and evaluation and self._rollup_repo:
+                await self._rollup_repo.apply_score(
+                    score=evaluation.score,
+                    delta=-1,
+                    evaluated_user_uuid=evaluation.evaluated_user_uuid,
+                    team_uuid=task.team_uuid,
+                )
+
             if result:
                 await self._db_session.commit()
+
+                invalidate_calendar(self._calendar_cache, task.team_uuid)
+                invalidate_user_stats(
+                    self._stats_cache,
+                    task.assignee_uuid,
+                    evaluation.evaluated_user_uuid if evaluation else None,
+                )
+
             return result
 
         except Exception:
@@ -334,11 +440,15 @@ class AssignTaskInteractor:
         user_repo: UserRepository,
         permission_validator: Optional[PermissionValidator],
         db_session: DBSession,
+        calendar_cache: Optional[CalendarCache] = None,
+        stats_cache: Optional[UserStatsCache] = None,
     ) -> None:
         self._task_repo = task_repo
         self._user_repo = user_repo
         self._permission_validator = permission_validator
         self._db_session = db_session
+        self._calendar_cache = calendar_cache
+        self._stats_cache = stats_cache
 
     async def __call__(
         self,
@@ -391,9 +501,18 @@ class AssignTaskInteractor:
                     )
 
             # 4. Назначить исполнителя
+            previous_assignee_uuid = task.assignee_uuid
             task.assignee_uuid = assignee_uuid
             updated_task = await self._task_repo.update_task(task)
             await self._db_session.commit()
+
+            invalidate_calendar(self._calendar_cache, updated_task.team_uuid)
+            invalidate_user_stats(
+                self._stats_cache,
+                previous_assignee_uuid,
+                updated_task.assignee_uuid,
+            )
+
             return updated_task
 
         except Exception:
@@ -410,11 +529,15 @@ class ChangeTaskStatusInteractor:
         user_repo: UserRepository,
         permission_validator: Optional[PermissionValidator],
         db_session: DBSession,
+        calendar_cache: Optional[CalendarCache] = None,
+        stats_cache: Optional[UserStatsCache] = None,
     ) -> None:
         self._task_repo = task_repo
         self._user_repo = user_repo
         self._permission_validator = permission_validator
         self._db_session = db_session
+        self._calendar_cache = calendar_cache
+        self._stats_cache = stats_cache
 
     async def __call__(
         self,
@@ -464,6 +587,10 @@ class ChangeTaskStatusInteractor:
             task.status = new_status
             updated_task = await self._task_repo.update_task(task)
             await self._db_session.commit()
+
+            invalidate_calendar(self._calendar_cache, updated_task.team_uuid)
+            invalidate_user_stats(self._stats_cache, updated_task.assignee_uuid)
+
             return updated_task
 
         except Exception:
@@ -593,26 +720,17 @@ class GetTaskStatsInteractor:
             final_team_uuid = team_uuid
             final_assignee_uuid = assignee_uuid
 
-        # 3. Получить статистику
-        status_counts = await self._task_repo.count_tasks_by_status(
+        # 3. Получить статистику одним агрегирующим запросом
+        stats = await self._task_repo.get_task_stats(
             team_uuid=final_team_uuid,
             assignee_uuid=final_assignee_uuid,
         )
 
-        overdue_tasks = await self._task_repo.get_overdue_tasks(
-            team_uuid=final_team_uuid,
-            limit=100,  # Большой лимит для подсчета
-        )
-
         return {
             "status_counts": {
-                status.value: count for status, count in status_counts.items()
+                status.value: count for status, count in stats["status_counts"].items()
             },
-            "total_tasks": sum(status_counts.values()),
-            "overdue_count": len(overdue_tasks),
-            "completion_rate": (
-                status_counts[StatusEnum.DONE] / sum(status_counts.values()) * 100
-                if sum(status_counts.values()) > 0
-                else 0
-            ),
+            "total_tasks": stats["total"],
+            "overdue_count": stats["overdue"],
+            "completion_rate": stats["completion_rate"],
         }
@@ -1,7 +1,15 @@
+from datetime import (
+    date,
+    datetime,
+)
 from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
     List,
     Optional,
     Protocol,
+    Tuple,
 )
 from uuid import UUID
 
@@ -42,6 +50,43 @@ class TaskRepository(Protocol):
         """Получить список задач с фильтрацией"""
         ...
 
+    async def list_tasks_in_period(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        assignee_uuid: Optional[UUID] = None,
+        include_completed: bool = True,
+        after_deadline: Optional[datetime] = None,
+        after_uuid: Optional[UUID] = None,
+        limit: int = 500,
+    ) -> List[Task]:
+        """Получить задачи с дедлайном в периоде (keyset-пагинация по deadline, uuid)"""
+        ...
+
+    def stream_tasks_in_period(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        assignee_uuid: Optional[UUID] = None,
+        include_completed: bool = True,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Task]:
+        """Потоково получить задачи с дедлайном в периоде (серверный курсор)"""
+        ...
+
+    async def get_period_fingerprint(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        assignee_uuid: Optional[UUID] = None,
+        include_completed: bool = True,
+    ) -> Tuple[int, Optional[datetime]]:
+        """Получить количество задач периода и время последнего изменения"""
+        ...
+
     async def get_user_tasks(
         self,
         user_uuid: UUID,
@@ -66,6 +111,7 @@ class TaskRepository(Protocol):
         self,
         team_uuid: Optional[UUID] = None,
         limit: int = 50,
+        assignee_uuid: Optional[UUID] = None,
     ) -> List[Task]:
         """Получить просроченные задачи"""
         ...
@@ -90,3 +136,22 @@ class TaskRepository(Protocol):
     ) -> dict[StatusEnum, int]:
         """Получить количество задач по статусам"""
         ...
+
+    async def get_task_stats(
+        self,
+        team_uuid: Optional[UUID] = None,
+        assignee_uuid: Optional[UUID] = None,
+    ) -> Dict[str, Any]:
+        """Получить статистику задач (статусы, просроченные, процент выполнения)"""
+        ...
+
+    async def count_tasks_by_deadline_day(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        team_uuid: Optional[UUID] = None,
+        assignee_uuid: Optional[UUID] = None,
+        include_completed: bool = True,
+    ) -> Dict[date, Dict[str, int]]:
+        """Получить агрегаты задач по дням дедлайна за период"""
+        ...
@@ -9,7 +9,9 @@ from uuid import UUID
 from sqlalchemy import (
     Enum,
     ForeignKey,
+    Index,
     String,
+    text,
 )
 from sqlalchemy.orm import (
     Mapped,
@@ -32,6 +34,21 @@ class StatusEnum(PyEnum.Enum):
 
 
 class Task(Base):
+    # Индексы повторяют фильтры и сортировки TaskCRUD (deadline, uuid - ключ
+    # keyset-пагинации календаря); частичный - для открытых задач команды
+    __table_args__ = (
+        Index("ix_tasks_team_uuid_deadline", "team_uuid", "deadline", "uuid"),
+        Index("ix_tasks_assignee_uuid_deadline", "assignee_uuid", "deadline", "uuid"),
+        Index("ix_tasks_creator_uuid_deadline", "creator_uuid", "deadline"),
+        Index("ix_tasks_deadline_uuid", "deadline", "uuid"),
+        Index(
+            "ix_tasks_open_team_uuid_deadline",
+            "team_uuid",
+            "deadline",
+            postgresql_where=text("status <> 'DONE'"),
+        ),
+    )
+
     title: Mapped[str] = mapped_column(String(80), nullable=False)
     description: Mapped[str] = mapped_column(nullable=True)
     deadline: Mapped[datetime] = mapped_column(nullable=False)
@@ -72,6 +89,10 @@ class Task(Base):
         "Team",
         back_populates="tasks",
     )
+    # Оценка удаляется вместе с задачей на стороне БД (ondelete="CASCADE")
     evaluation: Mapped["Evaluation"] = relationship(
-        "Evaluation", foreign_keys="Evaluation.task_uuid", back_populates="task"
+        "Evaluation",
+        foreign_keys="Evaluation.task_uuid",
+        back_populates="task",
+        passive_deletes=True,
     )
@@ -14,12 +14,18 @@ from fastapi import (
 )
 
 from core.dependencies import (
+    CalendarCacheDep,
     CurrentUserDep,
+    EvaluationRepoDep,
+    EvaluationRollupRepoDep,
+    ReadTaskRepoDep,
     SessionDep,
+    SessionReleasingRoute,
     TaskRepoDep,
     TeamRepoDep,
     UUIDGeneratorDep,
     UserRepoDep,
+    UserStatsCacheDep,
 )
 from tasks.interactors import (
     AssignTaskInteractor,
@@ -42,7 +48,7 @@ from tasks.schemas.task import (
     TaskWithDetails,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.post(
@@ -54,10 +60,12 @@ async def create_task(
     task_data: TaskCreate,
     current_user: CurrentUserDep,
     session: SessionDep,
+    calendar_cache: CalendarCacheDep,
     task_repo: TaskRepoDep,
     user_repo: UserRepoDep,
     team_repo: TeamRepoDep,
     uuid_generator: UUIDGeneratorDep,
+    stats_cache: UserStatsCacheDep,
 ) -> TaskResponse:
     """Создать новую задачу"""
 
@@ -77,6 +85,8 @@ async def create_task(
         permission_validator=None,
         uuid_generator=uuid_generator,
         db_session=session,
+        calendar_cache=calendar_cache,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -105,7 +115,7 @@ async def create_task(
 )
 async def list_tasks(
     current_user: CurrentUserDep,
-    task_repo: TaskRepoDep,
+    task_repo: ReadTaskRepoDep,
     user_repo: UserRepoDep,
     limit: int = Query(default=50, le=100),
     offset: int = Query(default=0, ge=0),
@@ -158,7 +168,7 @@ async def list_tasks(
 async def get_task(
     task_uuid: UUID,
     current_user: CurrentUserDep,
-    task_repo: TaskRepoDep,
+    task_repo: ReadTaskRepoDep,
     user_repo: UserRepoDep,
 ) -> TaskResponse:
     """Получить задачу по UUID"""
@@ -199,7 +209,7 @@ async def get_task(
 async def get_task_with_details(
     task_uuid: UUID,
     current_user: CurrentUserDep,
-    task_repo: TaskRepoDep,
+    task_repo: ReadTaskRepoDep,
     user_repo: UserRepoDep,
 ) -> TaskWithDetails:
     """Получить задачу с деталями (исполнитель, создатель)"""
@@ -242,8 +252,12 @@ async def update_task(
     update_data: TaskUpdate,
     current_user: CurrentUserDep,
     session: SessionDep,
+    calendar_cache: CalendarCacheDep,
     task_repo: TaskRepoDep,
     user_repo: UserRepoDep,
+    evaluation_repo: EvaluationRepoDep,
+    rollup_repo: EvaluationRollupRepoDep,
+    stats_cache: UserStatsCacheDep,
 ) -> TaskResponse:
     """Обновить задачу"""
 
@@ -252,6 +266,10 @@ async def update_task(
         user_repo=user_repo,
         permission_validator=None,
         db_session=session,
+        calendar_cache=calendar_cache,
+        evaluation_repo=evaluation_repo,
+        rollup_repo=rollup_repo,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -283,8 +301,12 @@ async def delete_task(
     task_uuid: UUID,
     current_user: CurrentUserDep,
     session: SessionDep,
+    calendar_cache: CalendarCacheDep,
     task_repo: TaskRepoDep,
     user_repo: UserRepoDep,
+    evaluation_repo: EvaluationRepoDep,
+    rollup_repo: EvaluationRollupRepoDep,
+    stats_cache: UserStatsCacheDep,
 ) -> Dict[str, str]:
     """Удалить задачу"""
 
@@ -293,6 +315,10 @@ async def delete_task(
         user_repo=user_repo,
         permission_validator=None,
         db_session=session,
+        calendar_cache=calendar_cache,
+        evaluation_repo=evaluation_repo,
+        rollup_repo=rollup_repo,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -326,8 +352,10 @@ async def assign_task(
     assign_data: TaskAssign,
     current_user: CurrentUserDep,
     session: SessionDep,
+    calendar_cache: CalendarCacheDep,
     task_repo: TaskRepoDep,
     user_repo: UserRepoDep,
+    stats_cache: UserStatsCacheDep,
 ) -> TaskResponse:
     """Назначить исполнителя задачи"""
 
@@ -336,6 +364,8 @@ async def assign_task(
         user_repo=user_repo,
         permission_validator=None,
         db_session=session,
+        calendar_cache=calendar_cache,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -368,8 +398,10 @@ async def unassign_task(
     task_uuid: UUID,
     current_user: CurrentUserDep,
     session: SessionDep,
+    calendar_cache: CalendarCacheDep,
     task_repo: TaskRepoDep,
     user_repo: UserRepoDep,
+    stats_cache: UserStatsCacheDep,
 ) -> TaskResponse:
     """Снять исполнителя с задачи"""
 
@@ -378,6 +410,8 @@ async def unassign_task(
         user_repo=user_repo,
         permission_validator=None,
         db_session=session,
+        calendar_cache=calendar_cache,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -411,8 +445,10 @@ async def change_task_status(
     status_data: TaskStatusUpdate,
     current_user: CurrentUserDep,
     session: SessionDep,
+    calendar_cache: CalendarCacheDep,
     task_repo: TaskRepoDep,
     user_repo: UserRepoDep,
+    stats_cache: UserStatsCacheDep,
 ) -> TaskResponse:
     """Изменить статус задачи"""
 
@@ -421,6 +457,8 @@ async def change_task_status(
         user_repo=user_repo,
         permission_validator=None,
         db_session=session,
+        calendar_cache=calendar_cache,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -450,7 +488,7 @@ async def change_task_status(
 )
 async def get_task_stats(
     current_user: CurrentUserDep,
-    task_repo: TaskRepoDep,
+    task_repo: ReadTaskRepoDep,
     user_repo: UserRepoDep,
     team_uuid: Optional[UUID] = Query(default=None),
     assignee_uuid: Optional[UUID] = Query(default=None),
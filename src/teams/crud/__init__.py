@@ -1,5 +1,7 @@
 __all__ = (
     "TeamCRUD",
+    "InviteCodeCRUD",
 )
 
-from .teams import TeamCRUD
\ No newline at end of file
+from .invite_codes import InviteCodeCRUD
+from .teams import TeamCRUD
@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    and_,
+    delete,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from teams.interfaces.interfaces import InviteCodeRepository
+from teams.models import TeamInviteCode
+
+
+class InviteCodeCRUD(InviteCodeRepository):
+    """Имплементация InviteCodeRepository"""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def create_code(
+        self,
+        code: str,
+        team_uuid: UUID,
+        created_by: UUID,
+        expires_at: datetime,
+    ) -> TeamInviteCode:
+        """Сохранить код приглашения"""
+        invite_code = TeamInviteCode(
+            code=code,
+            team_uuid=team_uuid,
+            created_by=created_by,
+            expires_at=expires_at,
+            is_active=True,
+        )
+        self._session.add(invite_code)
+        await self._session.flush()
+        return invite_code
+
+    async def get_team_uuid(self, code: str, now: datetime) -> Optional[UUID]:
+        """Получить UUID команды по действующему коду"""
+        stmt = select(TeamInviteCode.team_uuid).where(
+            and_(
+                TeamInviteCode.code == code,
+                TeamInviteCode.is_active == True,  # noqa: E712
+                TeamInviteCode.expires_at > now,
+            )
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def invalidate_code(self, code: str) -> bool:
+        """Деактивировать код приглашения"""
+        stmt = (
+            update(TeamInviteCode)
+            .where(
+                and_(
+                    TeamInviteCode.code == code,
+                    TeamInviteCode.is_active == True,  # noqa: E712
+                )
+            )
+            .values(is_active=False)
+            .returning(TeamInviteCode.uuid)
+        )
+        result = await self._session.execute(stmt)
+        return result.first() is not None
+
+    async def delete_expired(self, expired_before: datetime) -> int:
+        """Удалить истекшие и деактивированные коды"""
+        stmt = (
+            delete(TeamInviteCode)
+            .where(
+                (TeamInviteCode.expires_at <= expired_before)
+                | (TeamInviteCode.is_active == False)  # noqa: E712
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount
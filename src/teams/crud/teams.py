@@ -12,6 +12,7 @@ from sqlalchemy import (
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from core.interfaces.auth import AccessTokenRevocationRegistry
 from teams.interfaces.interfaces import TeamRepository
 from teams.models import Team
 
@@ -19,8 +20,19 @@ from teams.models import Team
 class TeamCRUD(TeamRepository):
     """Имплементация TeamRepository"""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        token_revocation: Optional[AccessTokenRevocationRegistry] = None,
+    ) -> None:
+        """
+        Args:
+            session: Сессия БД
+            token_revocation: Реестр отзыва claims access токенов
+                (удаление команды делает claims ее участников устаревшими)
+        """
         self._session = session
+        self._token_revocation = token_revocation
 
     async def create_team(self, team: Team) -> Team:
         """Создать новую команду"""
@@ -31,9 +43,7 @@ class TeamCRUD(TeamRepository):
 
     async def get_by_uuid(self, team_uuid: UUID) -> Optional[Team]:
         """Получить команду по UUID"""
-        stmt = select(Team).where(Team.uuid == team_uuid)
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self._session.get(Team, team_uuid)
 
     async def get_by_name(self, name: str) -> Optional[Team]:
         """Получить команду по названию"""
@@ -56,6 +66,10 @@ class TeamCRUD(TeamRepository):
 
         await self._session.delete(team)
         await self._session.flush()
+
+        if self._token_revocation:
+            self._token_revocation.revoke_team(team_uuid)
+
         return True
 
     async def get_user_teams(self, user_uuid: UUID) -> List[Team]:
@@ -1,7 +1,6 @@
 import secrets
 from datetime import datetime, timedelta
 from typing import (
-    Dict,
     List,
     Optional,
 )
@@ -12,6 +11,7 @@ from core.interfaces import (
     PermissionValidator,
 )
 from teams.interfaces import (
+    InviteCodeRepository,
     TeamRepository,
 )
 from teams.models import Team
@@ -255,19 +255,20 @@ class TransferOwnershipInteractor:
 class GenerateInviteCodeInteractor:
     """Интерактор для генерации кода приглашения в команду"""
 
-    # Простое хранилище кодов в памяти (в реальном проекте - Redis/БД)
-    _invite_codes: Dict[str, Dict] = {}
-
     def __init__(
         self,
         team_repo: TeamRepository,
         user_repo: UserRepository,
+        invite_code_repo: InviteCodeRepository,
         permission_validator: Optional[PermissionValidator],
+        db_session: DBSession,
         code_ttl_hours: int = 24,
     ) -> None:
         self._team_repo = team_repo
         self._user_repo = user_repo
+        self._invite_code_repo = invite_code_repo
         self._permission_validator = permission_validator
+        self._db_session = db_session
         self._code_ttl_hours = code_ttl_hours
 
     async def __call__(
@@ -277,80 +278,53 @@ class GenerateInviteCodeInteractor:
     ) -> str:
         """Сгенерировать код приглашения"""
 
-        # 1. Найти участников
-        actor = await self._user_repo.get_by_uuid(actor_uuid)
-        team = await self._team_repo.get_by_uuid(team_uuid)
+        try:
+            # 1. Найти участников
+            actor = await self._user_repo.get_by_uuid(actor_uuid)
+            team = await self._team_repo.get_by_uuid(team_uuid)
 
-        if not actor:
-            raise ValueError("Пользователь не найден")
-        if not team:
-            raise ValueError("Команда не найдена")
+            if not actor:
+                raise ValueError("Пользователь не найден")
+            if not team:
+                raise ValueError("Команда не найдена")
 
-        # 2. Проверить права доступа
-        if self._permission_validator:
-            if not await self._permission_validator.can_add_team_member(actor, team):
-                raise PermissionError("Нет прав для создания приглашений")
-        else:
-            # Временная простая проверка
-            is_owner = team.owner_uuid == actor.uuid
-            is_admin = actor.role == RoleEnum.ADMIN
-            is_manager_same_team = (
-                actor.role == RoleEnum.MANAGER and actor.team_uuid == team.uuid
+            # 2. Проверить права доступа
+            if self._permission_validator:
+                if not await self._permission_validator.can_add_team_member(
+                    actor, team
+                ):
+                    raise PermissionError("Нет прав для создания приглашений")
+            else:
+                # Временная простая проверка
+                is_owner = team.owner_uuid == actor.uuid
+                is_admin = actor.role == RoleEnum.ADMIN
+                is_manager_same_team = (
+                    actor.role == RoleEnum.MANAGER and actor.team_uuid == team.uuid
+                )
+
+                if not (is_owner or is_admin or is_manager_same_team):
+                    raise PermissionError(
+                        "Только владелец команды, админ или менеджер команды может создавать приглашения"
+                    )
+
+            # 3. Сгенерировать код (уникальность гарантирует индекс в БД)
+            invite_code = secrets.token_urlsafe(8)
+            expires_at = datetime.now() + timedelta(hours=self._code_ttl_hours)
+
+            # 4. Сохранить код
+            await self._invite_code_repo.create_code(
+                code=invite_code,
+                team_uuid=team_uuid,
+                created_by=actor_uuid,
+                expires_at=expires_at,
             )
+            await self._db_session.commit()
 
-            if not (is_owner or is_admin or is_manager_same_team):
-                raise PermissionError(
-                    "Только владелец команды, админ или менеджер команды может создавать приглашения"
-                )
+            return invite_code
 
-        # 3. Сгенерировать уникальный код
-        invite_code = self._generate_unique_code()
-        expires_at = datetime.now() + timedelta(hours=self._code_ttl_hours)
-
-        # 4. Сохранить код
-        self._invite_codes[invite_code] = {
-            "team_uuid": str(team_uuid),
-            "created_by": str(actor_uuid),
-            "created_at": datetime.now(),
-            "expires_at": expires_at,
-            "is_active": True,
-        }
-
-        return invite_code
-
-    def _generate_unique_code(self) -> str:
-        """Сгенерировать уникальный код приглашения"""
-        while True:
-            code = secrets.token_urlsafe(8)  # 8 символов
-            if code not in self._invite_codes:
-                return code
-
-    @classmethod
-    def get_team_by_invite_code(cls, invite_code: str) -> Optional[str]:
-        """Получить UUID команды по коду приглашения"""
-        if invite_code not in cls._invite_codes:
-            return None
-
-        invite_data = cls._invite_codes[invite_code]
-
-        # Проверить активность и срок действия
-        if not invite_data["is_active"]:
-            return None
-
-        if datetime.now() > invite_data["expires_at"]:
-            # Деактивировать истекший код
-            invite_data["is_active"] = False
-            return None
-
-        return invite_data["team_uuid"]
-
-    @classmethod
-    def invalidate_invite_code(cls, invite_code: str) -> bool:
-        """Деактивировать код приглашения"""
-        if invite_code in cls._invite_codes:
-            cls._invite_codes[invite_code]["is_active"] = False
-            return True
-        return False
+        except Exception:
+            await self._db_session.rollback()
+            raise
 
 
 class JoinTeamByInviteCodeInteractor:
@@ -360,10 +334,12 @@ class JoinTeamByInviteCodeInteractor:
         self,
         team_repo: TeamRepository,
         user_repo: UserRepository,
+        invite_code_repo: InviteCodeRepository,
         db_session: DBSession,
     ) -> None:
         self._team_repo = team_repo
         self._user_repo = user_repo
+        self._invite_code_repo = invite_code_repo
         self._db_session = db_session
 
     async def __call__(
@@ -380,13 +356,13 @@ class JoinTeamByInviteCodeInteractor:
                 raise ValueError("Пользователь не найден")
 
             # 2. Проверить код приглашения
-            team_uuid_str = GenerateInviteCodeInteractor.get_team_by_invite_code(
-                invite_code
+            team_uuid = await self._invite_code_repo.get_team_uuid(
+                invite_code,
+                datetime.now(),
             )
-            if not team_uuid_str:
+            if not team_uuid:
                 raise ValueError("Недействительный или истекший код приглашения")
 
-            team_uuid = UUID(team_uuid_str)
             team = await self._team_repo.get_by_uuid(team_uuid)
             if not team:
                 raise ValueError("Команда не найдена")
@@ -408,7 +384,7 @@ class JoinTeamByInviteCodeInteractor:
             await self._user_repo.update_user(user)
 
             # 5. Деактивировать использованный код (опционально)
-            # GenerateInviteCodeInteractor.invalidate_invite_code(invite_code)
+            # await self._invite_code_repo.invalidate_code(invite_code)
 
             await self._db_session.commit()
             return True
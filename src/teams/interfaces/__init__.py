@@ -1,9 +1,11 @@
 __all__ = (
+    "InviteCodeRepository",
     "TeamMembershipManager",
     "TeamRepository",
 )
 
 from .interfaces import (
+    InviteCodeRepository,
     TeamMembershipManager,
     TeamRepository,
 )
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import (
     List,
     Optional,
@@ -5,7 +6,10 @@ from typing import (
 )
 from uuid import UUID
 
-from teams.models import Team
+from teams.models import (
+    Team,
+    TeamInviteCode,
+)
 
 
 class TeamRepository(Protocol):
@@ -61,6 +65,32 @@ class TeamRepository(Protocol):
         ...
 
 
+class InviteCodeRepository(Protocol):
+    """Интерфейс хранилища кодов приглашения в команды"""
+
+    async def create_code(
+        self,
+        code: str,
+        team_uuid: UUID,
+        created_by: UUID,
+        expires_at: datetime,
+    ) -> TeamInviteCode:
+        """Сохранить код приглашения"""
+        ...
+
+    async def get_team_uuid(self, code: str, now: datetime) -> Optional[UUID]:
+        """Получить UUID команды по действующему (активному, не истекшему) коду"""
+        ...
+
+    async def invalidate_code(self, code: str) -> bool:
+        """Деактивировать код приглашения"""
+        ...
+
+    async def delete_expired(self, expired_before: datetime) -> int:
+        """Удалить истекшие и деактивированные коды"""
+        ...
+
+
 class TeamMembershipManager(Protocol):
     """Интерфейс для управления членством пользователей в командах"""
 
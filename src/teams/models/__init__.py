@@ -1,5 +1,7 @@
 __all__ = (
     "Team",
+    "TeamInviteCode",
 )
 
-from .team import Team
\ No newline at end of file
+from .invite_code import TeamInviteCode
+from .team import Team
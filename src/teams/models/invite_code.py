@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    Boolean,
+    ForeignKey,
+    String,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+from core.models.base import Base
+
+
+class TeamInviteCode(Base):
+    """Код приглашения в команду (общий для всех воркеров)"""
+
+    code: Mapped[str] = mapped_column(
+        String(32),
+        nullable=False,
+        unique=True,
+        index=True,
+    )
+    team_uuid: Mapped[UUID] = mapped_column(
+        ForeignKey("teams.uuid", ondelete="CASCADE"),
+        nullable=False,
+    )
+    created_by: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey("users.uuid", ondelete="SET NULL"),
+        nullable=True,
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        nullable=False,
+        index=True,
+    )
+    is_active: Mapped[bool] = mapped_column(
+        Boolean,
+        default=True,
+        nullable=False,
+    )
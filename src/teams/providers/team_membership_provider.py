@@ -4,6 +4,7 @@ from uuid import UUID
 
 from core.interfaces import DBSession
 from teams.interfaces import (
+    InviteCodeRepository,
     TeamMembershipManager,
     TeamRepository,
 )
@@ -24,10 +25,12 @@ class TeamMembershipManagerProvider(TeamMembershipManager):
         self,
         team_repo: TeamRepository,
         user_repo: UserRepository,
+        invite_code_repo: InviteCodeRepository,
         db_session: DBSession,
     ) -> None:
         self._team_repo = team_repo
         self._user_repo = user_repo
+        self._invite_code_repo = invite_code_repo
         self._db_session = db_session
 
     async def add_user_to_team(
@@ -103,7 +106,9 @@ class TeamMembershipManagerProvider(TeamMembershipManager):
         interactor = GenerateInviteCodeInteractor(
             team_repo=self._team_repo,
             user_repo=self._user_repo,
+            invite_code_repo=self._invite_code_repo,
             permission_validator=None,  # Пока None
+            db_session=self._db_session,
         )
 
         return await interactor(
@@ -121,6 +126,7 @@ class TeamMembershipManagerProvider(TeamMembershipManager):
         interactor = JoinTeamByInviteCodeInteractor(
             team_repo=self._team_repo,
             user_repo=self._user_repo,
+            invite_code_repo=self._invite_code_repo,
             db_session=self._db_session,
         )
 
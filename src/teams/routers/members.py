@@ -14,7 +14,9 @@ from fastapi import (
 
 from core.dependencies import (
     CurrentUserDep,
+    InviteCodeRepoDep,
     SessionDep,
+    SessionReleasingRoute,
     TeamRepoDep,
     UserRepoDep,
 )
@@ -33,7 +35,7 @@ from teams.schemas.team import (
 )
 from users.schemas import UserInTeam
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.get(
@@ -243,15 +245,19 @@ async def transfer_ownership(
 async def generate_invite_code(
     team_uuid: UUID,
     current_user: CurrentUserDep,
+    session: SessionDep,
     team_repo: TeamRepoDep,
     user_repo: UserRepoDep,
+    invite_code_repo: InviteCodeRepoDep,
 ) -> TeamInviteResponse:
     """Сгенерировать код приглашения в команду"""
 
     interactor = GenerateInviteCodeInteractor(
         team_repo=team_repo,
         user_repo=user_repo,
+        invite_code_repo=invite_code_repo,
         permission_validator=None,
+        db_session=session,
     )
 
     try:
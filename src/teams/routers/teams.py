@@ -15,6 +15,7 @@ from fastapi import (
 from core.dependencies import (
     CurrentUserDep,
     SessionDep,
+    SessionReleasingRoute,
     TeamRepoDep,
     UserRepoDep,
     UUIDGeneratorDep,
@@ -34,7 +35,7 @@ from teams.schemas.team import (
     TeamWithMembers,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.post(
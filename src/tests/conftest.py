@@ -37,6 +37,32 @@ from users.providers import BcryptPasswordHasherProvider
 TEST_DB_URL = settings.test_db_config.url
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Опции запуска тестов"""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="Запустить интеграционные тесты (нужен PostgreSQL из test_db_config)",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config,
+    items: list[pytest.Item],
+) -> None:
+    """Без --run-integration интеграционные тесты явно помечаются пропущенными"""
+    if config.getoption("--run-integration"):
+        return
+
+    skip_integration = pytest.mark.skip(
+        reason="интеграционный тест: нужен PostgreSQL, запуск с --run-integration",
+    )
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
     """event loop для всей сессии тестов"""
@@ -135,7 +161,7 @@ async def admin_user(
     admin = User(
         uuid=uuid_generator(),
         email="admin@example.com",
-        password=password_hasher.hash_password("UserAdmin123!"),
+        password=await password_hasher.hash_password("UserAdmin123!"),
         name="Admin",
         surname="User",
         gender=GenderEnum.MALE,
@@ -162,7 +188,7 @@ async def manager_user(
     manager = User(
         uuid=uuid_generator(),
         email="manager@example.com",
-        password=password_hasher.hash_password("UserManager123!"),
+        password=await password_hasher.hash_password("UserManager123!"),
         name="Manager",
         surname="User",
         gender=GenderEnum.FEMALE,
@@ -190,7 +216,7 @@ async def employee_user(
     employee = User(
         uuid=uuid_generator(),
         email="employee@example.com",
-        password=password_hasher.hash_password("UserEmployee123!"),
+        password=await password_hasher.hash_password("UserEmployee123!"),
         name="Employee",
         surname="User",
         gender=GenderEnum.MALE,
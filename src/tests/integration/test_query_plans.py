@@ -0,0 +1,331 @@
+import json
+import random
+from contextlib import contextmanager
+from datetime import (
+    date,
+    datetime,
+    timedelta,
+)
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Tuple,
+)
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import (
+    event,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
+
+from core.config import settings
+from core.models import (
+    Base,
+    meeting_participants,
+)
+from evaluations.crud import EvaluationCRUD
+from evaluations.models import (
+    Evaluation,
+    ScoresEnum,
+)
+from meetings.crud import MeetingCRUD
+from meetings.models import Meeting
+from tasks.crud import TaskCRUD
+from tasks.models import (
+    StatusEnum,
+    Task,
+)
+from teams.models import Team
+from users.models import (
+    GenderEnum,
+    RoleEnum,
+    User,
+)
+
+TEST_DB_URL = settings.test_db_config.url
+
+# Таблицы, по которым последовательное сканирование недопустимо
+HOT_TABLES = {"tasks", "meetings", "evaluations", "meeting_participants"}
+
+TEAMS_COUNT = 50
+USERS_COUNT = 500
+TASKS_COUNT = 20000
+MEETINGS_COUNT = 10000
+PARTICIPANTS_PER_MEETING = 3
+
+
+@pytest_asyncio.fixture
+async def plan_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """
+    Движок тестовой БД с данными в объеме, при котором важны индексы.
+
+    Тесты запускаются только с --run-integration; недоступный PostgreSQL
+    в этом режиме - ошибка, а не пропуск.
+    """
+    engine = create_async_engine(TEST_DB_URL, poolclass=NullPool)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with engine.begin() as conn:
+        await seed(conn)
+
+    async with engine.begin() as conn:
+        for table in sorted(HOT_TABLES | {"users", "teams"}):
+            await conn.execute(text(f"ANALYZE {table}"))
+
+    yield engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+    await engine.dispose()
+
+
+async def seed(conn: Any) -> None:
+    """Заполнить таблицы: даты в основном в прошлом, как в живой системе"""
+    rnd = random.Random(42)
+    now = datetime.now()
+
+    users = [
+        {
+            "uuid": uuid4(),
+            "email": f"user{i}@example.com",
+            "password": "x",
+            "is_active": True,
+            "is_verified": True,
+            "name": "User",
+            "surname": str(i),
+            "gender": GenderEnum.MALE,
+            "birth_date": date(1990, 1, 1),
+            "role": RoleEnum.EMPLOYEE,
+        }
+        for i in range(USERS_COUNT)
+    ]
+    await conn.execute(insert(User), users)
+    user_uuids = [user["uuid"] for user in users]
+
+    teams = [
+        {
+            "uuid": uuid4(),
+            "name": f"Team {i}",
+            "description": "",
+            "owner_uuid": rnd.choice(user_uuids),
+        }
+        for i in range(TEAMS_COUNT)
+    ]
+    await conn.execute(insert(Team), teams)
+    team_uuids = [team["uuid"] for team in teams]
+
+    def past_biased_moment() -> datetime:
+        # Два года истории и месяц вперед
+        return now - timedelta(minutes=rnd.randint(-30 * 24 * 60, 730 * 24 * 60))
+
+    tasks = [
+        {
+            "uuid": uuid4(),
+            "title": f"Task {i}",
+            "deadline": past_biased_moment(),
+            "status": rnd.choice(list(StatusEnum)),
+            "assignee_uuid": rnd.choice(user_uuids),
+            "creator_uuid": rnd.choice(user_uuids),
+            "team_uuid": rnd.choice(team_uuids),
+        }
+        for i in range(TASKS_COUNT)
+    ]
+    await conn.execute(insert(Task), tasks)
+
+    evaluations = [
+        {
+            "uuid": uuid4(),
+            "task_uuid": task["uuid"],
+            "evaluator_uuid": task["creator_uuid"],
+            "evaluated_user_uuid": task["assignee_uuid"],
+            "score": rnd.choice(list(ScoresEnum)),
+        }
+        for task in tasks
+        if task["status"] == StatusEnum.DONE
+    ]
+    await conn.execute(insert(Evaluation), evaluations)
+
+    meetings = [
+        {
+            "uuid": uuid4(),
+            "title": f"Meeting {i}",
+            "date_time": past_biased_moment(),
+            "creator_uuid": rnd.choice(user_uuids),
+            "team_uuid": rnd.choice(team_uuids),
+        }
+        for i in range(MEETINGS_COUNT)
+    ]
+    await conn.execute(insert(Meeting), meetings)
+
+    participants = [
+        {"meeting_uuid": meeting["uuid"], "user_uuid": user_uuid}
+        for meeting in meetings
+        for user_uuid in rnd.sample(user_uuids, PARTICIPANTS_PER_MEETING)
+    ]
+    await conn.execute(insert(meeting_participants), participants)
+
+
+@contextmanager
+def capture_statements(engine: AsyncEngine) -> Iterator[List[Tuple[str, Any]]]:
+    """Перехватить SQL, который репозиторий отправляет в БД"""
+    statements: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(
+            engine.sync_engine,
+            "before_cursor_execute",
+            before_cursor_execute,
+        )
+
+
+def find_seq_scans(plan: Dict[str, Any]) -> List[str]:
+    """Найти последовательные сканирования горячих таблиц в плане"""
+    found = []
+
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in HOT_TABLES:
+        found.append(plan["Relation Name"])
+
+    for child in plan.get("Plans", []):
+        found.extend(find_seq_scans(child))
+
+    return found
+
+
+@pytest.mark.integration
+class TestRepositoryQueryPlans:
+    """Запросы репозиториев используют индексы, а не полное сканирование"""
+
+    @pytest_asyncio.fixture
+    async def session(
+        self,
+        plan_engine: AsyncEngine,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        session_factory = async_sessionmaker(bind=plan_engine, expire_on_commit=False)
+        async with session_factory() as session:
+            yield session
+
+    @pytest.fixture
+    def repository_calls(
+        self,
+    ) -> Dict[str, Callable[[AsyncSession, Dict[str, Any]], Awaitable[Any]]]:
+        now = datetime.now()
+        week_from = now - timedelta(days=3)
+        week_to = now + timedelta(days=4)
+
+        return {
+            "tasks.list_tasks(team)": lambda s, ids: TaskCRUD(s).list_tasks(
+                team_uuid=ids["team"]
+            ),
+            "tasks.list_tasks(assignee)": lambda s, ids: TaskCRUD(s).list_tasks(
+                assignee_uuid=ids["user"]
+            ),
+            "tasks.list_tasks_in_period": lambda s, ids: TaskCRUD(
+                s
+            ).list_tasks_in_period(week_from, week_to, team_uuid=ids["team"]),
+            "tasks.get_user_tasks": lambda s, ids: TaskCRUD(s).get_user_tasks(
+                ids["user"]
+            ),
+            "tasks.get_team_tasks": lambda s, ids: TaskCRUD(s).get_team_tasks(
+                ids["team"]
+            ),
+            "tasks.get_overdue_tasks": lambda s, ids: TaskCRUD(s).get_overdue_tasks(
+                team_uuid=ids["team"]
+            ),
+            "tasks.get_task_stats": lambda s, ids: TaskCRUD(s).get_task_stats(
+                team_uuid=ids["team"]
+            ),
+            "meetings.list_meetings": lambda s, ids: MeetingCRUD(s).list_meetings(
+                team_uuid=ids["team"]
+            ),
+            "meetings.get_user_meetings": lambda s, ids: MeetingCRUD(
+                s
+            ).get_user_meetings(ids["user"]),
+            "meetings.get_team_meetings": lambda s, ids: MeetingCRUD(
+                s
+            ).get_team_meetings(ids["team"]),
+            "meetings.get_upcoming_meetings": lambda s, ids: MeetingCRUD(
+                s
+            ).get_upcoming_meetings(user_uuid=ids["user"]),
+            "meetings.get_meetings_by_date": lambda s, ids: MeetingCRUD(
+                s
+            ).get_meetings_by_date(now, user_uuid=ids["user"]),
+            "meetings.check_time_conflicts": lambda s, ids: MeetingCRUD(
+                s
+            ).check_time_conflicts(ids["user"], now, now + timedelta(hours=1)),
+            "meetings.get_meeting_stats": lambda s, ids: MeetingCRUD(
+                s
+            ).get_meeting_stats(user_uuid=ids["user"]),
+            "evaluations.get_user_evaluations": lambda s, ids: EvaluationCRUD(
+                s
+            ).get_user_evaluations(ids["user"]),
+            "evaluations.get_evaluations_by_evaluator": lambda s, ids: EvaluationCRUD(
+                s
+            ).get_evaluations_by_evaluator(ids["user"]),
+            "evaluations.get_team_evaluations": lambda s, ids: EvaluationCRUD(
+                s
+            ).get_team_evaluations(ids["team"]),
+            "evaluations.get_evaluation_stats(user)": lambda s, ids: EvaluationCRUD(
+                s
+            ).get_evaluation_stats(user_uuid=ids["user"]),
+        }
+
+    async def test_no_sequential_scans(
+        self,
+        plan_engine: AsyncEngine,
+        session: AsyncSession,
+        repository_calls: Dict[str, Callable[..., Awaitable[Any]]],
+    ) -> None:
+        """Тест: ни один запрос репозиториев не сканирует горячие таблицы целиком"""
+
+        ids = {
+            "team": await session.scalar(select(Team.uuid).limit(1)),
+            "user": await session.scalar(select(User.uuid).limit(1)),
+        }
+        connection = await session.connection()
+
+        failures = {}
+
+        for name, call in repository_calls.items():
+            with capture_statements(plan_engine) as statements:
+                await call(session, ids)
+
+            for statement, parameters in statements:
+                explained = await connection.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}",
+                    parameters,
+                )
+                raw_plan = explained.scalar_one()
+                plan = json.loads(raw_plan) if isinstance(raw_plan, str) else raw_plan
+
+                seq_scans = find_seq_scans(plan[0]["Plan"])
+                if seq_scans:
+                    failures[name] = {"seq_scans": seq_scans, "sql": statement}
+
+        assert failures == {}
@@ -0,0 +1,175 @@
+from datetime import (
+    date,
+    datetime,
+    timedelta,
+)
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Optional,
+    Set,
+)
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
+
+from core.config import settings
+from core.models import (
+    Base,
+    TokenType,
+    UserToken,
+)
+from core.providers import TokenRepositoryProvider
+from users.models import (
+    GenderEnum,
+    RoleEnum,
+    User,
+)
+
+TEST_DB_URL = settings.test_db_config.url
+
+
+@pytest_asyncio.fixture
+async def session() -> AsyncGenerator[AsyncSession, None]:
+    """Сессия тестовой БД со схемой, созданной с нуля"""
+    engine = create_async_engine(TEST_DB_URL, poolclass=NullPool)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(bind=engine, expire_on_commit=False)() as session:
+        yield session
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+    await engine.dispose()
+
+
+async def add_refresh_token(
+    session: AsyncSession,
+    is_user_active: bool = True,
+    is_token_active: bool = True,
+    expires_in: timedelta = timedelta(days=7),
+) -> User:
+    """Создать пользователя с refresh токеном old-hash"""
+    user = User(
+        uuid=uuid4(),
+        email=f"{uuid4().hex}@example.com",
+        password="x",
+        name="Ivan",
+        surname="Ivanov",
+        gender=GenderEnum.MALE,
+        birth_date=date(1990, 1, 1),
+        role=RoleEnum.EMPLOYEE,
+        is_active=is_user_active,
+        is_verified=True,
+    )
+    session.add(user)
+    await session.flush()
+
+    session.add(
+        UserToken(
+            uuid=uuid4(),
+            user_uuid=user.uuid,
+            token_hash="old-hash",
+            token_type=TokenType.REFRESH,
+            expires_at=datetime.now() + expires_in,
+            is_active=is_token_active,
+            ip_address="127.0.0.1",
+            user_agent="pytest",
+        )
+    )
+    await session.commit()
+    return user
+
+
+async def active_hashes(session: AsyncSession) -> Set[str]:
+    """Хэши активных токенов"""
+    result = await session.execute(
+        select(UserToken.token_hash).where(UserToken.is_active == True)  # noqa: E712
+    )
+    return set(result.scalars().all())
+
+
+@pytest.mark.integration
+class TestRotateRefreshTokenByHash:
+    """Ротация refresh токена одним запросом на PostgreSQL"""
+
+    NEW_EXPIRES_AT = datetime.now() + timedelta(days=30)
+
+    async def rotate(self, session: AsyncSession) -> Optional[Dict[str, Any]]:
+        owner = await TokenRepositoryProvider(session).rotate_refresh_token_by_hash(
+            old_token_hash="old-hash",
+            new_token_hash="new-hash",
+            new_expires_at=self.NEW_EXPIRES_AT,
+        )
+        await session.commit()
+        return owner
+
+    @pytest.mark.asyncio
+    async def test_valid_token_rotated(self, session: AsyncSession) -> None:
+        """Тест: старый токен деактивирован, новый создан с его ip и user agent"""
+
+        user = await add_refresh_token(session)
+
+        owner = await self.rotate(session)
+
+        assert owner == {
+            "user_uuid": user.uuid,
+            "role": RoleEnum.EMPLOYEE,
+            "team_uuid": None,
+        }
+        assert await active_hashes(session) == {"new-hash"}
+
+        new_token = await session.scalar(
+            select(UserToken).where(UserToken.token_hash == "new-hash")
+        )
+        assert new_token.user_uuid == user.uuid
+        assert new_token.token_type == TokenType.REFRESH
+        assert new_token.ip_address == "127.0.0.1"
+        assert new_token.user_agent == "pytest"
+
+    @pytest.mark.asyncio
+    async def test_reused_token_rejected(self, session: AsyncSession) -> None:
+        """Тест: повторное предъявление уже ротированного токена отклоняется"""
+
+        await add_refresh_token(session)
+        assert await self.rotate(session) is not None
+
+        owner = await TokenRepositoryProvider(session).rotate_refresh_token_by_hash(
+            old_token_hash="old-hash",
+            new_token_hash="another-hash",
+            new_expires_at=self.NEW_EXPIRES_AT,
+        )
+
+        assert owner is None
+        assert await active_hashes(session) == {"new-hash"}
+
+    @pytest.mark.asyncio
+    async def test_expired_token_rejected(self, session: AsyncSession) -> None:
+        """Тест: истекший токен не ротируется и нового не появляется"""
+
+        await add_refresh_token(session, expires_in=timedelta(minutes=-1))
+
+        assert await self.rotate(session) is None
+        assert await active_hashes(session) == {"old-hash"}
+
+    @pytest.mark.asyncio
+    async def test_inactive_user_rejected(self, session: AsyncSession) -> None:
+        """Тест: токен заблокированного пользователя не ротируется"""
+
+        await add_refresh_token(session, is_user_active=False)
+
+        assert await self.rotate(session) is None
+        assert await active_hashes(session) == {"old-hash"}
@@ -0,0 +1,126 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from calendars.providers import (
+    InMemoryCalendarCacheProvider,
+    invalidate_calendar,
+)
+from tasks.interactors import DeleteTaskInteractor
+from users.models import RoleEnum
+
+
+@pytest.mark.unit
+class TestInMemoryCalendarCache:
+    """Unit тесты для InMemoryCalendarCacheProvider"""
+
+    @pytest.fixture
+    def cache(self) -> InMemoryCalendarCacheProvider:
+        return InMemoryCalendarCacheProvider(ttl_seconds=60, max_entries=2)
+
+    def test_get_counts_hits_and_misses(
+        self,
+        cache: InMemoryCalendarCacheProvider,
+    ) -> None:
+        """Тест: промах, затем попадание"""
+
+        assert cache.get("month") is None
+
+        cache.set("month", "value", team_uuid=None)
+
+        assert cache.get("month") == "value"
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_expired_entry_is_miss(self) -> None:
+        """Тест: истекшая запись не возвращается"""
+
+        cache = InMemoryCalendarCacheProvider(ttl_seconds=0)
+        cache.set("month", "value", team_uuid=None)
+
+        assert cache.get("month") is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_lru_evicts_least_recently_used(
+        self,
+        cache: InMemoryCalendarCacheProvider,
+    ) -> None:
+        """Тест: при переполнении вытесняется давно не читавшаяся запись"""
+
+        cache.set("a", 1, team_uuid=None)
+        cache.set("b", 2, team_uuid=None)
+        cache.get("a")
+        cache.set("c", 3, team_uuid=None)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_invalidate_team_drops_team_and_global_views(self) -> None:
+        """Тест: сброс команды затрагивает ее и общие представления"""
+
+        cache = InMemoryCalendarCacheProvider()
+        team_a = uuid4()
+        team_b = uuid4()
+
+        cache.set("team_a", 1, team_uuid=team_a)
+        cache.set("team_b", 2, team_uuid=team_b)
+        cache.set("all", 3, team_uuid=None)
+
+        assert cache.invalidate_team(team_a) == 2
+
+        assert cache.get("team_a") is None
+        assert cache.get("all") is None
+        assert cache.get("team_b") == 2
+
+
+@pytest.mark.unit
+class TestInvalidateCalendar:
+    """Unit тесты для invalidate_calendar"""
+
+    def test_no_team_drops_global_views(self) -> None:
+        """Тест: None сбрасывает общие представления, команды не трогает"""
+
+        cache = InMemoryCalendarCacheProvider()
+        team = uuid4()
+        cache.set("team", 1, team_uuid=team)
+        cache.set("all", 2, team_uuid=None)
+
+        invalidate_calendar(cache, None)
+
+        assert cache.get("all") is None
+        assert cache.get("team") == 1
+
+    @pytest.mark.asyncio
+    async def test_deleting_task_without_team_drops_global_views(self) -> None:
+        """Тест: удаление задачи без команды сбрасывает общий календарь"""
+
+        cache = InMemoryCalendarCacheProvider()
+        cache.set("all", 1, team_uuid=None)
+
+        admin = SimpleNamespace(uuid=uuid4(), role=RoleEnum.ADMIN)
+        task = SimpleNamespace(
+            uuid=uuid4(),
+            team_uuid=None,
+            creator_uuid=admin.uuid,
+            assignee_uuid=None,
+        )
+        user_repo = AsyncMock()
+        user_repo.get_by_uuid.return_value = admin
+        task_repo = AsyncMock()
+        task_repo.get_by_uuid.return_value = task
+        task_repo.delete_task.return_value = True
+
+        interactor = DeleteTaskInteractor(
+            task_repo=task_repo,
+            user_repo=user_repo,
+            permission_validator=None,
+            db_session=AsyncMock(),
+            calendar_cache=cache,
+        )
+
+        assert await interactor(actor_uuid=admin.uuid, task_uuid=task.uuid)
+        assert cache.get("all") is None
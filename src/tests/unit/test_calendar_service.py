@@ -0,0 +1,80 @@
+from datetime import datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from calendars.schemas import (
+    CalendarEvent,
+    EventPriority,
+    EventType,
+)
+from calendars.services import CalendarService
+
+
+@pytest.mark.unit
+class TestCalendarServiceGrid:
+    """Unit тесты для построения календарной сетки"""
+
+    @pytest.fixture
+    def calendar_service(self) -> CalendarService:
+        return CalendarService(
+            task_repo=AsyncMock(),
+            meeting_repo=AsyncMock(),
+            user_repo=AsyncMock(),
+        )
+
+    def make_event(
+        self,
+        date_time: datetime,
+        priority: EventPriority = EventPriority.LOW,
+        is_overdue: bool = False,
+    ) -> CalendarEvent:
+        return CalendarEvent(
+            uuid=uuid4(),
+            title="event",
+            event_type=EventType.MEETING,
+            date_time=date_time,
+            priority=priority,
+            is_overdue=is_overdue,
+        )
+
+    def test_group_events_by_date_sorts_inside_day(
+        self,
+        calendar_service: CalendarService,
+    ) -> None:
+        """Тест: события группируются по дате и сортируются по времени"""
+
+        late = self.make_event(datetime(2025, 3, 10, 18, 0))
+        early = self.make_event(datetime(2025, 3, 10, 9, 0))
+        other_day = self.make_event(datetime(2025, 3, 11, 12, 0))
+
+        grouped = calendar_service._group_events_by_date([late, other_day, early])
+
+        assert grouped[datetime(2025, 3, 10).date()] == [early, late]
+        assert grouped[datetime(2025, 3, 11).date()] == [other_day]
+
+    @pytest.mark.asyncio
+    async def test_build_month_weeks_places_events_on_days(
+        self,
+        calendar_service: CalendarService,
+    ) -> None:
+        """Тест: события месяца попадают в свои дни сетки"""
+
+        urgent = self.make_event(
+            datetime(2025, 3, 10, 9, 0),
+            priority=EventPriority.URGENT,
+            is_overdue=True,
+        )
+        regular = self.make_event(datetime(2025, 3, 31, 15, 0))
+
+        weeks = await calendar_service._build_month_weeks(2025, 3, [regular, urgent])
+
+        days = {day.date.day: day for week in weeks for day in week.days}
+
+        assert len(days) == 31
+        assert days[10].events == [urgent]
+        assert days[10].has_overdue is True
+        assert days[10].has_urgent is True
+        assert days[31].total_events == 1
+        assert sum(week.total_events for week in weeks) == 2
@@ -0,0 +1,41 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from core.models.db_helper import MeteredAsyncQueuePool
+
+
+@pytest.mark.unit
+class TestMeteredAsyncQueuePool:
+    """Unit тесты для метрик пула соединений"""
+
+    @pytest.mark.asyncio
+    async def test_records_checkouts_and_timeouts(self) -> None:
+        """Тест: учитываются выдачи соединений, открытия и таймауты"""
+
+        pool = MeteredAsyncQueuePool(
+            creator=MagicMock,
+            pool_size=1,
+            max_overflow=0,
+            timeout=0.01,
+        )
+
+        def checkout_twice() -> None:
+            connection = pool.connect()
+            with pytest.raises(exc.TimeoutError):
+                pool.connect()
+            connection.close()
+            # Соединение вернулось в пул и переиспользуется
+            pool.connect().close()
+
+        await greenlet_spawn(checkout_twice)
+
+        stats = pool.timings.get_stats()["checkout"]
+
+        assert pool.connections_opened == 1
+        assert pool.checkout_timeouts == 1
+        assert stats["count"] == 3
+        assert sum(stats["buckets"].values()) == 3
+        assert pool.checkedout() == 0
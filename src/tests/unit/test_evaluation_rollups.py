@@ -0,0 +1,319 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import (
+    AsyncMock,
+    call,
+)
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from evaluations.crud import EvaluationRollupCRUD
+from evaluations.interactors import (
+    DeleteEvaluationInteractor,
+    GetUserEvaluationStatsInteractor,
+    UpdateEvaluationInteractor,
+)
+from evaluations.models import (
+    ScoresEnum,
+    UserEvaluationRollup,
+)
+from evaluations.schemas.evaluation import EvaluationUpdate
+from tasks.interactors import (
+    DeleteTaskInteractor,
+    UpdateTaskInteractor,
+)
+from tasks.schemas.task import TaskUpdate
+from users.models import RoleEnum
+
+
+def compile_statements(session: AsyncMock) -> list:
+    """SQL всех выполненных в сессии выражений (диалект PostgreSQL)"""
+    return [
+        str(
+            statement.args[0].compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        for statement in session.execute.await_args_list
+    ]
+
+
+@pytest.mark.unit
+class TestEvaluationRollups:
+    """Unit тесты для сводок оценок"""
+
+    @pytest.fixture
+    def admin(self) -> SimpleNamespace:
+        return SimpleNamespace(uuid=uuid4(), role=RoleEnum.ADMIN, team_uuid=None)
+
+    @pytest.fixture
+    def evaluation(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            uuid=uuid4(),
+            evaluator_uuid=uuid4(),
+            evaluated_user_uuid=uuid4(),
+            score=ScoresEnum.BAD,
+            comment=None,
+            created_at=datetime(2026, 10, 1),
+            task=SimpleNamespace(team_uuid=uuid4()),
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_moves_score_between_buckets(
+        self,
+        admin: SimpleNamespace,
+        evaluation: SimpleNamespace,
+    ) -> None:
+        """Тест: смена балла исключает старый и учитывает новый в одной транзакции"""
+
+        user_repo = AsyncMock()
+        user_repo.get_by_uuid.return_value = admin
+        evaluation_repo = AsyncMock()
+        evaluation_repo.get_evaluation_with_relations.return_value = evaluation
+        evaluation_repo.update_evaluation.side_effect = lambda e: e
+        rollup_repo = AsyncMock()
+        db_session = AsyncMock()
+
+        interactor = UpdateEvaluationInteractor(
+            evaluation_repo=evaluation_repo,
+            user_repo=user_repo,
+            permission_validator=None,
+            db_session=db_session,
+            rollup_repo=rollup_repo,
+        )
+
+        await interactor(
+            actor_uuid=admin.uuid,
+            evaluation_uuid=evaluation.uuid,
+            update_data=EvaluationUpdate(score=ScoresEnum.GREAT),
+        )
+
+        assert rollup_repo.apply_score.await_args_list == [
+            call(
+                score=ScoresEnum.BAD,
+                delta=-1,
+                evaluated_user_uuid=evaluation.evaluated_user_uuid,
+                team_uuid=evaluation.task.team_uuid,
+            ),
+            call(
+                score=ScoresEnum.GREAT,
+                delta=1,
+                evaluated_user_uuid=evaluation.evaluated_user_uuid,
+                team_uuid=evaluation.task.team_uuid,
+                evaluated_at=evaluation.created_at,
+            ),
+        ]
+        db_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_score(
+        self,
+        admin: SimpleNamespace,
+        evaluation: SimpleNamespace,
+    ) -> None:
+        """Тест: удаленная оценка исключается из сводок"""
+
+        user_repo = AsyncMock()
+        user_repo.get_by_uuid.return_value = admin
+        evaluation_repo = AsyncMock()
+        evaluation_repo.get_evaluation_with_relations.return_value = evaluation
+        evaluation_repo.delete_evaluation.return_value = True
+        rollup_repo = AsyncMock()
+
+        interactor = DeleteEvaluationInteractor(
+            evaluation_repo=evaluation_repo,
+            user_repo=user_repo,
+            permission_validator=None,
+            db_session=AsyncMock(),
+            rollup_repo=rollup_repo,
+        )
+
+        assert await interactor(actor_uuid=admin.uuid, evaluation_uuid=evaluation.uuid)
+
+        rollup_repo.apply_score.assert_awaited_once_with(
+            score=ScoresEnum.BAD,
+            delta=-1,
+            evaluated_user_uuid=evaluation.evaluated_user_uuid,
+            team_uuid=evaluation.task.team_uuid,
+        )
+
+    @pytest.mark.asyncio
+    async def test_user_stats_read_from_rollup(self, admin: SimpleNamespace) -> None:
+        """Тест: статистика пользователя берется из сводки без пересчета истории"""
+
+        target = SimpleNamespace(
+            uuid=uuid4(), name="Ivan", surname="Ivanov", team_uuid=None
+        )
+        rollup = UserEvaluationRollup(
+            user_uuid=target.uuid,
+            evaluations_count=3,
+            score_sum=13,
+            unacceptable_count=0,
+            bad_count=0,
+            satisfactory_count=0,
+            good_count=2,
+            great_count=1,
+            last_evaluated_at=datetime(2026, 10, 1),
+        )
+
+        user_repo = AsyncMock()
+        user_repo.get_by_uuid.side_effect = [admin, target]
+        evaluation_repo = AsyncMock()
+        evaluation_repo.count_evaluations_by_period.return_value = 1
+        rollup_repo = AsyncMock()
+        rollup_repo.get_user_stats.return_value = EvaluationRollupCRUD._to_stats(
+            rollup
+        )
+
+        interactor = GetUserEvaluationStatsInteractor(
+            evaluation_repo=evaluation_repo,
+            user_repo=user_repo,
+            permission_validator=None,
+            rollup_repo=rollup_repo,
+        )
+
+        stats = await interactor(actor_uuid=admin.uuid, target_user_uuid=target.uuid)
+
+        evaluation_repo.get_evaluation_stats.assert_not_awaited()
+        assert stats["average_score"] == 4.33
+        assert stats["total_evaluations"] == 3
+        assert stats["evaluations_last_30_days"] == 1
+        assert stats["score_distribution"][ScoresEnum.GOOD.value] == 2
+        assert stats["performance_level"] == "Good"
+
+    @pytest.mark.asyncio
+    async def test_apply_score_upserts_increments(self) -> None:
+        """Тест: учет оценки - атомарный upsert с инкрементами счетчиков"""
+
+        session = AsyncMock()
+        user_uuid = uuid4()
+
+        await EvaluationRollupCRUD(session).apply_score(
+            score=ScoresEnum.GOOD,
+            delta=1,
+            evaluated_user_uuid=user_uuid,
+            evaluated_at=datetime(2026, 10, 1),
+        )
+
+        [sql] = compile_statements(session)
+        assert sql.startswith("INSERT INTO userevaluationrollups")
+        assert "ON CONFLICT (user_uuid) DO UPDATE SET" in sql
+        assert "evaluations_count = (userevaluationrollups.evaluations_count + 1)" in sql
+        assert "score_sum = (userevaluationrollups.score_sum + 4)" in sql
+        assert "good_count = (userevaluationrollups.good_count + 1)" in sql
+        assert "greatest(userevaluationrollups.last_evaluated_at" in sql
+
+    @pytest.mark.asyncio
+    async def test_apply_score_decrements_and_recomputes_last(self) -> None:
+        """Тест: исключение оценки уменьшает счетчики и пересчитывает время"""
+
+        session = AsyncMock()
+        team_uuid = uuid4()
+
+        await EvaluationRollupCRUD(session).apply_score(
+            score=ScoresEnum.BAD,
+            delta=-1,
+            team_uuid=team_uuid,
+        )
+
+        [sql] = compile_statements(session)
+        assert sql.startswith("UPDATE teamevaluationrollups SET")
+        assert "evaluations_count=(teamevaluationrollups.evaluations_count + -1)" in sql
+        assert "score_sum=(teamevaluationrollups.score_sum + -2)" in sql
+        assert "bad_count=(teamevaluationrollups.bad_count + -1)" in sql
+        assert "last_evaluated_at=(SELECT max(evaluations.created_at)" in sql
+        assert f"WHERE teamevaluationrollups.team_uuid = '{team_uuid}'" in sql
+
+    @pytest.mark.asyncio
+    async def test_task_delete_removes_cascaded_evaluation(
+        self,
+        admin: SimpleNamespace,
+        evaluation: SimpleNamespace,
+    ) -> None:
+        """Тест: оценка, удаленная каскадно с задачей, исключается из сводок"""
+
+        task = SimpleNamespace(
+            uuid=uuid4(),
+            team_uuid=evaluation.task.team_uuid,
+            creator_uuid=admin.uuid,
+            assignee_uuid=evaluation.evaluated_user_uuid,
+        )
+        user_repo = AsyncMock()
+        user_repo.get_by_uuid.return_value = admin
+        task_repo = AsyncMock()
+        task_repo.get_by_uuid.return_value = task
+        task_repo.delete_task.return_value = True
+        evaluation_repo = AsyncMock()
+        evaluation_repo.get_by_task_uuid.return_value = evaluation
+        rollup_repo = AsyncMock()
+
+        interactor = DeleteTaskInteractor(
+            task_repo=task_repo,
+            user_repo=user_repo,
+            permission_validator=None,
+            db_session=AsyncMock(),
+            evaluation_repo=evaluation_repo,
+            rollup_repo=rollup_repo,
+        )
+
+        assert await interactor(actor_uuid=admin.uuid, task_uuid=task.uuid)
+
+        rollup_repo.apply_score.assert_awaited_once_with(
+            score=ScoresEnum.BAD,
+            delta=-1,
+            evaluated_user_uuid=evaluation.evaluated_user_uuid,
+            team_uuid=task.team_uuid,
+        )
+
+    @pytest.mark.asyncio
+    async def test_task_team_change_moves_evaluation(
+        self,
+        admin: SimpleNamespace,
+        evaluation: SimpleNamespace,
+    ) -> None:
+        """Тест: перенос задачи в другую команду переносит оценку между сводками"""
+
+        old_team_uuid = evaluation.task.team_uuid
+        new_team_uuid = uuid4()
+        task = SimpleNamespace(
+            uuid=uuid4(),
+            team_uuid=old_team_uuid,
+            creator_uuid=admin.uuid,
+            assignee_uuid=evaluation.evaluated_user_uuid,
+        )
+        user_repo = AsyncMock()
+        user_repo.get_by_uuid.return_value = admin
+        task_repo = AsyncMock()
+        task_repo.get_by_uuid.return_value = task
+        task_repo.update_task.side_effect = lambda t: t
+        evaluation_repo = AsyncMock()
+        evaluation_repo.get_by_task_uuid.return_value = evaluation
+        rollup_repo = AsyncMock()
+
+        interactor = UpdateTaskInteractor(
+            task_repo=task_repo,
+            user_repo=user_repo,
+            permission_validator=None,
+            db_session=AsyncMock(),
+            evaluation_repo=evaluation_repo,
+            rollup_repo=rollup_repo,
+        )
+
+        await interactor(
+            actor_uuid=admin.uuid,
+            task_uuid=task.uuid,
+            update_data=TaskUpdate(team_uuid=new_team_uuid),
+        )
+
+        assert rollup_repo.apply_score.await_args_list == [
+            call(score=ScoresEnum.BAD, delta=-1, team_uuid=old_team_uuid),
+            call(
+                score=ScoresEnum.BAD,
+                delta=1,
+                team_uuid=new_team_uuid,
+                evaluated_at=evaluation.created_at,
+            ),
+        ]
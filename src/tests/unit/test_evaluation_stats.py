@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+)
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from evaluations.crud import EvaluationCRUD
+from evaluations.interactors import GetTeamEvaluationStatsInteractor
+from evaluations.models import ScoresEnum
+from users.models import RoleEnum
+
+
+@pytest.mark.unit
+class TestEvaluationStats:
+    """Unit тесты для статистики оценок"""
+
+    @pytest.mark.asyncio
+    async def test_crud_aggregates_in_one_query(self) -> None:
+        """Тест: средний балл, количество и распределение считаются в БД"""
+
+        row = SimpleNamespace(
+            average_score=3.5,
+            total=4,
+            recent=1,
+            UNACCEPTABLE=0,
+            BAD=1,
+            SATISFACTORY=1,
+            GOOD=1,
+            GREAT=1,
+        )
+        result = MagicMock()
+        result.one.return_value = row
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        stats = await EvaluationCRUD(session).get_evaluation_stats(team_uuid=uuid4())
+
+        session.execute.assert_awaited_once()
+        sql = str(
+            session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "avg(CASE WHEN" in sql
+        assert "FILTER (WHERE" in sql
+        assert "LIMIT" not in sql
+
+        assert stats["average_score"] == 3.5
+        assert stats["total"] == 4
+        assert stats["recent"] == 1
+        assert stats["score_distribution"][ScoresEnum.UNACCEPTABLE] == 0
+        assert stats["score_distribution"][ScoresEnum.GREAT] == 1
+
+    @pytest.mark.asyncio
+    async def test_team_stats_are_not_truncated(self) -> None:
+        """Тест: статистика команды не ограничена 1000 оценками"""
+
+        team_uuid = uuid4()
+        actor = SimpleNamespace(uuid=uuid4(), role=RoleEnum.MANAGER, team_uuid=None)
+
+        user_repo = AsyncMock()
+        user_repo.get_by_uuid.return_value = actor
+        evaluation_repo = AsyncMock()
+        evaluation_repo.get_evaluation_stats.return_value = {
+            "average_score": 4.256,
+            "total": 5000,
+            "recent": 120,
+            "score_distribution": {score: 1000 for score in ScoresEnum},
+        }
+
+        interactor = GetTeamEvaluationStatsInteractor(
+            evaluation_repo=evaluation_repo,
+            user_repo=user_repo,
+            permission_validator=None,
+        )
+
+        stats = await interactor(actor_uuid=actor.uuid, team_uuid=team_uuid)
+
+        evaluation_repo.get_team_evaluations.assert_not_awaited()
+        assert stats["total_evaluations"] == 5000
+        assert stats["average_score"] == 4.26
+        assert stats["evaluations_last_30_days"] == 120
+        assert stats["score_distribution"][ScoresEnum.GOOD.value] == 1000
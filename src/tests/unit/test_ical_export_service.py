@@ -0,0 +1,162 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from calendars.schemas import (
+    CalendarFilter,
+    EventType,
+)
+from calendars.services import ICalendarExportService
+from meetings.crud import MeetingCRUD
+from tasks.models import StatusEnum
+
+
+async def iterate(*items):
+    for item in items:
+        yield item
+
+
+@pytest.mark.unit
+class TestICalendarExportService:
+    """Unit тесты для ICalendarExportService"""
+
+    @pytest.fixture
+    def task(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            uuid=uuid4(),
+            title="Отчет, квартал; итоги",
+            description="Строка 1\nСтрока 2",
+            deadline=datetime(2025, 3, 10, 18, 0),
+            updated_at=datetime(2025, 3, 1, 12, 0),
+            status=StatusEnum.DONE,
+        )
+
+    @pytest.fixture
+    def meeting(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            uuid=uuid4(),
+            title="Планерка",
+            description=None,
+            date_time=datetime(2025, 3, 11, 10, 0),
+            updated_at=datetime(2025, 3, 2, 9, 0),
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_builds_vcalendar(
+        self,
+        task: SimpleNamespace,
+        meeting: SimpleNamespace,
+    ) -> None:
+        """Тест: выгрузка содержит VEVENT для задачи и встречи"""
+
+        task_repo = MagicMock()
+        task_repo.stream_tasks_in_period.return_value = iterate(task)
+        meeting_repo = MagicMock()
+        meeting_repo.stream_meetings_in_period.return_value = iterate(meeting)
+
+        service = ICalendarExportService(task_repo, meeting_repo)
+
+        chunks = [
+            chunk
+            async for chunk in service.stream(
+                datetime(2025, 3, 1),
+                datetime(2025, 3, 31),
+                CalendarFilter(),
+            )
+        ]
+        body = "".join(chunks)
+
+        assert body.startswith("BEGIN:VCALENDAR\r\n")
+        assert body.endswith("END:VCALENDAR\r\n")
+        assert body.count("BEGIN:VEVENT") == 2
+        assert f"UID:task-{task.uuid}@business-manager" in body
+        assert "SUMMARY:Отчет\\, квартал\\; итоги" in body
+        assert "DESCRIPTION:Строка 1\\nСтрока 2" in body
+        assert "DTSTART:20250311T100000\r\nDTEND:20250311T110000" in body
+
+    @pytest.mark.asyncio
+    async def test_etag_changes_with_fingerprint(self) -> None:
+        """Тест: ETag меняется при изменении данных периода"""
+
+        task_repo = MagicMock()
+        task_repo.get_period_fingerprint = AsyncMock(
+            return_value=(1, datetime(2025, 3, 1))
+        )
+        meeting_repo = MagicMock()
+        meeting_repo.get_period_fingerprint = AsyncMock(
+            return_value=(0, None, None)
+        )
+
+        service = ICalendarExportService(task_repo, meeting_repo)
+        args = (datetime(2025, 3, 1), datetime(2025, 3, 31), CalendarFilter())
+
+        first = await service.get_etag(*args)
+        assert first == await service.get_etag(*args)
+
+        task_repo.get_period_fingerprint.return_value = (1, datetime(2025, 3, 2))
+        assert first != await service.get_etag(*args)
+
+    @pytest.mark.asyncio
+    async def test_etag_changes_with_meeting_set(self) -> None:
+        """Тест: перевод участника на другую встречу меняет ETag ленты"""
+
+        task_repo = MagicMock()
+        meeting_repo = MagicMock()
+        meeting_repo.get_period_fingerprint = AsyncMock(
+            return_value=(1, datetime(2025, 3, 1), "hash-a")
+        )
+
+        service = ICalendarExportService(task_repo, meeting_repo)
+        args = (
+            datetime(2025, 3, 1),
+            datetime(2025, 3, 31),
+            CalendarFilter(user_uuid=uuid4(), event_types=[EventType.MEETING]),
+        )
+
+        first = await service.get_etag(*args)
+
+        # Количество и updated_at те же, другой набор встреч
+        meeting_repo.get_period_fingerprint.return_value = (
+            1,
+            datetime(2025, 3, 1),
+            "hash-b",
+        )
+        assert first != await service.get_etag(*args)
+
+    @pytest.mark.asyncio
+    async def test_meeting_fingerprint_hashes_meeting_uuids(self) -> None:
+        """Тест: отпечаток встреч включает хэш упорядоченного набора UUID"""
+
+        result = MagicMock()
+        result.one.return_value = (1, datetime(2025, 3, 1), "hash")
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        fingerprint = await MeetingCRUD(session).get_period_fingerprint(
+            date_from=datetime(2025, 3, 1),
+            date_to=datetime(2025, 3, 31),
+            participant_uuid=uuid4(),
+        )
+
+        assert fingerprint == (1, datetime(2025, 3, 1), "hash")
+        sql = str(
+            session.execute.await_args.args[0].compile(
+                dialect=postgresql.dialect(),
+            )
+        )
+        assert "md5(string_agg(CAST(meetings.uuid AS TEXT)" in sql
+        assert "ORDER BY meetings.uuid" in sql
+
+    def test_fold_long_lines(self) -> None:
+        """Тест: строки длиннее 75 октетов переносятся"""
+
+        line = "SUMMARY:" + "я" * 60
+
+        folded = ICalendarExportService._fold(line)
+
+        assert all(len(part.encode("utf-8")) <= 75 for part in folded.split("\r\n"))
+        assert folded.replace("\r\n ", "") == line
@@ -0,0 +1,94 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+)
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from teams.crud import InviteCodeCRUD
+from teams.interactors import (
+    GenerateInviteCodeInteractor,
+    JoinTeamByInviteCodeInteractor,
+)
+from users.models import RoleEnum
+
+
+@pytest.mark.unit
+class TestInviteCodeInteractors:
+    """Unit тесты для кодов приглашения в команду"""
+
+    @pytest.mark.asyncio
+    async def test_generate_stores_code_in_repository(self) -> None:
+        """Тест: код сохраняется в общем хранилище, а не в памяти процесса"""
+
+        owner = SimpleNamespace(uuid=uuid4(), role=RoleEnum.EMPLOYEE, team_uuid=None)
+        team = SimpleNamespace(uuid=uuid4(), owner_uuid=owner.uuid)
+
+        user_repo = AsyncMock()
+        user_repo.get_by_uuid.return_value = owner
+        team_repo = AsyncMock()
+        team_repo.get_by_uuid.return_value = team
+        invite_code_repo = AsyncMock()
+        db_session = AsyncMock()
+
+        interactor = GenerateInviteCodeInteractor(
+            team_repo=team_repo,
+            user_repo=user_repo,
+            invite_code_repo=invite_code_repo,
+            permission_validator=None,
+            db_session=db_session,
+        )
+
+        code = await interactor(actor_uuid=owner.uuid, team_uuid=team.uuid)
+
+        invite_code_repo.create_code.assert_awaited_once()
+        assert invite_code_repo.create_code.await_args.kwargs["code"] == code
+        db_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_join_with_unknown_code_fails(self) -> None:
+        """Тест: недействительный код отклоняется"""
+
+        user = SimpleNamespace(uuid=uuid4(), team_uuid=None, is_active=True)
+
+        user_repo = AsyncMock()
+        user_repo.get_by_uuid.return_value = user
+        invite_code_repo = AsyncMock()
+        invite_code_repo.get_team_uuid.return_value = None
+        db_session = AsyncMock()
+
+        interactor = JoinTeamByInviteCodeInteractor(
+            team_repo=AsyncMock(),
+            user_repo=user_repo,
+            invite_code_repo=invite_code_repo,
+            db_session=db_session,
+        )
+
+        with pytest.raises(ValueError):
+            await interactor(user_uuid=user.uuid, invite_code="unknown")
+
+        db_session.rollback.assert_awaited_once()
+
+
+@pytest.mark.unit
+class TestInviteCodeCRUD:
+    """Unit тесты для InviteCodeCRUD"""
+
+    @pytest.mark.asyncio
+    async def test_delete_expired_counts_with_rowcount(self) -> None:
+        """Тест: очистка кодов не возвращает строки, счет - rowcount"""
+
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(rowcount=3)
+
+        deleted = await InviteCodeCRUD(session).delete_expired(datetime(2026, 10, 18))
+
+        assert deleted == 3
+        sql = str(
+            session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "RETURNING" not in sql
@@ -1,9 +1,14 @@
 from uuid import uuid4
 
+import jwt
 import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
 from core.interfaces import JWTProviderInterface
-from core.providers import JWTProvider
+from core.providers import (
+    AsymmetricSigningBackend,
+    JWTProvider,
+)
 
 
 @pytest.mark.unit
@@ -195,3 +200,132 @@ class TestJWTProvider:
         result = short_lived_provider.is_token_expired(token)
 
         assert result is True
+
+    def test_verify_access_token_uses_cache(
+        self,
+        jwt_provider: JWTProvider,
+    ) -> None:
+        """Тест: повторная проверка того же токена берется из кэша"""
+
+        token = jwt_provider.create_access_token(uuid4(), "EMPLOYEE")
+
+        first = jwt_provider.verify_access_token(token)
+        first["role"] = "ADMIN"
+        second = jwt_provider.verify_access_token(token)
+
+        assert second["role"] == "EMPLOYEE"
+        stats = jwt_provider.get_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["size"] == 1
+
+    def test_verified_cache_is_bounded(self) -> None:
+        """Тест: при переполнении кэша вытесняются старые токены"""
+
+        provider = JWTProvider(
+            secret_key="bounded-cache-provider-secret-key",
+            algorithm="HS256",
+            verified_cache_max_entries=2,
+        )
+
+        for _ in range(3):
+            provider.verify_access_token(
+                provider.create_access_token(uuid4(), "EMPLOYEE")
+            )
+
+        stats = provider.get_cache_stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+
+    def test_invalid_token_is_not_cached(
+        self,
+        jwt_provider: JWTProvider,
+    ) -> None:
+        """Тест: невалидные токены не попадают в кэш"""
+
+        assert jwt_provider.verify_access_token("invalid.token") is None
+        assert jwt_provider.get_cache_stats()["size"] == 0
+
+
+@pytest.mark.unit
+class TestAsymmetricSigning:
+    """Unit тесты для подписи access токенов парой ключей"""
+
+    @pytest.fixture
+    def backend(self) -> AsymmetricSigningBackend:
+        return AsymmetricSigningBackend(
+            private_keys={
+                "2026-09": Ed25519PrivateKey.generate(),
+                "2026-10": Ed25519PrivateKey.generate(),
+            },
+            active_kid="2026-10",
+            algorithm="EdDSA",
+        )
+
+    def make_provider(self, backend: AsymmetricSigningBackend) -> JWTProvider:
+        return JWTProvider(
+            secret_key="unused",
+            algorithm="EdDSA",
+            signing_backend=backend,
+        )
+
+    def test_token_signed_with_active_kid(
+        self,
+        backend: AsymmetricSigningBackend,
+    ) -> None:
+        """Тест: токен подписан активным ключом и проверяется"""
+
+        provider = self.make_provider(backend)
+        user_uuid = uuid4()
+
+        token = provider.create_access_token(user_uuid, "EMPLOYEE")
+
+        assert jwt.get_unverified_header(token)["kid"] == "2026-10"
+        assert provider.get_user_from_token(token) == user_uuid
+
+    def test_token_of_rotated_out_key_still_verifies(
+        self,
+        backend: AsymmetricSigningBackend,
+    ) -> None:
+        """Тест: после ротации токены старого ключа остаются валидными"""
+
+        old_backend = AsymmetricSigningBackend(
+            private_keys={"2026-09": backend._private_keys["2026-09"]},
+            active_kid="2026-09",
+            algorithm="EdDSA",
+        )
+        token = self.make_provider(old_backend).create_access_token(
+            uuid4(),
+            "EMPLOYEE",
+        )
+
+        assert self.make_provider(backend).verify_access_token(token) is not None
+
+    def test_unknown_kid_is_rejected(
+        self,
+        backend: AsymmetricSigningBackend,
+    ) -> None:
+        """Тест: токен с неизвестным kid не принимается"""
+
+        foreign_backend = AsymmetricSigningBackend(
+            private_keys={"foreign": Ed25519PrivateKey.generate()},
+            active_kid="foreign",
+            algorithm="EdDSA",
+        )
+        token = self.make_provider(foreign_backend).create_access_token(
+            uuid4(),
+            "EMPLOYEE",
+        )
+
+        assert self.make_provider(backend).verify_access_token(token) is None
+
+    def test_jwks_publishes_public_keys(
+        self,
+        backend: AsymmetricSigningBackend,
+    ) -> None:
+        """Тест: JWKS содержит открытые ключи всех kid без закрытой части"""
+
+        jwks = self.make_provider(backend).get_jwks()
+
+        assert {key["kid"] for key in jwks["keys"]} == {"2026-09", "2026-10"}
+        assert all(key["kty"] == "OKP" and "d" not in key for key in jwks["keys"])
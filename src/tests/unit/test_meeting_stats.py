@@ -0,0 +1,82 @@
+from datetime import (
+    date,
+    datetime,
+)
+from types import SimpleNamespace
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+)
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from meetings.crud import MeetingCRUD
+from meetings.interactors import GetMeetingStatsInteractor
+from users.models import RoleEnum
+
+
+@pytest.mark.unit
+class TestMeetingStats:
+    """Unit тесты для статистики встреч"""
+
+    @pytest.mark.asyncio
+    async def test_crud_counts_by_week_in_one_query(self) -> None:
+        """Тест: итоги складываются из недельных счетчиков одного запроса"""
+
+        rows = [
+            SimpleNamespace(week=datetime(2026, 9, 21), total=40, upcoming=0),
+            SimpleNamespace(week=datetime(2026, 10, 12), total=150, upcoming=120),
+            SimpleNamespace(week=datetime(2026, 10, 19), total=200, upcoming=200),
+            # Встречи дальше недельного окна
+            SimpleNamespace(week=None, total=30, upcoming=30),
+        ]
+        result = MagicMock()
+        result.all.return_value = rows
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        stats = await MeetingCRUD(session).get_meeting_stats(team_uuid=uuid4())
+
+        session.execute.assert_awaited_once()
+        sql = str(
+            session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "FILTER (WHERE" in sql
+        assert "CASE WHEN" in sql
+        assert "LIMIT" not in sql
+
+        assert stats["total_last_days"] == 420
+        assert stats["upcoming"] == 350
+        assert stats["by_week"][date(2026, 10, 19)] == {"total": 200, "upcoming": 200}
+        assert len(stats["by_week"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_upcoming_count_is_not_capped(self) -> None:
+        """Тест: число предстоящих встреч не ограничено лимитом выборки"""
+
+        actor = SimpleNamespace(uuid=uuid4(), role=RoleEnum.ADMIN, team_uuid=None)
+        user_repo = AsyncMock()
+        user_repo.get_by_uuid.return_value = actor
+        meeting_repo = AsyncMock()
+        meeting_repo.get_meeting_stats.return_value = {
+            "total_last_days": 12,
+            "upcoming": 250,
+            "by_week": {date(2026, 10, 19): {"total": 250, "upcoming": 250}},
+        }
+
+        interactor = GetMeetingStatsInteractor(
+            meeting_repo=meeting_repo,
+            user_repo=user_repo,
+            permission_validator=None,
+        )
+
+        stats = await interactor(actor_uuid=actor.uuid)
+
+        meeting_repo.get_upcoming_meetings.assert_not_awaited()
+        assert stats["upcoming_meetings_count"] == 250
+        assert stats["total_meetings_last_30_days"] == 12
+        assert stats["meetings_by_week"] == [
+            {"week_start": "2026-10-19", "total": 250, "upcoming": 250}
+        ]
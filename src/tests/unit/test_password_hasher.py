@@ -1,12 +1,17 @@
 import pytest
 from users.interfaces import PasswordHasher
+from users.providers import (
+    BcryptPasswordHasherProvider,
+    PasswordHashingPool,
+)
 
 
 @pytest.mark.unit
 class TestBcryptPasswordHasher:
     """Тесты для BcryptPasswordHasherProvider"""
 
-    def test_hash_password_creates_different_hashes(
+    @pytest.mark.asyncio
+    async def test_hash_password_creates_different_hashes(
         self,
         password_hasher: PasswordHasher,
     ) -> None:
@@ -14,37 +19,63 @@ class TestBcryptPasswordHasher:
 
         test_password = "TestPassword123!"
 
-        hash1 = password_hasher.hash_password(test_password)
-        hash2 = password_hasher.hash_password(test_password)
+        hash1 = await password_hasher.hash_password(test_password)
+        hash2 = await password_hasher.hash_password(test_password)
 
         assert hash1 != hash2
         assert len(hash1) > 0
         assert len(hash2) > 0
 
-    def test_verify_password_success(self, password_hasher: PasswordHasher) -> None:
+    @pytest.mark.asyncio
+    async def test_verify_password_success(
+        self,
+        password_hasher: PasswordHasher,
+    ) -> None:
         """Тест: валидный пароль проверяется по хешу"""
 
         test_password = "TestPassword123!"
 
-        hashed_passowrd = password_hasher.hash_password(test_password)
+        hashed_passowrd = await password_hasher.hash_password(test_password)
 
         assert (
-            password_hasher.verify_password_by_hash(
+            await password_hasher.verify_password_by_hash(
                 test_password,
                 hashed_passowrd,
             )
             is True
         )
 
-    def test_verify_invalid_hash_format(self, password_hasher: PasswordHasher) -> None:
+    @pytest.mark.asyncio
+    async def test_verify_invalid_hash_format(
+        self,
+        password_hasher: PasswordHasher,
+    ) -> None:
         """Тест: неверный формат хэша"""
         test_password = "TestPassword123!"
         invalid_hash = "invalid_hash"
 
         assert (
-            password_hasher.verify_password_by_hash(
+            await password_hasher.verify_password_by_hash(
                 test_password,
                 invalid_hash,
             )
             is False
         )
+
+    @pytest.mark.asyncio
+    async def test_hashing_runs_in_pool(self) -> None:
+        """Тест: хеширование выполняется в пуле и учитывается в метриках"""
+
+        pool = PasswordHashingPool(max_workers=1)
+        password_hasher = BcryptPasswordHasherProvider(rounds=4, pool=pool)
+
+        hashed = await password_hasher.hash_password("TestPassword123!")
+        await password_hasher.verify_password_by_hash("TestPassword123!", hashed)
+
+        stats = pool.get_stats()
+        assert stats["completed"] == 2
+        assert stats["running"] == 0
+        assert stats["queued"] == 0
+        assert stats["max_workers"] == 1
+
+        pool.shutdown()
@@ -0,0 +1,78 @@
+from datetime import datetime
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+)
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from core.models import TokenType
+from core.providers import TokenRepositoryProvider
+from users.interactors import PurgeExpiredTokensInteractor
+
+
+@pytest.mark.unit
+class TestPurgeExpiredTokensInteractor:
+    """Unit тесты для PurgeExpiredTokensInteractor"""
+
+    @pytest.mark.asyncio
+    async def test_deletes_in_batches_until_short_batch(self) -> None:
+        """Тест: порции удаляются, пока последняя не окажется неполной"""
+
+        token_repo = AsyncMock()
+        token_repo.delete_expired_tokens_batch.side_effect = [100, 100, 40]
+        db_session = AsyncMock()
+
+        interactor = PurgeExpiredTokensInteractor(
+            token_repo=token_repo,
+            db_session=db_session,
+            batch_size=100,
+        )
+
+        assert await interactor() == 240
+        assert token_repo.delete_expired_tokens_batch.await_count == 3
+        assert db_session.commit.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_stops_when_time_budget_exhausted(self) -> None:
+        """Тест: очистка прекращается по истечении бюджета времени"""
+
+        token_repo = AsyncMock()
+        token_repo.delete_expired_tokens_batch.return_value = 100
+        db_session = AsyncMock()
+
+        interactor = PurgeExpiredTokensInteractor(
+            token_repo=token_repo,
+            db_session=db_session,
+            batch_size=100,
+            time_budget_seconds=0,
+        )
+
+        assert await interactor() == 0
+        token_repo.delete_expired_tokens_batch.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestTokenRepositoryCounts:
+    """Unit тесты для подсчета затронутых токенов в TokenRepositoryProvider"""
+
+    @pytest.mark.asyncio
+    async def test_counts_come_from_rowcount(self) -> None:
+        """Тест: массовые UPDATE/DELETE не возвращают строки, счет - rowcount"""
+
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(rowcount=7)
+        token_repo = TokenRepositoryProvider(session)
+
+        assert await token_repo.deactivate_user_tokens(uuid4(), TokenType.REFRESH) == 7
+        assert await token_repo.cleanup_expired_tokens() == 7
+        assert (
+            await token_repo.delete_expired_tokens_batch(100, datetime(2026, 10, 18))
+            == 7
+        )
+
+        for call in session.execute.await_args_list:
+            sql = str(call.args[0].compile(dialect=postgresql.dialect()))
+            assert "RETURNING" not in sql
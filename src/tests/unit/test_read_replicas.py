@@ -0,0 +1,125 @@
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import Response
+
+from core.dependencies.depends import (
+    LAST_WRITE_COOKIE,
+    LAST_WRITE_HEADER,
+    get_client_write_mark,
+    track_user_write,
+)
+from core.models.db_helper import Db_Helper
+from core.providers import ClientMarkReadYourWritesProvider
+
+
+@pytest.mark.unit
+class TestClientMarkReadYourWrites:
+    """Unit тесты для ClientMarkReadYourWritesProvider"""
+
+    def test_recent_writer_reads_primary(self) -> None:
+        """Тест: с меткой записи пользователь в пределах окна читает основную БД"""
+
+        tracker = ClientMarkReadYourWritesProvider(window_seconds=60)
+        user_uuid = uuid4()
+
+        assert tracker.wrote_recently(user_uuid, None) is False
+
+        mark = tracker.mark_write(user_uuid)
+
+        assert tracker.wrote_recently(user_uuid, mark) is True
+        assert tracker.wrote_recently(uuid4(), mark) is False
+
+    def test_window_expires(self) -> None:
+        """Тест: по истечении окна чтения снова идут в реплику"""
+
+        tracker = ClientMarkReadYourWritesProvider(window_seconds=5)
+        user_uuid = uuid4()
+
+        stale_mark = f"{user_uuid}:{time.time() - 60:.3f}"
+
+        assert tracker.wrote_recently(user_uuid, stale_mark) is False
+
+    def test_malformed_mark_ignored(self) -> None:
+        """Тест: испорченная метка не влияет на маршрутизацию"""
+
+        tracker = ClientMarkReadYourWritesProvider(window_seconds=60)
+        user_uuid = uuid4()
+
+        assert tracker.wrote_recently(user_uuid, "garbage") is False
+        assert tracker.wrote_recently(user_uuid, f"{user_uuid}:now") is False
+        assert tracker.wrote_recently(user_uuid, f"not-a-uuid:{time.time()}") is False
+
+    def test_write_sets_client_mark(self) -> None:
+        """Тест: запрос на изменение отдает метку в cookie и заголовке"""
+
+        user_uuid = uuid4()
+        response = Response()
+
+        track_user_write(SimpleNamespace(method="POST"), response, user_uuid)
+
+        mark = response.headers[LAST_WRITE_HEADER]
+        assert mark.startswith(f"{user_uuid}:")
+        assert f"{LAST_WRITE_COOKIE}={mark}" in response.headers["set-cookie"]
+
+    def test_safe_request_sets_no_mark(self) -> None:
+        """Тест: чтение не выдает метку записи"""
+
+        response = Response()
+
+        track_user_write(SimpleNamespace(method="GET"), response, uuid4())
+
+        assert LAST_WRITE_HEADER not in response.headers
+        assert "set-cookie" not in response.headers
+
+    def test_mark_from_header_or_cookie(self) -> None:
+        """Тест: метка читается из заголовка, а без него - из cookie"""
+
+        from_header = SimpleNamespace(
+            headers={LAST_WRITE_HEADER: "header-mark"},
+            cookies={LAST_WRITE_COOKIE: "cookie-mark"},
+        )
+        from_cookie = SimpleNamespace(
+            headers={},
+            cookies={LAST_WRITE_COOKIE: "cookie-mark"},
+        )
+
+        assert get_client_write_mark(from_header) == "header-mark"
+        assert get_client_write_mark(from_cookie) == "cookie-mark"
+
+
+@pytest.mark.unit
+class TestDbHelperReplicas:
+    """Unit тесты для маршрутизации чтений по репликам"""
+
+    URL = "postgresql+asyncpg://u:p@localhost:5432/db"
+
+    def test_without_replicas_reads_primary(self) -> None:
+        """Тест: без реплик чтения идут в основную БД"""
+
+        helper = Db_Helper(url=self.URL)
+
+        assert helper.has_replicas is False
+        assert helper.get_read_session_factory() is helper.session_factory
+
+    def test_replicas_round_robin(self) -> None:
+        """Тест: чтения распределяются по репликам по кругу"""
+
+        helper = Db_Helper(
+            url=self.URL,
+            replica_urls=[
+                "postgresql+asyncpg://u:p@replica1:5432/db",
+                "postgresql+asyncpg://u:p@replica2:5432/db",
+            ],
+        )
+
+        factories = [helper.get_read_session_factory() for _ in range(4)]
+
+        assert helper.has_replicas is True
+        assert helper.session_factory not in factories
+        assert factories[0] is factories[2]
+        assert factories[1] is factories[3]
+        assert factories[0] is not factories[1]
+        assert len(helper.get_pool_stats()["replicas"]) == 2
@@ -0,0 +1,135 @@
+from datetime import (
+    datetime,
+    timedelta,
+)
+from types import SimpleNamespace
+from typing import (
+    Any,
+    Optional,
+)
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+)
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from core.providers import TokenRepositoryProvider
+from users.models import RoleEnum
+
+
+def make_session(row: Optional[Any]) -> AsyncMock:
+    """Сессия, которая вернет row (или ни одной строки) на запрос ротации"""
+    result = MagicMock()
+    result.one_or_none.return_value = row
+    session = AsyncMock()
+    session.execute.return_value = result
+    return session
+
+
+def compile_rotation(session: AsyncMock) -> str:
+    """SQL запроса ротации с подставленными значениями"""
+    stmt = session.execute.await_args.args[0]
+    return str(
+        stmt.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+@pytest.mark.unit
+class TestRotateRefreshTokenByHash:
+    """Unit тесты для TokenRepositoryProvider.rotate_refresh_token_by_hash"""
+
+    NEW_EXPIRES_AT = datetime(2026, 11, 18, 12, 0)
+
+    @pytest.mark.asyncio
+    async def test_valid_token_rotated_in_one_statement(self) -> None:
+        """Тест: действующий токен заменяется одним запросом с двумя CTE"""
+
+        row = SimpleNamespace(
+            user_uuid=uuid4(),
+            role=RoleEnum.MANAGER,
+            team_uuid=uuid4(),
+        )
+        session = make_session(row)
+
+        owner = await TokenRepositoryProvider(session).rotate_refresh_token_by_hash(
+            old_token_hash="old-hash",
+            new_token_hash="new-hash",
+            new_expires_at=self.NEW_EXPIRES_AT,
+        )
+
+        assert owner == {
+            "user_uuid": row.user_uuid,
+            "role": RoleEnum.MANAGER,
+            "team_uuid": row.team_uuid,
+        }
+        session.execute.assert_awaited_once()
+
+        sql = compile_rotation(session)
+        assert "WITH rotated AS" in sql
+        assert "UPDATE usertokens SET is_active=false" in sql
+        assert "inserted AS" in sql
+        assert "INSERT INTO usertokens" in sql
+        assert "'new-hash'" in sql
+        assert "'2026-11-18 12:00:00'" in sql
+
+    @pytest.mark.asyncio
+    async def test_reused_token_not_rotated(self) -> None:
+        """Тест: уже деактивированный (повторно предъявленный) токен отклоняется"""
+
+        session = make_session(None)
+
+        owner = await TokenRepositoryProvider(session).rotate_refresh_token_by_hash(
+            old_token_hash="reused-hash",
+            new_token_hash="new-hash",
+            new_expires_at=self.NEW_EXPIRES_AT,
+        )
+
+        assert owner is None
+        sql = compile_rotation(session)
+        assert "usertokens.token_hash = 'reused-hash'" in sql
+        assert "usertokens.is_active = true" in sql
+
+    @pytest.mark.asyncio
+    async def test_expired_token_not_rotated(self) -> None:
+        """Тест: истекший токен отклоняется условием на expires_at"""
+
+        session = make_session(None)
+        before = datetime.now()
+
+        owner = await TokenRepositoryProvider(session).rotate_refresh_token_by_hash(
+            old_token_hash="expired-hash",
+            new_token_hash="new-hash",
+            new_expires_at=self.NEW_EXPIRES_AT,
+        )
+
+        assert owner is None
+        sql = compile_rotation(session)
+        assert "usertokens.expires_at > '" in sql
+
+        # Граница - момент вызова, а не время жизни нового токена
+        bound = sql.split("usertokens.expires_at > '", 1)[1].split("'", 1)[0]
+        moment = datetime.fromisoformat(bound)
+        assert before <= moment <= datetime.now() + timedelta(seconds=1)
+
+    @pytest.mark.asyncio
+    async def test_inactive_user_token_not_rotated(self) -> None:
+        """Тест: токен заблокированного пользователя не ротируется"""
+
+        session = make_session(None)
+
+        owner = await TokenRepositoryProvider(session).rotate_refresh_token_by_hash(
+            old_token_hash="blocked-user-hash",
+            new_token_hash="new-hash",
+            new_expires_at=self.NEW_EXPIRES_AT,
+        )
+
+        assert owner is None
+        sql = compile_rotation(session)
+        assert "users.uuid = usertokens.user_uuid" in sql
+        assert "users.is_active = true" in sql
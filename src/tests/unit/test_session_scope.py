@@ -0,0 +1,76 @@
+from typing import (
+    AsyncGenerator,
+    List,
+)
+
+import pytest
+from fastapi import (
+    APIRouter,
+    Depends,
+    FastAPI,
+)
+from httpx import (
+    ASGITransport,
+    AsyncClient,
+)
+
+from core.dependencies import SessionReleasingRoute
+from core.dependencies.session_scope import track_request_session
+
+
+class FakeSession:
+    """Сессия-заглушка: фиксирует момент закрытия"""
+
+    def __init__(self, events: List[str]) -> None:
+        self._events = events
+
+    async def close(self) -> None:
+        self._events.append("close")
+
+
+@pytest.mark.unit
+class TestSessionReleasingRoute:
+    """Unit тесты для раннего освобождения сессий запроса"""
+
+    @pytest.mark.asyncio
+    async def test_session_closed_before_dependency_teardown(self) -> None:
+        """Тест: сессия закрывается сразу после эндпоинта, до завершения запроса"""
+
+        events: List[str] = []
+
+        async def get_fake_session() -> AsyncGenerator[FakeSession, None]:
+            session = FakeSession(events)
+            track_request_session(session)
+            yield session
+            events.append("teardown")
+
+        router = APIRouter(route_class=SessionReleasingRoute)
+
+        @router.get("/items")
+        async def list_items(
+            session: FakeSession = Depends(get_fake_session),
+        ) -> dict:
+            events.append("endpoint")
+            return {"ok": True}
+
+        app = FastAPI()
+        app.include_router(router)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+        ) as client:
+            response = await client.get("/items")
+
+        assert response.status_code == 200
+        assert events == ["endpoint", "close", "teardown"]
+
+    @pytest.mark.asyncio
+    async def test_track_outside_request_is_noop(self) -> None:
+        """Тест: вне маршрута сессия не регистрируется"""
+
+        events: List[str] = []
+
+        track_request_session(FakeSession(events))
+
+        assert events == []
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.providers import StageTimingsProvider
+from users.interactors import AuthenticateUserInteractor
+
+
+@pytest.mark.unit
+class TestStageTimings:
+    """Unit тесты для StageTimingsProvider"""
+
+    def test_observe_places_values_into_buckets(self) -> None:
+        """Тест: наблюдения раскладываются по корзинам"""
+
+        timings = StageTimingsProvider(buckets_ms=(10, 100))
+
+        timings.observe("verify_password", 0.005)
+        timings.observe("verify_password", 0.050)
+        timings.observe("verify_password", 0.500)
+
+        stats = timings.get_stats()["verify_password"]
+
+        assert stats["count"] == 3
+        assert stats["buckets"] == {"<=10ms": 1, "<=100ms": 1, ">100ms": 1}
+        assert stats["sum_ms"] == pytest.approx(555.0)
+
+    def test_measure_records_block(self) -> None:
+        """Тест: measure учитывает блок кода даже при исключении"""
+
+        timings = StageTimingsProvider()
+
+        with pytest.raises(RuntimeError):
+            with timings.measure("total"):
+                raise RuntimeError
+
+        assert timings.get_stats()["total"]["count"] == 1
+
+
+@pytest.mark.unit
+class TestAuthenticateUserInteractor:
+    """Unit тесты для AuthenticateUserInteractor"""
+
+    @pytest.mark.asyncio
+    async def test_records_lookup_and_verify_stages(self) -> None:
+        """Тест: вход замеряет поиск пользователя и проверку пароля"""
+
+        user = SimpleNamespace(is_active=True, password="hash")
+        user_repo = AsyncMock()
+        user_repo.get_for_login.return_value = user
+        password_hasher = AsyncMock()
+        password_hasher.verify_password_by_hash.return_value = True
+        timings = StageTimingsProvider()
+
+        interactor = AuthenticateUserInteractor(
+            user_repo=user_repo,
+            password_hasher=password_hasher,
+            stage_timings=timings,
+        )
+
+        assert await interactor("user@example.com", "secret") is user
+        assert set(timings.get_stats()) == {"lookup", "verify_password"}
@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+)
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from tasks.crud import TaskCRUD
+from tasks.interactors import GetTaskStatsInteractor
+from tasks.models import StatusEnum
+from users.models import RoleEnum
+
+
+@pytest.mark.unit
+class TestTaskStats:
+    """Unit тесты для статистики задач"""
+
+    @pytest.mark.asyncio
+    async def test_crud_counts_everything_in_one_query(self) -> None:
+        """Тест: статусы и просроченные считаются одним запросом с FILTER"""
+
+        row = SimpleNamespace(
+            total=250,
+            overdue=180,
+            OPENED=100,
+            IN_PROGRESS=50,
+            DONE=100,
+        )
+        result = MagicMock()
+        result.one.return_value = row
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        stats = await TaskCRUD(session).get_task_stats(team_uuid=uuid4())
+
+        session.execute.assert_awaited_once()
+        sql = str(
+            session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "FILTER (WHERE" in sql
+        assert "GROUP BY" not in sql
+
+        assert stats == {
+            "status_counts": {
+                StatusEnum.OPENED: 100,
+                StatusEnum.IN_PROGRESS: 50,
+                StatusEnum.DONE: 100,
+            },
+            "total": 250,
+            "overdue": 180,
+            "completion_rate": 40.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_interactor_uses_exact_overdue_count(self) -> None:
+        """Тест: число просроченных не ограничено лимитом выборки"""
+
+        actor = SimpleNamespace(uuid=uuid4(), role=RoleEnum.EMPLOYEE, team_uuid=uuid4())
+        assignee_uuid = uuid4()
+
+        user_repo = AsyncMock()
+        user_repo.get_by_uuid.return_value = actor
+        task_repo = AsyncMock()
+        task_repo.get_task_stats.return_value = {
+            "status_counts": {
+                StatusEnum.OPENED: 300,
+                StatusEnum.IN_PROGRESS: 0,
+                StatusEnum.DONE: 0,
+            },
+            "total": 300,
+            "overdue": 300,
+            "completion_rate": 0,
+        }
+
+        interactor = GetTaskStatsInteractor(
+            task_repo=task_repo,
+            user_repo=user_repo,
+            permission_validator=None,
+        )
+
+        stats = await interactor(actor_uuid=actor.uuid, assignee_uuid=assignee_uuid)
+
+        task_repo.get_task_stats.assert_awaited_once_with(
+            team_uuid=actor.team_uuid,
+            assignee_uuid=assignee_uuid,
+        )
+        task_repo.get_overdue_tasks.assert_not_awaited()
+        assert stats["overdue_count"] == 300
+        assert stats["total_tasks"] == 300
+        assert stats["status_counts"][StatusEnum.OPENED.value] == 300
@@ -0,0 +1,196 @@
+from contextlib import asynccontextmanager
+from datetime import (
+    date,
+    datetime,
+)
+from typing import (
+    AsyncIterator,
+    List,
+)
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+)
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+
+from core.config import (
+    Auth,
+    Config,
+    TokenCleanupSettings,
+    required_partition_months,
+)
+from core.providers import TokenPartitionManagerProvider
+from users.providers import TokenJanitorProvider
+from users.providers.token_janitor_provider import JANITOR_LOCK_KEY
+
+
+@pytest.mark.unit
+class TestTokenPartitionManager:
+    """Unit тесты для TokenPartitionManagerProvider"""
+
+    def test_partition_name_and_month_math(self) -> None:
+        """Тест: имя партиции и переход через год"""
+
+        assert (
+            TokenPartitionManagerProvider.partition_name(date(2026, 3, 1))
+            == "usertokens_p202603"
+        )
+        assert TokenPartitionManagerProvider.add_month(date(2026, 12, 1)) == date(
+            2027, 1, 1
+        )
+        assert TokenPartitionManagerProvider.month_start(
+            datetime(2026, 10, 18, 12, 30)
+        ) == date(2026, 10, 1)
+
+    @pytest.mark.asyncio
+    async def test_drop_only_fully_expired_partitions(self) -> None:
+        """Тест: истекшие партиции отсоединяются CONCURRENTLY и удаляются"""
+
+        listing = MagicMock()
+        listing.all.return_value = [
+            ("usertokens_p202608", True),
+            ("usertokens_p202609", False),
+            ("usertokens_p202610", False),
+            ("usertokens_legacy", False),
+        ]
+        connection = AsyncMock()
+        connection.execution_options.return_value = connection
+        connection.execute.side_effect = [listing, None, None, None, None]
+
+        @asynccontextmanager
+        async def connect() -> AsyncIterator[AsyncMock]:
+            yield connection
+
+        session = MagicMock()
+        session.bind.connect = connect
+
+        manager = TokenPartitionManagerProvider(session)
+
+        dropped = await manager.drop_expired_partitions(datetime(2026, 10, 18))
+
+        assert dropped == ["usertokens_p202608", "usertokens_p202609"]
+        connection.execution_options.assert_awaited_once_with(
+            isolation_level="AUTOCOMMIT"
+        )
+        statements = [
+            str(call.args[0]) for call in connection.execute.await_args_list[1:]
+        ]
+        assert statements == [
+            "ALTER TABLE usertokens DETACH PARTITION usertokens_p202608 FINALIZE",
+            "DROP TABLE usertokens_p202608",
+            "ALTER TABLE usertokens DETACH PARTITION usertokens_p202609 CONCURRENTLY",
+            "DROP TABLE usertokens_p202609",
+        ]
+
+
+@pytest.mark.unit
+class TestTokenJanitor:
+    """Unit тесты для TokenJanitorProvider"""
+
+    @pytest.mark.asyncio
+    async def test_run_skipped_without_advisory_lock(self) -> None:
+        """Тест: без advisory lock проход пропускается, очистка не запускается"""
+
+        lock_session = AsyncMock()
+        lock_session.scalar.return_value = False
+        opened: List[AsyncMock] = []
+
+        @asynccontextmanager
+        async def session_factory() -> AsyncIterator[AsyncMock]:
+            opened.append(lock_session)
+            yield lock_session
+
+        janitor = TokenJanitorProvider(session_factory=session_factory)
+
+        assert await janitor.run_once() == {"skipped": True}
+        assert len(opened) == 1
+        lock_sql = str(
+            lock_session.scalar.await_args.args[0].compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        assert f"pg_try_advisory_xact_lock({JANITOR_LOCK_KEY})" in lock_sql
+
+    @pytest.mark.asyncio
+    async def test_ensure_partitions_under_advisory_lock(self) -> None:
+        """Тест: партиции при старте создаются под блокировкой очистки"""
+
+        result = MagicMock()
+        # Таблица секционирована, ни одной партиции еще нет
+        result.scalar.return_value = True
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        @asynccontextmanager
+        async def session_factory() -> AsyncIterator[AsyncMock]:
+            yield session
+
+        janitor = TokenJanitorProvider(
+            session_factory=session_factory,
+            partition_months_ahead=1,
+        )
+
+        assert await janitor.ensure_partitions() == 2
+
+        lock_sql = str(
+            session.execute.await_args_list[0]
+            .args[0]
+            .compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        assert f"pg_advisory_xact_lock({JANITOR_LOCK_KEY})" in lock_sql
+        created = [
+            str(call.args[0])
+            for call in session.execute.await_args_list
+            if str(call.args[0]).startswith("CREATE TABLE")
+        ]
+        assert len(created) == 2
+        session.commit.assert_awaited_once()
+
+
+@pytest.mark.unit
+class TestPartitionMonthsAhead:
+    """Unit тесты для вывода token_cleanup.partition_months_ahead"""
+
+    @staticmethod
+    def make_config(refresh_days: int, months_ahead=None) -> Config:
+        return Config(
+            auth=Auth(
+                secret_key="secret",
+                algorithm="HS256",
+                access_token_expire_minutes=30,
+                refresh_token_expire_days=refresh_days,
+            ),
+            token_cleanup=TokenCleanupSettings(
+                partition_months_ahead=months_ahead,
+            ),
+        )
+
+    def test_required_months(self) -> None:
+        """Тест: партиции покрывают срок жизни refresh токена плюс месяц"""
+
+        assert required_partition_months(7) == 2
+        assert required_partition_months(28) == 2
+        assert required_partition_months(30) == 3
+        assert required_partition_months(90) == 5
+
+    def test_derived_from_refresh_lifetime(self) -> None:
+        """Тест: без явного значения число месяцев выводится из срока токена"""
+
+        config = self.make_config(refresh_days=60)
+
+        assert config.token_cleanup.partition_months_ahead == 4
+
+    def test_too_few_months_rejected(self) -> None:
+        """Тест: партиций меньше срока жизни токена - ошибка конфигурации"""
+
+        with pytest.raises(ValidationError, match="partition_months_ahead"):
+            self.make_config(refresh_days=60, months_ahead=2)
+
+        assert self.make_config(60, 6).token_cleanup.partition_months_ahead == 6
@@ -0,0 +1,101 @@
+import time
+from uuid import (
+    UUID,
+    uuid4,
+)
+
+import pytest
+
+from core.dependencies.depends import get_user_from_claims
+from core.providers import (
+    InMemoryTokenRevocationProvider,
+    token_revocation_registry,
+)
+from users.models import RoleEnum
+
+
+@pytest.mark.unit
+class TestInMemoryTokenRevocation:
+    """Unit тесты для InMemoryTokenRevocationProvider"""
+
+    @pytest.fixture
+    def registry(self) -> InMemoryTokenRevocationProvider:
+        return InMemoryTokenRevocationProvider(retention_seconds=60)
+
+    def test_token_issued_before_revoke_is_revoked(
+        self,
+        registry: InMemoryTokenRevocationProvider,
+    ) -> None:
+        """Тест: токен, выданный до изменения прав, устаревает"""
+
+        user_uuid = uuid4()
+        issued_at = int(time.time()) - 10
+
+        assert registry.is_revoked(user_uuid, None, issued_at) is False
+
+        registry.revoke_user(user_uuid)
+
+        assert registry.is_revoked(user_uuid, None, issued_at) is True
+        assert registry.is_revoked(user_uuid, None, int(time.time()) + 1) is False
+
+    def test_team_revoke_affects_members(
+        self,
+        registry: InMemoryTokenRevocationProvider,
+    ) -> None:
+        """Тест: удаление команды делает claims ее участников устаревшими"""
+
+        team_uuid = uuid4()
+        issued_at = int(time.time()) - 10
+
+        registry.revoke_team(team_uuid)
+
+        assert registry.is_revoked(uuid4(), team_uuid, issued_at) is True
+        assert registry.is_revoked(uuid4(), uuid4(), issued_at) is False
+
+
+@pytest.mark.unit
+class TestGetUserFromClaims:
+    """Unit тесты для построения пользователя из claims токена"""
+
+    def make_payload(self, **overrides) -> dict:
+        payload = {
+            "sub": str(uuid4()),
+            "role": RoleEnum.MANAGER.value,
+            "team": str(uuid4()),
+            "active": True,
+            "iat": int(time.time()) + 1,
+        }
+        payload.update(overrides)
+        return payload
+
+    def test_builds_user_from_claims(self) -> None:
+        """Тест: пользователь строится из claims без БД"""
+
+        payload = self.make_payload()
+
+        user = get_user_from_claims(payload)
+
+        assert user is not None
+        assert str(user.uuid) == payload["sub"]
+        assert user.role == RoleEnum.MANAGER
+        assert str(user.team_uuid) == payload["team"]
+        assert user.is_active is True
+
+    def test_legacy_token_without_claims_falls_back(self) -> None:
+        """Тест: токен без claims команды и активности требует БД"""
+
+        payload = self.make_payload()
+        del payload["team"]
+
+        assert get_user_from_claims(payload) is None
+
+    def test_revoked_user_falls_back(self) -> None:
+        """Тест: после изменения прав claims не используются"""
+
+        payload = self.make_payload(iat=int(time.time()) - 10)
+
+        token_revocation_registry.revoke_user(uuid4())
+        assert get_user_from_claims(payload) is not None
+
+        token_revocation_registry.revoke_user(UUID(payload["sub"]))
+        assert get_user_from_claims(payload) is None
@@ -0,0 +1,224 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from typing import (
+    Any,
+    AsyncIterator,
+    List,
+)
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from tasks.interactors import ChangeTaskStatusInteractor
+from tasks.models import StatusEnum
+from users.interactors import GetUserStatsInteractor
+from users.models import RoleEnum
+from users.providers import InMemoryUserStatsCacheProvider
+
+
+class FakeRepositoryFactory:
+    """Фабрика репозиториев, считающая одновременно открытые сессии"""
+
+    def __init__(self, started: List[str]) -> None:
+        self.started = started
+        self.opened = 0
+        self.active = 0
+        self.max_active = 0
+
+    @asynccontextmanager
+    async def open(self) -> AsyncIterator[SimpleNamespace]:
+        self.opened += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            yield SimpleNamespace(
+                task_repo=fake_repo(
+                    "get_task_stats",
+                    {
+                        "status_counts": {
+                            StatusEnum.OPENED: 2,
+                            StatusEnum.IN_PROGRESS: 1,
+                            StatusEnum.DONE: 7,
+                        },
+                        "total": 10,
+                        "overdue": 1,
+                        "completion_rate": 70.0,
+                    },
+                    self.started,
+                ),
+                evaluation_rollup_repo=fake_repo(
+                    "get_user_stats",
+                    {
+                        "average_score": 4.0,
+                        "total": 7,
+                        "score_distribution": {},
+                        "last_evaluated_at": datetime(2026, 10, 1),
+                    },
+                    self.started,
+                ),
+                meeting_repo=fake_repo(
+                    "get_meeting_stats",
+                    {"total_last_days": 5, "upcoming": 3, "by_week": {}},
+                    self.started,
+                ),
+            )
+        finally:
+            self.active -= 1
+
+
+def fake_repo(method: str, result: Any, started: List[str]) -> Any:
+    """Репозиторий-заглушка с одним агрегирующим методом"""
+
+    async def aggregate(*args: Any, **kwargs: Any) -> Any:
+        started.append(method)
+        # Уступаем цикл событий, чтобы успели стартовать остальные агрегаты
+        for _ in range(10):
+            await asyncio.sleep(0)
+        return result
+
+    return SimpleNamespace(**{method: aggregate})
+
+
+@pytest.mark.unit
+class TestGetUserStatsInteractor:
+    """Unit тесты для GetUserStatsInteractor"""
+
+    @pytest.fixture
+    def target(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            uuid=uuid4(),
+            email="user@example.com",
+            name="Ivan",
+            surname="Ivanov",
+            role=RoleEnum.EMPLOYEE,
+            is_active=True,
+            is_verified=True,
+            team_uuid=None,
+            created_at=datetime(2026, 1, 1),
+        )
+
+    @pytest.fixture
+    def repository_factory(self) -> FakeRepositoryFactory:
+        return FakeRepositoryFactory(started=[])
+
+    def make_interactor(
+        self,
+        target: SimpleNamespace,
+        repository_factory: FakeRepositoryFactory,
+        stats_cache: InMemoryUserStatsCacheProvider,
+    ) -> GetUserStatsInteractor:
+        user_repo = AsyncMock()
+        user_repo.get_by_uuid.return_value = target
+        permission_validator = AsyncMock()
+        permission_validator.can_view_user.return_value = True
+
+        return GetUserStatsInteractor(
+            user_repo=user_repo,
+            permission_validator=permission_validator,
+            repository_factory=repository_factory,
+            stats_cache=stats_cache,
+        )
+
+    @pytest.mark.asyncio
+    async def test_aggregates_run_concurrently_in_separate_sessions(
+        self,
+        target: SimpleNamespace,
+        repository_factory: FakeRepositoryFactory,
+    ) -> None:
+        """Тест: три агрегата выполняются одновременно, каждый в своей сессии"""
+
+        interactor = self.make_interactor(
+            target,
+            repository_factory,
+            InMemoryUserStatsCacheProvider(),
+        )
+
+        stats = await interactor(actor_uuid=target.uuid, target_uuid=target.uuid)
+
+        assert repository_factory.opened == 3
+        assert repository_factory.max_active == 3
+        assert sorted(repository_factory.started) == [
+            "get_meeting_stats",
+            "get_task_stats",
+            "get_user_stats",
+        ]
+        assert stats["tasks_stats"] == {
+            "total_assigned": 10,
+            "completed": 7,
+            "in_progress": 1,
+            "overdue": 1,
+        }
+        assert stats["evaluation_stats"] == {
+            "average_score": 4.0,
+            "total_evaluations": 7,
+            "last_evaluation": "2026-10-01T00:00:00",
+        }
+        assert stats["meetings_stats"] == {
+            "upcoming": 3,
+            # 5 встреч с начала периода, из них 3 еще впереди
+            "total_participated": 2,
+        }
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_served_from_cache(
+        self,
+        target: SimpleNamespace,
+        repository_factory: FakeRepositoryFactory,
+    ) -> None:
+        """Тест: повторный запрос в пределах TTL не обращается к БД"""
+
+        stats_cache = InMemoryUserStatsCacheProvider(ttl_seconds=30)
+        interactor = self.make_interactor(target, repository_factory, stats_cache)
+
+        first = await interactor(actor_uuid=target.uuid, target_uuid=target.uuid)
+        second = await interactor(actor_uuid=target.uuid, target_uuid=target.uuid)
+
+        assert first == second
+        assert repository_factory.opened == 3
+        assert stats_cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cached_stats(
+        self,
+        target: SimpleNamespace,
+        repository_factory: FakeRepositoryFactory,
+    ) -> None:
+        """Тест: смена статуса задачи сбрасывает статистику исполнителя"""
+
+        stats_cache = InMemoryUserStatsCacheProvider(ttl_seconds=30)
+        interactor = self.make_interactor(target, repository_factory, stats_cache)
+        await interactor(actor_uuid=target.uuid, target_uuid=target.uuid)
+
+        task = SimpleNamespace(
+            uuid=uuid4(),
+            status=StatusEnum.OPENED,
+            assignee_uuid=target.uuid,
+            creator_uuid=target.uuid,
+            team_uuid=None,
+        )
+        task_repo = AsyncMock()
+        task_repo.get_by_uuid.return_value = task
+        task_repo.update_task.return_value = task
+        user_repo = AsyncMock()
+        user_repo.get_by_uuid.return_value = target
+
+        await ChangeTaskStatusInteractor(
+            task_repo=task_repo,
+            user_repo=user_repo,
+            permission_validator=None,
+            db_session=AsyncMock(),
+            stats_cache=stats_cache,
+        )(
+            actor_uuid=target.uuid,
+            task_uuid=task.uuid,
+            new_status=StatusEnum.IN_PROGRESS,
+        )
+
+        assert stats_cache.get(target.uuid) is None
+
+        await interactor(actor_uuid=target.uuid, target_uuid=target.uuid)
+
+        assert repository_factory.opened == 6
@@ -10,7 +10,12 @@ from sqlalchemy import (
     select,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import (
+    load_only,
+    raiseload,
+)
 
+from core.interfaces.auth import AccessTokenRevocationRegistry
 from users.interfaces import UserRepository
 from users.models import (
     RoleEnum,
@@ -21,8 +26,19 @@ from users.models import (
 class UserCRUD(UserRepository):
     """Имплементация UserRepository"""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        token_revocation: Optional[AccessTokenRevocationRegistry] = None,
+    ) -> None:
+        """
+        Args:
+            session: Сессия БД
+            token_revocation: Реестр отзыва claims access токенов
+                (изменение пользователя делает claims его токенов устаревшими)
+        """
         self._session = session
+        self._token_revocation = token_revocation
 
     async def create_user(self, user: User) -> User:
         """Создание нового пользователя"""
@@ -33,9 +49,9 @@ class UserCRUD(UserRepository):
 
     async def get_by_uuid(self, user_uuid: UUID) -> Optional[User]:
         """Получение пользователя по UUID"""
-        stmt = select(User).where(User.uuid == user_uuid)
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        # session.get сначала смотрит в identity map сессии: сессия общая
+        # на запрос, поэтому повторные загрузки не ходят в БД
+        return await self._session.get(User, user_uuid)
 
     async def get_by_email(self, user_email: str) -> Optional[User]:
         """Получение пользователя по Email"""
@@ -43,6 +59,36 @@ class UserCRUD(UserRepository):
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_for_login(self, user_email: str) -> Optional[User]:
+        """
+        Получение пользователя по Email для входа в систему.
+
+        Загружаются только колонки для проверки пароля и ответа входа,
+        связи запрещены к ленивой загрузке (raiseload).
+        """
+        stmt = (
+            select(User)
+            .where(User.email == user_email)
+            .options(
+                load_only(
+                    User.uuid,
+                    User.email,
+                    User.password,
+                    User.is_active,
+                    User.is_verified,
+                    User.name,
+                    User.surname,
+                    User.gender,
+                    User.birth_date,
+                    User.role,
+                    User.team_uuid,
+                ),
+                raiseload("*"),
+            )
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_by_role(
         self,
         role: RoleEnum,
@@ -64,6 +110,10 @@ class UserCRUD(UserRepository):
         """Обновление пользователя"""
         await self._session.flush()
         await self._session.refresh(user)
+
+        if self._token_revocation:
+            self._token_revocation.revoke_user(user.uuid)
+
         return user
 
     async def delete_user(self, user_uuid: UUID) -> bool:
@@ -75,6 +125,10 @@ class UserCRUD(UserRepository):
 
         await self._session.delete(user)
         await self._session.flush()
+
+        if self._token_revocation:
+            self._token_revocation.revoke_user(user_uuid)
+
         return True
 
     async def list_users(
@@ -16,6 +16,7 @@ __all__ = (
     "ConfirmPasswordResetInteractor",
     "VerifyEmailInteractor",
     "AdminActivateUserInteractor",
+    "PurgeExpiredTokensInteractor",
 )
 
 from .user_interactos import (
@@ -37,6 +38,7 @@ from .auth_interactors import (
     AuthenticateUserInteractor,
     ChangePasswordInteractor,
     ConfirmPasswordResetInteractor,
+    PurgeExpiredTokensInteractor,
     RequestPasswordResetInteractor,
     VerifyEmailInteractor,
 )
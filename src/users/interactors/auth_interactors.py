@@ -1,9 +1,13 @@
+import time
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 from core.interfaces import (
     DBSession,
     PermissionValidator,
+    StageTimings,
+    TokenRepository,
 )
 from users.interfaces import (
     PasswordHasher,
@@ -57,7 +61,7 @@ class ChangePasswordInteractor:
 
             # 3. Проверить текущий пароль (если пользователь меняем сам)
             if actor.uuid == target.uuid:
-                if not self._password_hasher.verify_password_by_hash(
+                if not await self._password_hasher.verify_password_by_hash(
                     current_password,
                     target.password,
                 ):
@@ -70,7 +74,7 @@ class ChangePasswordInteractor:
                 )
 
             # 5. Обновить пароль
-            target.password = self._password_hasher.hash_password(new_password)
+            target.password = await self._password_hasher.hash_password(new_password)
 
             await self._user_repo.update_user(target)
             await self._db_session.commit()
@@ -89,9 +93,11 @@ class AuthenticateUserInteractor:
         self,
         user_repo: UserRepository,
         password_hasher: PasswordHasher,
+        stage_timings: Optional[StageTimings] = None,
     ) -> None:
         self._user_repo = user_repo
         self._password_hasher = password_hasher
+        self._stage_timings = stage_timings
 
     async def __call__(self, email: str, password: str) -> Optional[User]:
         """
@@ -101,8 +107,11 @@ class AuthenticateUserInteractor:
             User -- если аутентификация успешна, None -- если данные неверны
         """
 
-        # 1. Найти пользователя
-        user = await self._user_repo.get_by_email(email)
+        # 1. Найти пользователя (только колонки, нужные для входа)
+        started_at = time.perf_counter()
+        user = await self._user_repo.get_for_login(email)
+        self._observe("lookup", started_at)
+
         if not user:
             return None
 
@@ -110,12 +119,23 @@ class AuthenticateUserInteractor:
         if not user.is_active:
             raise ValueError("Аккаунт деактивирован")
 
-        # 3. Проверить пароль
-        if not self._password_hasher.verify_password_by_hash(password, user.password):
+        # 3. Проверить пароль (bcrypt выполняется вне цикла событий)
+        started_at = time.perf_counter()
+        is_valid = await self._password_hasher.verify_password_by_hash(
+            password,
+            user.password,
+        )
+        self._observe("verify_password", started_at)
+
+        if not is_valid:
             return None
 
         return user
 
+    def _observe(self, stage: str, started_at: float) -> None:
+        if self._stage_timings:
+            self._stage_timings.observe(stage, time.perf_counter() - started_at)
+
 
 class RequestPasswordResetInteractor:
     """Запрос на сброс пароля (забыл пароль)"""
@@ -274,3 +294,51 @@ class AdminActivateUserInteractor:
         except Exception:
             await self._db_session.rollback()
             raise
+
+
+class PurgeExpiredTokensInteractor:
+    """
+    Интерактор для пакетной очистки просроченных токенов.
+
+    Удаляет токены порциями по batch_size, фиксируя каждую порцию отдельной
+    транзакцией: блокировки держатся недолго, а память не зависит от
+    размера таблицы. Работа ограничена time_budget_seconds, остаток
+    удаляется при следующем запуске.
+    """
+
+    def __init__(
+        self,
+        token_repo: TokenRepository,
+        db_session: DBSession,
+        batch_size: int = 5000,
+        time_budget_seconds: float = 10.0,
+    ) -> None:
+        self._token_repo = token_repo
+        self._db_session = db_session
+        self._batch_size = batch_size
+        self._time_budget = time_budget_seconds
+
+    async def __call__(self) -> int:
+        """Удалить просроченные токены, вернуть количество удаленных"""
+
+        deadline = time.monotonic() + self._time_budget
+        expired_before = datetime.now()
+        total = 0
+
+        try:
+            while time.monotonic() < deadline:
+                deleted = await self._token_repo.delete_expired_tokens_batch(
+                    batch_size=self._batch_size,
+                    expired_before=expired_before,
+                )
+                await self._db_session.commit()
+
+                total += deleted
+                if deleted < self._batch_size:
+                    break
+
+            return total
+
+        except Exception:
+            await self._db_session.rollback()
+            raise
@@ -1,7 +1,13 @@
+import asyncio
 from datetime import date
 from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
     List,
     Optional,
+    TypeVar,
 )
 from uuid import UUID
 
@@ -10,6 +16,7 @@ from core.interfaces import (
     PermissionValidator,
     UUIDGenerator,
 )
+from tasks.models import StatusEnum
 from teams.interfaces import TeamRepository
 from teams.interfaces import (
     TeamMembershipManager,
@@ -18,6 +25,9 @@ from users.interfaces import (
     PasswordHasher,
     UserActivationManager,
     UserRepository,
+    UserStatsCache,
+    UserStatsRepositories,
+    UserStatsRepositoryFactory,
     UserValidator,
 )
 from users.models import (
@@ -29,6 +39,8 @@ from users.schemas import (
     UserUpdate,
 )
 
+T = TypeVar("T")
+
 
 class CreateUserDTO:
     """DTO для создания пользователя (внутренний доменный объект)"""
@@ -124,7 +136,7 @@ class CreateUserInteractor:
 
             # 3. Создание доменной сущности
             user_uuid = self._uuid_generator()
-            hashed_passowrd = self._password_hasher.hash_password(dto.password)
+            hashed_passowrd = await self._password_hasher.hash_password(dto.password)
 
             user = User(
                 uuid=user_uuid,
@@ -741,9 +753,13 @@ class GetUserStatsInteractor:
         self,
         user_repo: UserRepository,
         permission_validator: PermissionValidator,
+        repository_factory: UserStatsRepositoryFactory,
+        stats_cache: Optional[UserStatsCache] = None,
     ) -> None:
         self._user_repo = user_repo
         self._permission_validator = permission_validator
+        self._repository_factory = repository_factory
+        self._stats_cache = stats_cache
 
     async def __call__(
         self,
@@ -775,7 +791,14 @@ class GetUserStatsInteractor:
             if not is_self and not is_manager_or_admin:
                 raise PermissionError("Нет прав для просмотра статистики")
 
-        # 3. Собрать статистику
+        # 3. Собрать статистику (кэш проверяется после прав доступа)
+        stats = self._stats_cache.get(target.uuid) if self._stats_cache else None
+
+        if stats is None:
+            stats = await self._collect_stats(target.uuid)
+            if self._stats_cache:
+                self._stats_cache.set(target.uuid, stats)
+
         return {
             "user_uuid": str(target.uuid),
             "email": target.email,
@@ -785,19 +808,67 @@ class GetUserStatsInteractor:
             "is_verified": target.is_verified,
             "team_uuid": str(target.team_uuid) if target.team_uuid else None,
             "created_at": target.created_at.isoformat(),
-            # Заглушки для статистики
-            
-            #TODO добавить после реализации Task и Evaluation
+            **stats,
+        }
+
+    async def _collect_stats(self, user_uuid: UUID) -> Dict[str, Any]:
+        """
+        Собрать агрегаты задач, оценок и встреч параллельно.
+
+        Одна AsyncSession не выполняет запросы одновременно, поэтому каждый
+        агрегат идет в своей сессии (и своем соединении из пула): время
+        ответа - самый медленный запрос, а не сумма трех.
+        """
+        task_stats, evaluation_stats, meeting_stats = await asyncio.gather(
+            self._in_session(
+                lambda repos: repos.task_repo.get_task_stats(
+                    assignee_uuid=user_uuid,
+                )
+            ),
+            self._in_session(
+                lambda repos: repos.evaluation_rollup_repo.get_user_stats(
+                    user_uuid,
+                )
+            ),
+            self._in_session(
+                lambda repos: repos.meeting_repo.get_meeting_stats(
+                    user_uuid=user_uuid,
+                    days=30,
+                )
+            ),
+        )
+
+        average_score = evaluation_stats["average_score"]
+        last_evaluated_at = evaluation_stats["last_evaluated_at"]
+
+        return {
             "tasks_stats": {
-                "total_assigned": 0,
-                "completed": 0,
-                "in_progress": 0,
-                "overdue": 0,
+                "total_assigned": task_stats["total"],
+                "completed": task_stats["status_counts"][StatusEnum.DONE],
+                "in_progress": task_stats["status_counts"][StatusEnum.IN_PROGRESS],
+                "overdue": task_stats["overdue"],
             },
             "evaluation_stats": {
-                "average_score": 0.0,
-                "total_evaluations": 0,
-                "last_evaluation": None,
+                "average_score": round(average_score, 2) if average_score else 0.0,
+                "total_evaluations": evaluation_stats["total"],
+                "last_evaluation": (
+                    last_evaluated_at.isoformat() if last_evaluated_at else None
+                ),
+            },
+            "meetings_stats": {
+                "upcoming": meeting_stats["upcoming"],
+                # total_last_days включает и будущие встречи, а участие -
+                # только в уже прошедших за последние 30 дней
+                "total_participated": (
+                    meeting_stats["total_last_days"] - meeting_stats["upcoming"]
+                ),
             },
-            "meetings_stats": {"upcoming": 0, "total_participated": 0},
         }
+
+    async def _in_session(
+        self,
+        query: Callable[[UserStatsRepositories], Awaitable[T]],
+    ) -> T:
+        """Выполнить запрос в отдельной короткой сессии"""
+        async with self._repository_factory.open() as repos:
+            return await query(repos)
@@ -3,11 +3,17 @@ __all__ = (
     "PasswordHasher",
     "UserValidator",
     "UserActivationManager",
+    "UserStatsCache",
+    "UserStatsRepositories",
+    "UserStatsRepositoryFactory",
 )
 
 from .interfaces import (
     PasswordHasher,
     UserActivationManager,
     UserRepository,
+    UserStatsCache,
+    UserStatsRepositories,
+    UserStatsRepositoryFactory,
     UserValidator,
 )
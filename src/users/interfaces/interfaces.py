@@ -1,12 +1,18 @@
 from abc import abstractmethod
 from datetime import date
 from typing import (
+    Any,
+    AsyncContextManager,
+    Dict,
     List,
     Optional,
     Protocol,
 )
 from uuid import UUID
 
+from evaluations.interfaces import EvaluationRollupRepository
+from meetings.interfaces import MeetingRepository
+from tasks.interfaces import TaskRepository
 from users.models import (
     RoleEnum,
     User,
@@ -28,6 +34,10 @@ class UserRepository(Protocol):
         """Получить пользователя по email. Возвращает None если не найден"""
         ...
 
+    async def get_for_login(self, user_email: str) -> Optional[User]:
+        """Получить по email только данные, нужные для входа в систему"""
+        ...
+
     async def update_user(self, user: User) -> User:
         """Обновить данные существующего пользователя"""
         ...
@@ -97,12 +107,12 @@ class PasswordHasher(Protocol):
     """Интерфейс для работы с хешированием и проверкой паролей"""
 
     @abstractmethod
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """Захешировать пароль для безопасного хранения"""
         ...
 
     @abstractmethod
-    def verify_password_by_hash(
+    async def verify_password_by_hash(
         self,
         password: str,
         hashed_password: str,
@@ -225,3 +235,44 @@ class UserActivationManager(Protocol):
             new_password: новый пароль пользователя
         """
         ...
+
+
+class UserStatsCache(Protocol):
+    """Интерфейс для кэша агрегированной статистики пользователей"""
+
+    @abstractmethod
+    def get(self, user_uuid: UUID) -> Optional[Dict[str, Any]]:
+        """Получить статистику пользователя. Возвращает None если нет или истекла"""
+        ...
+
+    @abstractmethod
+    def set(self, user_uuid: UUID, stats: Dict[str, Any]) -> None:
+        """Сохранить статистику пользователя"""
+        ...
+
+    @abstractmethod
+    def invalidate(self, user_uuid: UUID) -> bool:
+        """Сбросить статистику пользователя. Возвращает True если запись была"""
+        ...
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, int]:
+        """Получить счетчики кэша (hits, misses, evictions, size)"""
+        ...
+
+
+class UserStatsRepositories(Protocol):
+    """Репозитории статистики пользователя, работающие в одной сессии"""
+
+    task_repo: TaskRepository
+    meeting_repo: MeetingRepository
+    evaluation_rollup_repo: EvaluationRollupRepository
+
+
+class UserStatsRepositoryFactory(Protocol):
+    """Интерфейс для получения репозиториев статистики с собственной сессией"""
+
+    @abstractmethod
+    def open(self) -> AsyncContextManager[UserStatsRepositories]:
+        """Открыть сессию; она закрывается при выходе из контекста"""
+        ...
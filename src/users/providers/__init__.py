@@ -1,9 +1,25 @@
 __all__ = (
     "BcryptPasswordHasherProvider",
+    "PasswordHashingPool",
+    "password_hashing_pool",
+    "TokenJanitorProvider",
     "UserActivationManagerProvider",
     "UserValidatorProvider",
+    "InMemoryUserStatsCacheProvider",
+    "user_stats_cache",
+    "invalidate_user_stats",
 )
 
 from .bcrypt_password_hasher_provider import BcryptPasswordHasherProvider
+from .password_hashing_pool import (
+    PasswordHashingPool,
+    password_hashing_pool,
+)
+from .token_janitor_provider import TokenJanitorProvider
 from .user_activation_manager_provider import UserActivationManagerProvider
+from .user_stats_cache_provider import (
+    InMemoryUserStatsCacheProvider,
+    invalidate_user_stats,
+    user_stats_cache,
+)
 from .user_validator_provider import UserValidatorProvider
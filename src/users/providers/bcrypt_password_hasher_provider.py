@@ -1,24 +1,53 @@
+from typing import Optional
+
 import bcrypt
 
 from core.config import settings
 from users.interfaces import PasswordHasher
+from users.providers.password_hashing_pool import (
+    PasswordHashingPool,
+    password_hashing_pool,
+)
 
 
 class BcryptPasswordHasherProvider(PasswordHasher):
-    """Имплементация PasswordHasher (используется bcrypt)"""
+    """
+    Имплементация PasswordHasher (используется bcrypt).
+
+    Вычисления bcrypt выполняются в пуле потоков, чтобы не блокировать
+    цикл событий на время хеширования (~250 мс при 12 раундах).
+    """
 
     def __init__(
         self,
         rounds: int = settings.bcrypt_settings.default_rounds_value,
+        pool: Optional[PasswordHashingPool] = None,
     ) -> None:
         """
         Args:
             rounds: Количество раундов хэширования (по умолчанию 12)
+            pool: Пул потоков для bcrypt (по умолчанию - глобальный)
         """
         self._rounds = rounds
+        self._pool = pool or password_hashing_pool
 
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """Захэшировать пароль с использованием bcrypt"""
+        return await self._pool.run(self._hash_password, password)
+
+    async def verify_password_by_hash(
+        self,
+        password: str,
+        hashed_password: str,
+    ) -> bool:
+        """Проверить соответствие пароля по хэшу"""
+        return await self._pool.run(
+            self._verify_password_by_hash,
+            password,
+            hashed_password,
+        )
+
+    def _hash_password(self, password: str) -> str:
         # Преоброзование пароля в bytes
         password_bytes = password.encode("utf-8")
 
@@ -29,12 +58,8 @@ class BcryptPasswordHasherProvider(PasswordHasher):
         # Возвращаем строку
         return hashed.decode("utf-8")
 
-    def verify_password_by_hash(
-        self,
-        password: str,
-        hashed_password: str,
-    ) -> bool:
-        """Проверить соответствие пароля по хэшу"""
+    @staticmethod
+    def _verify_password_by_hash(password: str, hashed_password: str) -> bool:
         try:
             # Преобразуем в bytes
             password_bytes = password.encode("utf-8")
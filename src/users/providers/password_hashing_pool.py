@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    TypeVar,
+)
+
+from core.config import settings
+
+T = TypeVar("T")
+
+
+class PasswordHashingPool:
+    """
+    Пул потоков для bcrypt с ограничением параллелизма.
+
+    bcrypt отпускает GIL на время вычисления, поэтому потоки хешируют
+    параллельно, а цикл событий не блокируется. Число потоков ограничивает
+    нагрузку на CPU: при всплеске логинов лишние задачи ждут в очереди,
+    ее глубина видна в get_stats().
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        """
+        Args:
+            max_workers: Максимум одновременных bcrypt-вычислений
+        """
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="bcrypt",
+        )
+        self._lock = threading.Lock()
+
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._max_queue_depth = 0
+        self._total_wait_seconds = 0.0
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Выполнить func(*args) в пуле, не блокируя цикл событий"""
+        submitted_at = time.perf_counter()
+
+        with self._lock:
+            self._pending += 1
+            queue_depth = self._pending - self._running
+            self._max_queue_depth = max(self._max_queue_depth, queue_depth)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._executor,
+                self._call,
+                submitted_at,
+                func,
+                *args,
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _call(self, submitted_at: float, func: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            self._running += 1
+            self._total_wait_seconds += time.perf_counter() - submitted_at
+
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Получить метрики пула"""
+        with self._lock:
+            return {
+                "max_workers": self._max_workers,
+                "running": self._running,
+                "queued": max(self._pending - self._running, 0),
+                "max_queue_depth": self._max_queue_depth,
+                "completed": self._completed,
+                "avg_wait_ms": (
+                    round(self._total_wait_seconds / self._completed * 1000, 3)
+                    if self._completed
+                    else 0.0
+                ),
+            }
+
+    def shutdown(self) -> None:
+        """Остановить пул (при завершении приложения)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Глобальный пул хеширования паролей
+password_hashing_pool = PasswordHashingPool(
+    max_workers=settings.bcrypt_settings.max_workers,
+)
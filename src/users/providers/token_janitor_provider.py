@@ -0,0 +1,184 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+
+from sqlalchemy import (
+    func,
+    select,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+)
+
+from core.providers.token_partition_provider import TokenPartitionManagerProvider
+from core.providers.token_provider import TokenRepositoryProvider
+from teams.crud import InviteCodeCRUD
+from users.interactors.auth_interactors import PurgeExpiredTokensInteractor
+
+logger = logging.getLogger(__name__)
+
+# Ключ advisory lock очистки: один проход на кластер, а не на каждый воркер
+JANITOR_LOCK_KEY = 7_310_112_001
+
+
+class TokenJanitorProvider:
+    """
+    Фоновая очистка таблиц токенов и кодов приглашения.
+
+    Раз в interval_seconds:
+    1. если usertokens секционирована - создает партиции на months_ahead
+       вперед и удаляет целиком партиции, где все токены истекли;
+    2. удаляет оставшиеся просроченные токены порциями
+       (PurgeExpiredTokensInteractor);
+    3. удаляет истекшие и деактивированные коды приглашения в команды.
+
+    Очистку запускает каждый воркер, но проход выполняет только тот, кто
+    получил advisory lock; остальные пропускают его до следующего интервала.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval_seconds: int = 600,
+        batch_size: int = 5000,
+        time_budget_seconds: float = 10.0,
+        partition_months_ahead: int = 2,
+    ) -> None:
+        self._session_factory = session_factory
+        self._interval = interval_seconds
+        self._batch_size = batch_size
+        self._time_budget = time_budget_seconds
+        self._months_ahead = partition_months_ahead
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Запустить фоновую задачу"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """Остановить фоновую задачу"""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def ensure_partitions(self) -> int:
+        """
+        Создать партиции usertokens на months_ahead месяцев вперед.
+
+        Вызывается при старте приложения, даже если фоновая очистка
+        выключена: партиции по умолчанию нет, и без заранее созданной
+        партиции вставка токена падает. Воркеры стартуют одновременно,
+        поэтому партиции создаются под блокировкой очистки (с ожиданием).
+        """
+        async with self._session_factory() as session:
+            await session.execute(
+                select(func.pg_advisory_xact_lock(JANITOR_LOCK_KEY))
+            )
+            partitions = TokenPartitionManagerProvider(session)
+
+            created = 0
+            if await partitions.is_partitioned():
+                created = await partitions.ensure_partitions(
+                    datetime.now(),
+                    self._months_ahead,
+                )
+            # Commit снимает блокировку
+            await session.commit()
+
+        return created
+
+    async def run_once(self) -> Dict[str, Any]:
+        """
+        Выполнить один проход очистки.
+
+        Блокировка pg_try_advisory_xact_lock берется в отдельной сессии и
+        держится до конца прохода: сама очистка фиксирует изменения
+        порциями, и транзакционная блокировка в ее сессии снялась бы на
+        первом commit. Если блокировку держит другой воркер, проход
+        пропускается (skipped=True).
+        """
+        async with self._session_factory() as lock_session:
+            acquired = await lock_session.scalar(
+                select(func.pg_try_advisory_xact_lock(JANITOR_LOCK_KEY))
+            )
+            if not acquired:
+                return {"skipped": True}
+
+            try:
+                return await self._run_locked()
+            finally:
+                # Конец транзакции освобождает блокировку
+                await lock_session.rollback()
+
+    async def _run_locked(self) -> Dict[str, Any]:
+        """Проход очистки под advisory lock"""
+        now = datetime.now()
+        stats: Dict[str, Any] = {
+            "skipped": False,
+            "partitions_created": 0,
+            "partitions_dropped": [],
+            "tokens_deleted": 0,
+            "invite_codes_deleted": 0,
+        }
+
+        async with self._session_factory() as session:
+            partitions = TokenPartitionManagerProvider(session)
+
+            try:
+                if await partitions.is_partitioned():
+                    stats["partitions_created"] = await partitions.ensure_partitions(
+                        now,
+                        self._months_ahead,
+                    )
+                    # Зафиксировать до DETACH CONCURRENTLY: он ждет завершения
+                    # транзакций, державших блокировки на usertokens
+                    await session.commit()
+                    stats["partitions_dropped"] = (
+                        await partitions.drop_expired_partitions(now)
+                    )
+                await session.commit()
+            except Exception:
+                # Построчная очистка ниже все равно выполняется
+                await session.rollback()
+                logger.exception("Token partition maintenance failed")
+
+            purge_interactor = PurgeExpiredTokensInteractor(
+                token_repo=TokenRepositoryProvider(session),
+                db_session=session,
+                batch_size=self._batch_size,
+                time_budget_seconds=self._time_budget,
+            )
+            stats["tokens_deleted"] = await purge_interactor()
+
+            stats["invite_codes_deleted"] = await InviteCodeCRUD(
+                session
+            ).delete_expired(now)
+            await session.commit()
+
+        return stats
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                stats = await self.run_once()
+                logger.info("Token janitor: %s", stats)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Ошибка прохода не должна останавливать очистку
+                logger.exception("Token janitor run failed")
+
+            await asyncio.sleep(self._interval)
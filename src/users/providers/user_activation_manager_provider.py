@@ -192,7 +192,7 @@ class UserActivationManagerProvider(UserActivationManager):
             return False
 
         # Устанавливаем новый пароль
-        new_hashed_password = self._password_hasher.hash_password(new_password)
+        new_hashed_password = await self._password_hasher.hash_password(new_password)
 
         user.password = new_hashed_password
         await self._user_repo.update_user(user)
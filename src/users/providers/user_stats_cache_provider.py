@@ -0,0 +1,102 @@
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+)
+from uuid import UUID
+
+from core.config import settings
+from users.interfaces import UserStatsCache
+
+
+class InMemoryUserStatsCacheProvider(UserStatsCache):
+    """
+    Имплементация UserStatsCache в памяти процесса (TTL + LRU).
+
+    Интеракторы задач, оценок и встреч сбрасывают статистику затронутых
+    пользователей после записи (invalidate_user_stats). Кэш локален для
+    воркера, поэтому на остальных воркерах устаревание ограничивает TTL.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 30,
+        max_entries: int = 4096,
+    ) -> None:
+        """
+        Args:
+            ttl_seconds: Время жизни записи в секундах
+            max_entries: Максимум записей, после - вытеснение самых старых (LRU)
+        """
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+
+        # user_uuid -> (expires_at, stats)
+        self._entries: OrderedDict[UUID, Tuple[float, Dict[str, Any]]] = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, user_uuid: UUID) -> Optional[Dict[str, Any]]:
+        """Получить статистику пользователя"""
+        entry = self._entries.get(user_uuid)
+
+        if entry is None or entry[0] <= time.monotonic():
+            self._entries.pop(user_uuid, None)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(user_uuid)
+        self._hits += 1
+        return entry[1]
+
+    def set(self, user_uuid: UUID, stats: Dict[str, Any]) -> None:
+        """Сохранить статистику пользователя"""
+        self._entries[user_uuid] = (time.monotonic() + self._ttl, stats)
+        self._entries.move_to_end(user_uuid)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, user_uuid: UUID) -> bool:
+        """Сбросить статистику пользователя"""
+        return self._entries.pop(user_uuid, None) is not None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Получить счетчики кэша"""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._entries),
+        }
+
+
+def invalidate_user_stats(
+    stats_cache: Optional[UserStatsCache],
+    *user_uuids: Optional[UUID],
+) -> None:
+    """
+    Сбросить статистику пользователей после записи, которая на нее влияет.
+
+    Сброс действует только в кэше текущего воркера: на остальных
+    статистика остается устаревшей не дольше TTL.
+    """
+    if stats_cache is None:
+        return
+
+    for user_uuid in set(user_uuids):
+        if user_uuid is not None:
+            stats_cache.invalidate(user_uuid)
+
+
+# Глобальный экземпляр кэша статистики пользователей
+user_stats_cache = InMemoryUserStatsCacheProvider(
+    ttl_seconds=settings.user_stats_cache.ttl_seconds,
+    max_entries=settings.user_stats_cache.max_entries,
+)
@@ -1,19 +1,25 @@
 from typing import (
     Any,
     Dict,
+    Optional,
 )
+from uuid import UUID
 
 from fastapi import (
     APIRouter,
     HTTPException,
     Request,
+    Response,
     status,
 )
 
+from core.config import settings
 from core.dependencies import (
+    CurrentDBUserDep,
     CurrentUserDep,
     PasswordHasherDep,
     SessionDep,
+    SessionReleasingRoute,
     TokenRepoDep,
     UserActivationDep,
     UserRepoDep,
@@ -24,11 +30,13 @@ from core.dependencies import (
 from core.models import TokenType
 from core.providers import (
     jwt_provider,
+    login_timings,
 )
 from users.interactors.auth_interactors import (
     AuthenticateUserInteractor,
     ChangePasswordInteractor,
     ConfirmPasswordResetInteractor,
+    PurgeExpiredTokensInteractor,
     RequestPasswordResetInteractor,
     VerifyEmailInteractor,
 )
@@ -36,6 +44,8 @@ from users.interactors.user_interactos import (
     CreateUserDTO,
     CreateUserInteractor,
 )
+from users.models import RoleEnum
+from users.providers import password_hashing_pool
 from users.schemas.user import (
     UserChangePassword,
     UserCreate,
@@ -44,7 +54,18 @@ from users.schemas.user import (
     UserTokenResponse,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
+
+
+def _authorization_claims(
+    team_uuid: Optional[UUID],
+    is_active: bool,
+) -> Dict[str, Any]:
+    """Claims для проверки прав без запроса в БД (stateless_access_tokens)"""
+    return {
+        "team": str(team_uuid) if team_uuid else None,
+        "active": is_active,
+    }
 
 
 @router.post(
@@ -98,13 +119,14 @@ async def register(
         tokens = jwt_provider.create_token_pair(
             user_uuid=user.uuid,
             user_role=user.role.value if user.role else "EMPLOYEE",
+            additional_claims=_authorization_claims(user.team_uuid, user.is_active),
         )
 
         # Сохраняем refresh токен в БД
         refresh_token_hash = jwt_provider.hash_refresh_token(tokens["refresh_token"])
         expires_at = jwt_provider.get_refresh_token_expires_at()
 
-        await token_repo.create_token(
+        await token_repo.add_token(
             user_uuid=user.uuid,
             token_hash=refresh_token_hash,
             token_type=TokenType.REFRESH,
@@ -150,44 +172,54 @@ async def login(
     auth_interactor = AuthenticateUserInteractor(
         user_repo=user_repo,
         password_hasher=password_hasher,
+        stage_timings=login_timings,
     )
 
     try:
-        user = await auth_interactor(
-            credentials.email,
-            credentials.password,
-        )
-
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Неверный email или пароль",
+        with login_timings.measure("total"):
+            user = await auth_interactor(
+                credentials.email,
+                credentials.password,
             )
 
-        # Генерируем токены
-        tokens = jwt_provider.create_token_pair(
-            user_uuid=user.uuid,
-            user_role=user.role.value if user.role else "EMPLOYEE",
-        )
-
-        # Сохраняем refresh токен
-        refresh_token_hash = jwt_provider.hash_refresh_token(tokens["refresh_token"])
-        expires_at = jwt_provider.get_refresh_token_expires_at()
-
-        # Получаем IP и User-Agent из запроса
-        client_ip = request.client.host if request.client else None
-        user_agent = request.headers.get("User-Agent")
-
-        await token_repo.create_token(
-            user_uuid=user.uuid,
-            token_hash=refresh_token_hash,
-            token_type=TokenType.REFRESH,
-            expires_at=expires_at,
-            ip_address=client_ip,
-            user_agent=user_agent,
-        )
-
-        await session.commit()
+            if not user:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Неверный email или пароль",
+                )
+
+            # Генерируем токены
+            with login_timings.measure("issue_tokens"):
+                tokens = jwt_provider.create_token_pair(
+                    user_uuid=user.uuid,
+                    user_role=user.role.value if user.role else "EMPLOYEE",
+                    additional_claims=_authorization_claims(
+                        user.team_uuid,
+                        user.is_active,
+                    ),
+                )
+
+            # Сохраняем refresh токен
+            refresh_token_hash = jwt_provider.hash_refresh_token(
+                tokens["refresh_token"]
+            )
+            expires_at = jwt_provider.get_refresh_token_expires_at()
+
+            # Получаем IP и User-Agent из запроса
+            client_ip = request.client.host if request.client else None
+            user_agent = request.headers.get("User-Agent")
+
+            # Один INSERT без повторного чтения созданной строки
+            with login_timings.measure("store_refresh_token"):
+                await token_repo.add_token(
+                    user_uuid=user.uuid,
+                    token_hash=refresh_token_hash,
+                    token_type=TokenType.REFRESH,
+                    expires_at=expires_at,
+                    ip_address=client_ip,
+                    user_agent=user_agent,
+                )
+                await session.commit()
 
         return UserTokenResponse(
             access_token=tokens["access_token"],
@@ -224,56 +256,40 @@ async def logout(
 async def refresh_token(
     refresh_token: str,
     session: SessionDep,
-    user_repo: UserRepoDep,
     token_repo: TokenRepoDep,
 ) -> Dict[str, Any]:
     """Обновление access токена с помощью refresh токена"""
 
-    # Хешируем переданный токен
     token_hash = jwt_provider.hash_refresh_token(refresh_token)
 
-    # Ищем токен в БД
-    token_record = await token_repo.get_token_by_hash(
-        token_hash,
-        TokenType.REFRESH,
-    )
+    # Новый refresh токен не зависит от пользователя: генерируем заранее,
+    # чтобы проверка, деактивация старого и вставка нового прошли одним запросом
+    new_refresh_token = jwt_provider.create_refresh_token()
 
-    if not token_record or not token_record.is_valid():
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Недействительный refresh токен",
-        )
+    owner = await token_repo.rotate_refresh_token_by_hash(
+        old_token_hash=token_hash,
+        new_token_hash=jwt_provider.hash_refresh_token(new_refresh_token),
+        new_expires_at=jwt_provider.get_refresh_token_expires_at(),
+    )
 
-    # Получаем пользователя
-    user = await user_repo.get_by_uuid(token_record.user_uuid)
-    if not user or not user.is_active:
+    if not owner:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Пользователь не найден или не активен",
+            detail="Недействительный refresh токен или пользователь не активен",
         )
 
-    # Генерируем новые токены
-    new_tokens = jwt_provider.create_token_pair(
-        user_uuid=user.uuid,
-        user_role=user.role.value if user.role else "EMPLOYEE",
-    )
-
-    # Обновляем refresh токен в БД
-    new_refresh_hash = jwt_provider.hash_refresh_token(new_tokens["refresh_token"])
-    new_expires_at = jwt_provider.get_refresh_token_expires_at()
+    await session.commit()
 
-    await token_repo.rotate_refresh_token(
-        old_token_hash=token_hash,
-        new_token_hash=new_refresh_hash,
-        new_expires_at=new_expires_at,
-        user_uuid=user.uuid,
+    role = owner["role"]
+    access_token = jwt_provider.create_access_token(
+        owner["user_uuid"],
+        role.value if role else "EMPLOYEE",
+        _authorization_claims(owner["team_uuid"], is_active=True),
     )
 
-    await session.commit()
-
     return {
-        "access_token": new_tokens["access_token"],
-        "refresh_token": new_tokens["refresh_token"],
+        "access_token": access_token,
+        "refresh_token": new_refresh_token,
         "token_type": "bearer",
     }
 
@@ -330,7 +346,7 @@ async def change_password(
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: CurrentUserDep) -> UserResponse:
+async def get_current_user_info(current_user: CurrentDBUserDep) -> UserResponse:
     """Получить информацию о текущем пользователе"""
     return UserResponse.model_validate(current_user)
 
@@ -408,7 +424,7 @@ async def confirm_password_reset(
     status_code=status.HTTP_202_ACCEPTED,
 )
 async def request_email_verification(
-    current_user: CurrentUserDep,
+    current_user: CurrentDBUserDep,
     session: SessionDep,
     activation_manager: UserActivationDep,
 ):
@@ -471,3 +487,96 @@ async def verify_email(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+
+
+@router.get(
+    "/token-cache/stats",
+    status_code=status.HTTP_200_OK,
+)
+async def get_token_cache_stats(
+    current_user: CurrentUserDep,
+) -> Dict[str, int]:
+    """Получить счетчики кэша проверенных токенов (только для администраторов)"""
+
+    if current_user.role != RoleEnum.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Нет прав для просмотра статистики кэша",
+        )
+
+    return jwt_provider.get_cache_stats()
+
+
+@router.get(
+    "/password-hasher/stats",
+    status_code=status.HTTP_200_OK,
+)
+async def get_password_hasher_stats(
+    current_user: CurrentUserDep,
+) -> Dict[str, Any]:
+    """Получить метрики пула хеширования паролей (только для администраторов)"""
+
+    if current_user.role != RoleEnum.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Нет прав для просмотра метрик",
+        )
+
+    return password_hashing_pool.get_stats()
+
+
+@router.post(
+    "/tokens/purge-expired",
+    status_code=status.HTTP_200_OK,
+)
+async def purge_expired_tokens(
+    current_user: CurrentUserDep,
+    session: SessionDep,
+    token_repo: TokenRepoDep,
+) -> Dict[str, int]:
+    """Удалить просроченные токены порциями (только для администраторов)"""
+
+    if current_user.role != RoleEnum.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Нет прав для очистки токенов",
+        )
+
+    purge_interactor = PurgeExpiredTokensInteractor(
+        token_repo=token_repo,
+        db_session=session,
+        batch_size=settings.token_cleanup.batch_size,
+        time_budget_seconds=settings.token_cleanup.time_budget_seconds,
+    )
+
+    deleted = await purge_interactor()
+    return {"deleted": deleted}
+
+
+@router.get(
+    "/login/timings",
+    status_code=status.HTTP_200_OK,
+)
+async def get_login_timings(
+    current_user: CurrentUserDep,
+) -> Dict[str, Dict[str, Any]]:
+    """Получить гистограммы этапов входа (только для администраторов)"""
+
+    if current_user.role != RoleEnum.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Нет прав для просмотра метрик",
+        )
+
+    return login_timings.get_stats()
+
+
+@router.get(
+    "/jwks.json",
+    status_code=status.HTTP_200_OK,
+)
+async def get_jwks(response: Response) -> Dict[str, Any]:
+    """Открытые ключи для локальной проверки access токенов (JWKS)"""
+    # Ключи меняются только при ротации: клиенты могут кэшировать ответ
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return jwt_provider.get_jwks()
@@ -13,12 +13,16 @@ from fastapi import (
     status,
 )
 
+from core.dependencies import SessionReleasingRoute
 from core.dependencies.depends import (
+    CurrentDBUserDep,
     CurrentUserDep,
     PasswordHasherDep,
     SessionDep,
     UserActivationDep,
     UserRepoDep,
+    UserStatsCacheDep,
+    UserStatsRepositoryFactoryDep,
     UserValidatorDep,
     UUIDGeneratorDep,
     TeamMembershipDep,
@@ -50,7 +54,7 @@ from users.schemas.user import (
     UserJoinTeam,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.post(
@@ -594,12 +598,16 @@ async def get_user_stats(
     current_user: CurrentUserDep,
     user_repo: UserRepoDep,
     permission_validator: PermissionValidatorDep,
+    repository_factory: UserStatsRepositoryFactoryDep,
+    stats_cache: UserStatsCacheDep,
 ) -> Dict[str, Any]:
     """Получить статистику пользователя"""
 
     interactor = GetUserStatsInteractor(
         user_repo=user_repo,
         permission_validator=permission_validator,
+        repository_factory=repository_factory,
+        stats_cache=stats_cache,
     )
 
     try:
@@ -625,7 +633,7 @@ async def get_user_stats(
 # TODO УДАЛИТЬ ЭТОТ ЭНДПОИНТ
 @router.post("/make-first-admin")
 async def make_admin(
-    current_user: CurrentUserDep,
+    current_user: CurrentDBUserDep,
     session: SessionDep,
     user_repo: UserRepoDep,
 ):